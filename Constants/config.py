@@ -1,6 +1,30 @@
 SCREEN_HEIGHT, SCREEN_WIDTH = 720, 1080 # Screen dimensions
 
-FPS = 60 # Game FPS
+FPS = 60 # Render frame rate (frames drawn per second)
+DIRTY_RECT_RENDERING = True # Only redraw and update the parts of the screen that changed each frame (instead of the whole screen)
+DIRTY_RECT_MAX_RECTS = 24 # Changed parts of the screen past which a frame is redrawn in full instead
+DIRTY_RECT_MAX_AREA = 0.5 # Fraction of the screen the changed parts can cover before a frame is redrawn in full instead
+
+# Simulation Timing
+TICK_RATE = 60 # Simulation tick rate (ticks per second at 1x game speed)
+MAX_CATCH_UP_TICKS = 5 # Max ticks simulated per frame (per 1x of game speed) before dropping time, so slow frames can't snowball
+GAME_SPEEDS = (1, 2, 4, None) # Fast-forward game speeds (None = uncapped, simulates as many ticks as fit in each frame)
+VECTORIZED_ENEMIES = False # Move enemies in batches with NumPy arrays (only used if NumPy is installed; only faster with very large waves)
+
+# Profiling
+PROFILER_OVERLAY_REFRESH = 30 # Frames between updates of the profiler overlay's numbers (so they stay readable)
+PROFILE_CSV_PATH = "profile.csv" # Where profiler measurements are exported as CSV
+PROFILE_TRACE_PATH = "profile_trace.json" # Where profiler measurements are exported as a Chrome trace
+
+# Assets
+SPRITE_ATLAS = "Assets/Sprites/atlas.json" # Index of the sheet the sprites are packed into (built by benchmarks/build_atlas.py), None loads each sprite from its own file
+
+# Replays
+SAVE_REPLAYS = False # Whether each game is recorded to a replay file when it is exited (also turned on by the environment variable TD_SAVE_REPLAYS=1)
+REPLAY_DIRECTORY = "replays" # Where replay files are saved
+
+# Logging
+LOG_CATEGORIES = ("placement", "game") # Log categories printed by default (combat, spawn, placement, path, game), overridden by the TD_LOG environment variable
 
 # Grid Sizes
 GRID_CELL_COUNT = 10 # Grid cell number
@@ -1,64 +1,302 @@
+import json
+import os
+import time
 import pygame
 from Constants import config
 
-# Map Sprites------------------------------------------------------------------------------------------------------------------------
-marsh_mallows_img = pygame.image.load("Assets/Maps/placeholder_map.jpeg")
-MARSH_MALLOWS_SPRITE = pygame.transform.scale(marsh_mallows_img, (config.GRID_SIZE, config.GRID_SIZE))
+class AssetRegistry:
+    """
+    Loads image assets the first time they are used, and keeps them (and scaled copies of them) for reuse.
 
-# Tower Sprites------------------------------------------------------------------------------------------------------------------------
-birdflamethrower_tower_sprite = pygame.image.load("Assets/Sprites/Towers/birdflamethrower_tower.png")
-BIRDFLAMETHROWER_TOWER_SPRITE = pygame.transform.scale(birdflamethrower_tower_sprite, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+    Nothing is read from disk until an asset is asked for, so importing the game's modules (e.g. for headless
+    simulations or tests) costs nothing, and each run only loads the assets it actually uses. Assets loaded once a
+    display exists are converted to its pixel format, so they draw quickly.
 
-bomb_tower_sprite = pygame.image.load("Assets/Sprites/Towers/bomb_tower.png")
-BOMB_TOWER_SPRITE = pygame.transform.scale(bomb_tower_sprite, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+    Sprites packed into an atlas (see use_atlas) are cut from its sheet instead, so one file is read for all of them.
+    """
 
-laser_tower_sprite = pygame.image.load("Assets/Sprites/Towers/laser_tower.png")
-LASER_TOWER_SPRITE = pygame.transform.scale(laser_tower_sprite, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+    def __init__(self):
+        """
+        Initializes an empty AssetRegistry.
+        """
+        self.assets = {}  # Maps each asset's name to (file path, size it is scaled to, whether it has transparency)
+        self.surfaces = {}  # Maps each loaded asset's name to its surface
+        self.scaled_surfaces = {}  # Maps (surface, width, height) to a scaled copy of the surface
+        self.load_times = {}  # Maps each loaded asset's name (or atlas sheet's path) to the time it took to load, in seconds
+        self.converted = set()  # Names of the loaded assets converted to the display's pixel format
 
-turret_tower_sprite = pygame.image.load("Assets/Sprites/Towers/turret_tower.png")
-TURRET_TOWER_SPRITE = pygame.transform.scale(turret_tower_sprite, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        self.atlas_image = None  # Path of the atlas sheet, if an atlas is used
+        self.atlas_frames = {}  # Maps (name, width, height) of each sprite in the atlas to its (x, y, width, height) in the sheet
+        self.atlas_sheet = None  # The atlas sheet, once loaded
 
-saw_tower_sprite = pygame.image.load("Assets/Sprites/Towers/saw_tower.png")
-SAW_TOWER_SPRITE = pygame.transform.scale(saw_tower_sprite, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+    def register(self, name, path, size, alpha=True):
+        """
+        Adds an asset to the registry, without loading it.
 
-# Enemy Sprites------------------------------------------------------------------------------------------------------------------------
-marshmallow = pygame.image.load("Assets/Sprites/Enemies/marshmallow.png")
-MARSHMALLOW_SPRITE = pygame.transform.scale(marshmallow, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        Args:
+            name (str): The asset's name (e.g. "TURRET_TOWER_SPRITE").
+            path (str): The image file to load.
+            size (tuple): The (width, height) the image is scaled to when it is loaded (None keeps its own size).
+            alpha (bool): Whether the image has transparency.
+        """
+        self.assets[name] = (path, size, alpha)
+
+    def get(self, name):
+        """
+        Gets an asset, loading it the first time it is asked for.
+
+        Args:
+            name (str): The asset's name.
+
+        Returns:
+            pygame.Surface: The asset. Shared, so it must not be drawn on.
+
+        Raises:
+            KeyError: If there is no asset with that name.
+        """
+        surface = self.surfaces.get(name)
+        if surface is None:
+            if self.atlas_sheet is None and self.in_atlas(name):
+                self.load_atlas()  # Cuts out every sprite in the sheet at once
+            surface = self.surfaces.get(name)
+            if surface is None:
+                surface = self.surfaces[name] = self.load(name)
+        return surface
+
+    def load(self, name):
+        """
+        Loads and scales an asset from its file, timing how long it takes.
+
+        Args:
+            name (str): The asset's name.
+
+        Returns:
+            pygame.Surface: The loaded asset.
+        """
+        path, size, alpha = self.assets[name]
+        start = time.perf_counter()
+        surface = pygame.image.load(path)
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format, so drawing the asset doesn't convert it every time
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.converted.add(name)
+        self.load_times[name] = time.perf_counter() - start
+        return surface
+
+    def use_atlas(self, index_path):
+        """
+        Reads an atlas's index, so the sprites packed into its sheet are cut from it instead of loaded one by one.
+
+        Only the index is read here - the sheet is loaded when one of its sprites is first used. Sprites whose size in
+        the atlas doesn't match their registered size (e.g. an atlas built before a size changed) are loaded from their
+        own files as before.
+
+        Args:
+            index_path (str): The atlas's JSON index (written by benchmarks/build_atlas.py).
+        """
+        with open(index_path) as file:
+            index = json.load(file)
+
+        self.atlas_image = os.path.join(os.path.dirname(index_path), index["image"])  # The sheet is next to its index
+        self.atlas_frames = {(frame["name"], frame["width"], frame["height"]): (frame["x"], frame["y"], frame["width"], frame["height"])
+                             for frame in index["frames"]}
+        self.atlas_sheet = None
+
+    def in_atlas(self, name):
+        """
+        Checks whether an asset is packed into the atlas at its registered size.
+
+        Args:
+            name (str): The asset's name.
+
+        Returns:
+            bool: True if the asset can be cut from the atlas sheet.
+
+        Raises:
+            KeyError: If there is no asset with that name.
+        """
+        size = self.assets[name][1]
+        return size is not None and (name, *size) in self.atlas_frames
+
+    def load_atlas(self):
+        """
+        Loads the atlas sheet, and cuts every sprite in it out as a subsurface.
+        """
+        start = time.perf_counter()
+        sheet = pygame.image.load(self.atlas_image)
+        converted = pygame.display.get_surface() is not None
+        if converted:
+            sheet = sheet.convert_alpha()  # Converting the sheet converts every sprite cut from it
+        self.cut_atlas(sheet, converted)
+        self.load_times[self.atlas_image] = time.perf_counter() - start
+
+    def cut_atlas(self, sheet, converted):
+        """
+        Cuts the sprites out of the atlas sheet.
+
+        Sprites at their registered size replace the assets, and those at other sizes are used as their scaled copies
+        (see get_scaled). Subsurfaces share the sheet's pixels, so nothing is copied.
 
-cracker = pygame.image.load("Assets/Sprites/Enemies/cracker.png")
-CRACKER_SPRITE = pygame.transform.scale(cracker, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        Args:
+            sheet (pygame.Surface): The atlas sheet.
+            converted (bool): Whether the sheet is in the display's pixel format.
+        """
+        self.atlas_sheet = sheet
+        for (name, width, height), rect in self.atlas_frames.items():
+            if name in self.assets and self.assets[name][1] == (width, height):
+                self.surfaces[name] = sheet.subsurface(rect)
+                if converted:
+                    self.converted.add(name)
+                else:
+                    self.converted.discard(name)
 
-broken_cracker = pygame.image.load("Assets/Sprites/Enemies/broken_cracker.png")
-BROKEN_CRACKER_SPRITE = pygame.transform.scale(broken_cracker, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        # Pre-scaled sizes, for sprites drawn at more than one size
+        for (name, width, height), rect in self.atlas_frames.items():
+            if name in self.assets and self.in_atlas(name) and self.assets[name][1] != (width, height):
+                self.scaled_surfaces[(self.surfaces[name], width, height)] = sheet.subsurface(rect)
 
-white_chocolate = pygame.image.load("Assets/Sprites/Enemies/white_chocolate.png")
-WHITE_CHOCOLATE_SPRITE = pygame.transform.scale(white_chocolate, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+    def convert_all(self):
+        """
+        Converts every asset loaded so far to the display's pixel format (call once the display has been created).
 
-melted_white_chocolate = pygame.image.load("Assets/Sprites/Enemies/melted_white_chocolate.png")
-MELTED_WHITE_CHOCOLATE_SPRITE = pygame.transform.scale(melted_white_chocolate, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        Blitting a surface in a different pixel format to the screen converts every pixel on every blit, so this is
+        done once instead. Assets loaded after the display exists are converted as they load.
 
-dark_chocolate = pygame.image.load("Assets/Sprites/Enemies/dark_chocolate.png")
-DARK_CHOCOLATE_SPRITE = pygame.transform.scale(dark_chocolate, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        Returns:
+            int: The number of assets converted.
+        """
+        unconverted = [name for name in self.surfaces if name not in self.converted]
+        if not unconverted:
+            return 0
+        self.scaled_surfaces.clear()  # Scaled from the old surfaces, so scale them again when next used
 
-melted_dark_chocolate = pygame.image.load("Assets/Sprites/Enemies/melted_dark_chocolate.png")
-MELTED_DARK_CHOCOLATE_SPRITE = pygame.transform.scale(melted_dark_chocolate, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        # Convert the atlas sheet as a whole and cut its sprites out again, so they still share one surface
+        if self.atlas_sheet is not None and any(self.surfaces[name].get_parent() is self.atlas_sheet for name in unconverted):
+            self.cut_atlas(self.atlas_sheet.convert_alpha(), converted=True)
 
-smore = pygame.image.load("Assets/Sprites/Enemies/smore.png")
-SMORE_SPRITE = pygame.transform.scale(smore, (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE))
+        for name in unconverted:
+            if name not in self.converted:
+                surface, alpha = self.surfaces[name], self.assets[name][2]
+                self.surfaces[name] = surface.convert_alpha() if alpha else surface.convert()
+                self.converted.add(name)
+        return len(unconverted)
 
+    def get_scaled(self, surface, width, height):
+        """
+        Gets a copy of a surface scaled to the given size, scaling it only the first time each size is asked for.
+
+        Args:
+            surface (pygame.Surface): The surface to scale.
+            width (int): The width to scale to.
+            height (int): The height to scale to.
+
+        Returns:
+            pygame.Surface: The scaled surface. Shared, so it must not be drawn on.
+        """
+        key = (surface, width, height)
+        scaled = self.scaled_surfaces.get(key)
+        if scaled is None:
+            if surface.get_size() == (width, height):
+                scaled = surface  # Already the right size
+            else:
+                scaled = pygame.transform.scale(surface, (width, height))
+            self.scaled_surfaces[key] = scaled
+        return scaled
+
+    def get_total_load_time(self):
+        """
+        Gets the total time spent loading assets.
+
+        Returns:
+            float: The time in seconds.
+        """
+        return sum(self.load_times.values())
+
+# The registry of every image the game uses
+assets = AssetRegistry()
+
+TILE_SIZE = (config.GRID_CELL_SIZE, config.GRID_CELL_SIZE)
+PROJECTILE_SIZE = (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3)
+
+# Map Sprites------------------------------------------------------------------------------------------------------------------------
+assets.register("MARSH_MALLOWS_SPRITE", "Assets/Maps/placeholder_map.jpeg", (config.GRID_SIZE, config.GRID_SIZE), alpha=False)
+
+# Tower Sprites------------------------------------------------------------------------------------------------------------------------
+assets.register("BIRDFLAMETHROWER_TOWER_SPRITE", "Assets/Sprites/Towers/birdflamethrower_tower.png", TILE_SIZE)
+assets.register("BOMB_TOWER_SPRITE", "Assets/Sprites/Towers/bomb_tower.png", TILE_SIZE)
+assets.register("LASER_TOWER_SPRITE", "Assets/Sprites/Towers/laser_tower.png", TILE_SIZE)
+assets.register("TURRET_TOWER_SPRITE", "Assets/Sprites/Towers/turret_tower.png", TILE_SIZE)
+assets.register("SAW_TOWER_SPRITE", "Assets/Sprites/Towers/saw_tower.png", TILE_SIZE)
+
+# Enemy Sprites------------------------------------------------------------------------------------------------------------------------
+assets.register("MARSHMALLOW_SPRITE", "Assets/Sprites/Enemies/marshmallow.png", TILE_SIZE)
+assets.register("CRACKER_SPRITE", "Assets/Sprites/Enemies/cracker.png", TILE_SIZE)
+assets.register("BROKEN_CRACKER_SPRITE", "Assets/Sprites/Enemies/broken_cracker.png", TILE_SIZE)
+assets.register("WHITE_CHOCOLATE_SPRITE", "Assets/Sprites/Enemies/white_chocolate.png", TILE_SIZE)
+assets.register("MELTED_WHITE_CHOCOLATE_SPRITE", "Assets/Sprites/Enemies/melted_white_chocolate.png", TILE_SIZE)
+assets.register("DARK_CHOCOLATE_SPRITE", "Assets/Sprites/Enemies/dark_chocolate.png", TILE_SIZE)
+assets.register("MELTED_DARK_CHOCOLATE_SPRITE", "Assets/Sprites/Enemies/melted_dark_chocolate.png", TILE_SIZE)
+assets.register("SMORE_SPRITE", "Assets/Sprites/Enemies/smore.png", TILE_SIZE)
 
 # Projectile Sprites------------------------------------------------------------------------------------------------------------------------
-bullet_img = pygame.image.load("Assets/Sprites/Projectiles/bullet.png")
-BULLET_SPRITE = pygame.transform.scale(bullet_img, (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3))
+assets.register("BULLET_SPRITE", "Assets/Sprites/Projectiles/bullet.png", PROJECTILE_SIZE)
+assets.register("FIREBALL_SPRITE", "Assets/Sprites/Projectiles/fireball.png", PROJECTILE_SIZE)
+assets.register("LASER_SPRITE", "Assets/Sprites/Projectiles/laser.png", PROJECTILE_SIZE)
+assets.register("SAW_SPRITE", "Assets/Sprites/Projectiles/saw.png", PROJECTILE_SIZE)
+assets.register("BOMB_SPRITE", "Assets/Sprites/Projectiles/bomb.png", PROJECTILE_SIZE)
+
+# Other sizes sprites are drawn at (see Entities/Projectiles), pre-scaled in the atlas so they're never scaled at runtime
+ATLAS_VARIANTS = {
+    "FIREBALL_SPRITE": (TILE_SIZE,),  # Flames are a full grid cell
+}
+
+# Cut sprites from the pre-built atlas sheet, if there is one (otherwise each is loaded from its own file)
+if config.SPRITE_ATLAS is not None and os.path.exists(config.SPRITE_ATLAS):
+    assets.use_atlas(config.SPRITE_ATLAS)
+
+def __getattr__(name):
+    """
+    Loads registered sprites when they are first used as module attributes (e.g. `sprites.TURRET_TOWER_SPRITE`).
+
+    Args:
+        name (str): The attribute's name.
+
+    Returns:
+        pygame.Surface: The sprite.
+
+    Raises:
+        AttributeError: If there is no sprite with that name.
+    """
+    if name in assets.assets:
+        return assets.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_sprite(name):
+    """
+    Gets a registered sprite by name, loading it the first time it is used.
+
+    Args:
+        name (str): The sprite's name (e.g. "MARSHMALLOW_SPRITE").
+
+    Returns:
+        pygame.Surface: The sprite. Shared, so it must not be drawn on.
+    """
+    return assets.get(name)
 
-fireball_img = pygame.image.load("Assets/Sprites/Projectiles/fireball.png")
-FIREBALL_SPRITE = pygame.transform.scale(fireball_img, (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3))
+def get_scaled_sprite(sprite, width, height):
+    """
+    Gets a copy of a sprite scaled to the given size, scaling it only the first time each size is asked for.
 
-laser_img = pygame.image.load("Assets/Sprites/Projectiles/laser.png")
-LASER_SPRITE = pygame.transform.scale(laser_img, (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3))
+    The returned surface is shared, so it must not be drawn on or modified.
 
-saw_img = pygame.image.load("Assets/Sprites/Projectiles/saw.png")
-SAW_SPRITE = pygame.transform.scale(saw_img, (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3))
+    Args:
+        sprite (pygame.Surface): The sprite to scale.
+        width (int): The width to scale to.
+        height (int): The height to scale to.
 
-bomb_img = pygame.image.load("Assets/Sprites/Projectiles/bomb.png")
-BOMB_SPRITE = pygame.transform.scale(bomb_img, (config.GRID_CELL_SIZE//3, config.GRID_CELL_SIZE//3))
\ No newline at end of file
+    Returns:
+        pygame.Surface: The scaled sprite.
+    """
+    return assets.get_scaled(sprite, width, height)
@@ -1,97 +1,156 @@
-from Constants import config
-import copy
+from Constants import config, sprites
 import pygame
 from abc import ABC
+from Game.Core import logger
 
 class Enemy(ABC):
     """
     The base class for all enemy types in the game.
     Inherited by specific enemy types to define movement, behavior, and damage handling.
+
+    When the EnemyManager uses an EnemyStore, the store moves the enemy along its path in a batch with every other
+    enemy, and writes its new position back to the enemy's own attributes once per tick.
+
+    Stats shared by every enemy of a type (sprites, reward, max health, ...) live in the subclass's enemy_type
+    (see Entities/Enemies/enemy_types.py), so each enemy only stores the state that changes while it is alive.
     """
 
-    def __init__(self, start_position, path, sprite=None, reward=5, health=10, speed=2):
+    __slots__ = ("store", "slot", "sprite", "damage", "active", "position", "prev_position", "grid_position", "hitbox",
+                 "centre_position", "prev_centre_position", "path", "distance", "_speed", "health", "armour")
+
+    enemy_type = None  # The EnemyType with the stats shared by every enemy of this type (set by each subclass)
+    width, height = config.GRID_CELL_SIZE, config.GRID_CELL_SIZE  # Size of every enemy
+
+    def __init__(self, path, distance=0):
         """
-        Initializes the enemy with its properties.
+        Initializes the enemy with its type's starting stats.
 
         Args:
-            start_position (tuple): Initial position (x, y) where the enemy is placed.
-            path (list): The path the enemy follows (list of grid coordinates).
-            sprite (pygame.Surface): The enemy's sprite.
-            reward (int): The reward points when the enemy is killed. Default is 5.
-            health (int): The total health of the enemy. Default is 10.
-            speed (int): The movement speed of the enemy. Default is 2.
-        """
-        self.sprite = sprite
-        self.reward = reward
-        self.max_health = health
-        self.damage = self.max_health // 2
-        self.speed = speed
-
-        # Grid size and position setup
-        self.width, self.height = config.GRID_CELL_SIZE, config.GRID_CELL_SIZE
-        self.start_position = copy.deepcopy(start_position)
-        self.position = copy.deepcopy(start_position)
-        self.prev_position = copy.deepcopy(start_position)
+            path (EnemyPath): The map's path the enemy follows (shared by all enemies, never modified).
+            distance (float): How far along the path the enemy starts, in pixels. Default is the start of the path.
+        """
+        enemy_type = self.enemy_type
+        self.store = None  # The EnemyStore moving this enemy, if any (set by the EnemyManager)
+        self.slot = None  # The enemy's row in its store
+
+        self.sprite = sprites.get_sprite(enemy_type.sprite_name)  # Changes when the enemy is broken or melted
+        self.damage = enemy_type.max_health // 2
+        self.speed = enemy_type.speed
+        self.armour = enemy_type.armour  # Flat damage reduction (used by armoured enemy types)
+
+        # Path setup - the enemy only tracks how far along the shared path it has travelled
+        self.path = path
+        self.distance = distance
+
+        # Position setup
+        self.position = self.prev_position = path.get_position(distance)
+        self.grid_position = path.get_grid_position(distance)
 
         # Set up hitbox for collision detection
         self.hitbox = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
-        self.grid_position = (copy.deepcopy(self.position[0] + self.width // 2) // config.GRID_CELL_SIZE,
-                              copy.deepcopy(self.position[1] + self.height // 2) // config.GRID_CELL_SIZE)
         self.centre_position = self.hitbox.center
-        self.prev_centre_position = copy.deepcopy(self.centre_position)
+        self.prev_centre_position = self.centre_position
 
-        self.health = self.max_health
+        self.health = enemy_type.max_health
         self.active = True
-        self.path = copy.deepcopy(path)
 
-    def move(self):
+    @property
+    def reward(self):
         """
-        Moves the enemy along its path.
+        The money given when the enemy is killed (the same for every enemy of its type).
         """
-        for _ in range(self.speed):
-            if not self.path:  # Prevent moving when there are no more path points
-                return
+        return self.enemy_type.reward
 
-            target_position = self.path[0]
-            x1, y1 = self.position
-            x2, y2 = target_position
+    @property
+    def max_health(self):
+        """
+        The enemy's starting health (the same for every enemy of its type).
+        """
+        return self.enemy_type.max_health
+
+    @property
+    def speed(self):
+        """
+        How far the enemy moves along its path each tick, in pixels.
+        """
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        self._speed = value
+        if self.store is not None:
+            self.store.speeds[self.slot] = value  # The store moves the enemy, so it needs the new speed
+
+    def move(self):
+        """
+        Moves the enemy along its path by its speed.
+        """
+        self.prev_position = self.position  # Remember where the enemy was last tick for interpolated drawing
+        if self.distance >= self.path.length:  # Prevent moving past the end of the path
+            return
 
-            # Move horizontally and vertically
-            if x1 < x2:
-                x1 += 1
-            elif x1 > x2:
-                x1 -= 1
+        # Advance along the path, then look up the new position
+        self.distance = min(self.distance + self.speed, self.path.length)
+        self.position = self.path.get_position(self.distance)
+        self.grid_position = self.path.get_grid_position(self.distance)
 
-            if y1 < y2:
-                y1 += 1
-            elif y1 > y2:
-                y1 -= 1
+        # Update hitbox
+        self.hitbox = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
+        self.centre_position = self.hitbox.center
+        self.prev_centre_position = self.centre_position
 
-            # Update position and hitbox
-            self.prev_position = copy.deepcopy(self.position)
-            self.position = (x1, y1)
-            self.centre_position = self.hitbox.center
-            self.prev_centre_position = copy.deepcopy(self.centre_position)
-            self.grid_position = ((x1 + self.width // 2) // config.GRID_CELL_SIZE,
-                                  ((y1 + self.height // 2) - config.SCREEN_TOPBAR_HEIGHT) // config.GRID_CELL_SIZE)
-            self.hitbox = pygame.Rect(self.position[0], self.position[1], config.GRID_CELL_SIZE, config.GRID_CELL_SIZE)
+    def get_progress(self):
+        """
+        Gets how far the enemy is along its path.
 
-            if self.position == target_position:
-                del self.path[0]  # Remove the reached path point
-                break
+        Returns:
+            float: 0 at the start of the path, up to 1 at the exit.
+        """
+        return self.path.get_progress(self.distance)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1):
         """
         Draws the enemy on the screen.
 
         Args:
             screen (pygame.Surface): The screen to draw the enemy on.
+            alpha (float): How far between its previous and current tick positions to draw the enemy (0 to 1).
         """
         try:
-            screen.blit(self.sprite, (self.position))
+            screen.blit(self.sprite, self.get_draw_position(alpha))
         except TypeError:
             print("No Sprite Detected, cannot draw enemy")
 
+    def get_draw_position(self, alpha=1):
+        """
+        Gets the screen position the enemy is drawn at.
+
+        Args:
+            alpha (float): How far between its previous and current tick positions the enemy is drawn (0 to 1).
+
+        Returns:
+            tuple: The (x, y) screen position of the enemy's top left corner.
+        """
+        # Interpolate between the last two tick positions so movement looks smooth at any frame rate
+        x = self.prev_position[0] + (self.position[0] - self.prev_position[0]) * alpha
+        y = self.prev_position[1] + (self.position[1] - self.prev_position[1]) * alpha
+        return (x, y)
+
+    def get_draw_rect(self, alpha=1):
+        """
+        Gets the area of the screen the enemy covers when drawn (used for dirty rectangle rendering).
+
+        Args:
+            alpha (float): How far between its previous and current tick positions the enemy is drawn (0 to 1).
+
+        Returns:
+            pygame.Rect: The covered area (padded by a pixel to allow for rounding), or None if the enemy has no sprite.
+        """
+        if self.sprite is None:
+            return None
+        x, y = self.get_draw_position(alpha)
+        return self.sprite.get_rect(topleft=(int(x), int(y))).inflate(2, 2)
+
     def take_damage(self, damage, **kwargs):
         """
         Handles damage taken by the enemy.
@@ -100,14 +159,16 @@ class Enemy(ABC):
             damage (int): The amount of damage taken by the enemy.
             **kwargs: Additional parameters for special damage types.
         """
-        print(f"Enemy taken {damage} damage")
+        if logger.combat.enabled:
+            logger.combat("Enemy taken %s damage", damage)
         self.health -= damage
 
         # Adjust damage dynamically based on remaining health]
         if not self.check_is_dead():
             self.update_damage()
 
-        print(f"Enemy {self} has {self.health} health left")
+        if logger.combat.enabled:
+            logger.combat("Enemy %s has %s health left", self, self.health)
 
     def update_damage(self):
         """Updates the enemy's damage based on its remaining health."""
@@ -119,17 +180,19 @@ class Enemy(ABC):
         """
         game_state.money += self.reward
         self.remove_self(game_state)
-        print(f"Enemy has died")
+        logger.combat("Enemy has died")
 
     def remove_self(self, game_state):
         game_state.enemy_manager.enemies.remove(self)
+        if self.store is not None:
+            self.store.remove(self)
         self.active = False
 
     def attack(self, game_state):
         """Applies damage to the game state when the enemy reaches the end."""
         game_state.health -= self.damage
         self.remove_self(game_state)
-        print(f"Enemy has reached end")
+        logger.combat("Enemy has reached end")
 
     def check_is_dead(self):
         """Checks if the enemy is dead based on its health."""
@@ -137,16 +200,17 @@ class Enemy(ABC):
 
     def check_has_reached_end(self):
         """Checks if the enemy has reached the end of the path."""
-        return len(self.path) == 0
+        return self.distance >= self.path.length
 
     def update(self, game_state):
         """
         Updates the enemy state (movement, health checks, etc.).
         """
         if self.active:
-            self.move()
-            if self.check_has_reached_end():
-                self.attack(game_state)
-
+            if self.store is None:  # Stored enemies are moved all at once by the EnemyManager
+                self.move()
+            # An enemy killed on the tick it reaches the end counts as killed (it must only be removed once)
             if self.check_is_dead():
                 self.die(game_state)
+            elif self.check_has_reached_end():
+                self.attack(game_state)
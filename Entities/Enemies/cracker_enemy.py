@@ -1,5 +1,7 @@
 from Entities.Enemies.base_enemy import Enemy
+from Entities.Enemies.enemy_types import ENEMY_TYPES
 from Constants import sprites
+from Game.Core import logger
 
 class Cracker(Enemy):
     """
@@ -10,29 +12,28 @@ class Cracker(Enemy):
     it moves faster. Additionally, it is immune to fire damage.
     """
 
-    def __init__(self, start_position, path):
+    __slots__ = ("broken",)
+    enemy_type = ENEMY_TYPES["cracker enemy"]  # Starts with armour
+
+    def __init__(self, path, distance=0):
         """
         Initializes a Cracker enemy with specific attributes.
         
         Args:
-            start_position (tuple): The (x, y) starting position of the enemy.
-            path (list): A list of grid coordinates representing the enemy's path.
+            path (EnemyPath): The map's path the enemy follows.
+            distance (float): How far along the path the enemy starts, in pixels.
         """
-        super().__init__(start_position, path, reward=12, health=50, speed=1, sprite=sprites.CRACKER_SPRITE)
-        
-        # Unimplemented sprite for when the Cracker "breaks":
-        self.broken_sprite = sprites.BROKEN_CRACKER_SPRITE  
+        super().__init__(path, distance)
         self.broken = False  # Indicates whether the Cracker is broken or not
-        self.armour = 6  # Initial armor value
 
     def become_broken(self):
         """
         When the Cracker's health drops below 20%, it moves faster.
         It also "breaks" visually and loses its armor.
         """
-        self.speed = 2  # Increase speed after breaking
+        self.speed = self.enemy_type.damaged_speed  # Increase speed after breaking
         self.broken = True  # Mark the Cracker as broken
-        self.sprite = self.broken_sprite  # Change sprite to broken one
+        self.sprite = sprites.get_sprite(self.enemy_type.damaged_sprite_name)  # Change sprite to broken one
         self.armour = 0  # Remove armor after breaking
 
     def take_damage(self, damage, **kwargs):
@@ -48,7 +49,8 @@ class Cracker(Enemy):
         - Bomb damage triggers the "break" mechanic if Cracker isn't already broken.
         - If health drops below 50%, Cracker will "break" and gain speed.
         """
-        print(f"OG cracker damage is: {damage}")
+        if logger.combat.enabled:
+            logger.combat("OG cracker damage is: %s", damage)
         
         # Armor reduces incoming damage (armor is halved before applying)
         damage -= self.armour // 2
@@ -72,7 +74,8 @@ class Cracker(Enemy):
         if self.health <= self.max_health // 2 and not self.broken:
             self.become_broken()
 
-        print(f"cracker enemy damage taken is: {damage}")
+        if logger.combat.enabled:
+            logger.combat("cracker enemy damage taken is: %s", damage)
         
         # Apply the modified damage amount using the parent class method
         super().take_damage(damage)
@@ -1,4 +1,5 @@
 from Entities.Enemies.base_enemy import Enemy
+from Entities.Enemies.enemy_types import ENEMY_TYPES
 from Constants import sprites
 
 class DarkChocolate(Enemy):
@@ -9,20 +10,8 @@ class DarkChocolate(Enemy):
     However, it is vulnerable to fire, which removes its armor and slows it down.
     """
 
-    def __init__(self, start_position, path):
-        """
-        Initializes a Dark Chocolate enemy with specific attributes.
-        
-        Args:
-            start_position (tuple): The (x, y) starting position of the enemy.
-            path (list): A list of grid coordinates representing the enemy's path.
-        """
-        super().__init__(start_position, path, reward=18, health=50, speed=3, sprite=sprites.DARK_CHOCOLATE_SPRITE)
-        
-        self.melted_sprite = sprites.MELTED_DARK_CHOCOLATE_SPRITE  # Sprite when melted
-
-        # Armor reduces incoming damage (damage is divided by armor value)
-        self.armour = 3  # Initial armor value
+    __slots__ = ()
+    enemy_type = ENEMY_TYPES["dark_chocolate enemy"]  # Starts with armour, which reduces incoming damage
 
     def take_damage(self, damage, **kwargs):
         """
@@ -59,7 +48,7 @@ class DarkChocolate(Enemy):
         - It loses all armor, making it vulnerable to future attacks.
         - (Optional) Sprite changes to a melted appearance.
         """
-        self.speed = 2  # Reduce speed after melting
+        self.speed = self.enemy_type.damaged_speed  # Reduce speed after melting
         self.armour = 0  # Remove armor protection
 
-        self.sprite = self.melted_sprite  # Change to melted appearance
+        self.sprite = sprites.get_sprite(self.enemy_type.damaged_sprite_name)  # Change to melted appearance
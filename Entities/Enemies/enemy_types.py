@@ -0,0 +1,29 @@
+from collections import namedtuple
+from types import MappingProxyType
+
+# The stats shared by every enemy of a type. Immutable, so one copy serves every enemy of that type, and each enemy only
+# stores the state that changes while it is alive (see Enemy.__slots__).
+EnemyType = namedtuple("EnemyType", (
+    "name",  # The enemy's name in GAME_DATA (e.g. "cracker enemy")
+    "sprite_name",  # Name of the starting sprite (see Constants/sprites.py)
+    "damaged_sprite_name",  # Name of the sprite once broken or melted (None if the enemy never changes)
+    "reward",  # Money given when the enemy is killed
+    "max_health",  # Starting health
+    "speed",  # Starting speed, in pixels per tick
+    "damaged_speed",  # Speed once broken or melted
+    "armour",  # Starting flat damage reduction
+))
+
+# Every enemy type, by name
+ENEMY_TYPES = MappingProxyType({enemy_type.name: enemy_type for enemy_type in (
+    EnemyType("marshmallow enemy", "MARSHMALLOW_SPRITE", None,
+              reward=6, max_health=20, speed=2, damaged_speed=2, armour=0),
+    EnemyType("cracker enemy", "CRACKER_SPRITE", "BROKEN_CRACKER_SPRITE",
+              reward=12, max_health=50, speed=1, damaged_speed=2, armour=6),
+    EnemyType("white_chocolate enemy", "WHITE_CHOCOLATE_SPRITE", "MELTED_WHITE_CHOCOLATE_SPRITE",
+              reward=20, max_health=40, speed=5, damaged_speed=2, armour=0),
+    EnemyType("dark_chocolate enemy", "DARK_CHOCOLATE_SPRITE", "MELTED_DARK_CHOCOLATE_SPRITE",
+              reward=18, max_health=50, speed=3, damaged_speed=2, armour=3),
+    EnemyType("smore enemy", "SMORE_SPRITE", None,
+              reward=35, max_health=200, speed=1, damaged_speed=1, armour=0),
+)})
@@ -1,5 +1,5 @@
 from Entities.Enemies.base_enemy import Enemy
-from Constants import sprites
+from Entities.Enemies.enemy_types import ENEMY_TYPES
 
 class Smore(Enemy):
     """
@@ -9,16 +9,8 @@ class Smore(Enemy):
     They are relatively slow and have a unique mechanic when they die (splitting into multiple enemies).
     """
 
-    def __init__(self, start_position, path):
-        """
-        Initializes a Smore enemy with specific attributes.
-        
-        Args:
-            start_position (tuple): The (x, y) starting position of the enemy.
-            path (list): A list of grid coordinates representing the enemy's path.
-        """
-        # Calls the parent class constructor to set common enemy attributes
-        super().__init__(start_position, path, reward=35, health=200, speed=1, sprite=sprites.SMORE_SPRITE)
+    __slots__ = ()
+    enemy_type = ENEMY_TYPES["smore enemy"]
 
     def die(self, game_state):
         """
@@ -33,7 +25,7 @@ class Smore(Enemy):
         super().die(game_state)
         
         # Spawn multiple smaller enemies upon death
-        game_state.enemy_manager.create_enemy("cracker enemy", Start_Position=self.position, Path=self.path)
-        game_state.enemy_manager.create_enemy("marshmallow enemy", Start_Position=self.position, Path=self.path)
-        game_state.enemy_manager.create_enemy("dark_chocolate enemy", Start_Position=self.position, Path=self.path)
-        game_state.enemy_manager.create_enemy("cracker enemy", Start_Position=self.position, Path=self.path)
+        game_state.enemy_manager.create_enemy("cracker enemy", Path=self.path, Distance=self.distance)
+        game_state.enemy_manager.create_enemy("marshmallow enemy", Path=self.path, Distance=self.distance)
+        game_state.enemy_manager.create_enemy("dark_chocolate enemy", Path=self.path, Distance=self.distance)
+        game_state.enemy_manager.create_enemy("cracker enemy", Path=self.path, Distance=self.distance)
@@ -1,4 +1,5 @@
 from Entities.Enemies.base_enemy import Enemy
+from Entities.Enemies.enemy_types import ENEMY_TYPES
 from Constants import sprites
 
 class WhiteChocolate(Enemy):
@@ -9,19 +10,8 @@ class WhiteChocolate(Enemy):
     When exposed to fire damage, it melts, losing its speed and changing its appearance.
     """
 
-    def __init__(self, start_position, path):
-        """
-        Initializes a White Chocolate enemy with specific attributes.
-        
-        Args:
-            start_position (tuple): The (x, y) starting position of the enemy.
-            path (list): A list of grid coordinates representing the enemy's path.
-        """
-        # Calls the parent class constructor to set common enemy attributes
-        super().__init__(start_position, path, reward=20, health=40, speed=5, sprite=sprites.WHITE_CHOCOLATE_SPRITE)
-
-        # White Chocolate’s appearance after melting
-        self.melted_sprite = sprites.MELTED_WHITE_CHOCOLATE_SPRITE  
+    __slots__ = ()
+    enemy_type = ENEMY_TYPES["white_chocolate enemy"]
 
     def take_damage(self, damage, **kwargs):
         """
@@ -50,7 +40,7 @@ class WhiteChocolate(Enemy):
         - Its speed is reduced.
         - Its sprite changes to a melted appearance.
         """
-        self.speed = 2  # Reduce speed after melting
+        self.speed = self.enemy_type.damaged_speed  # Reduce speed after melting
         
         # Change to melted sprite
-        self.sprite = self.melted_sprite
+        self.sprite = sprites.get_sprite(self.enemy_type.damaged_sprite_name)
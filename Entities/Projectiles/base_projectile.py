@@ -6,11 +6,24 @@ class Projectile():
     """
     The Projectile class represents a bullet fired by a tower.
     Handles the bullet's movement, rendering, and interaction with targets.
+
+    Projectiles are recycled by the BulletManager: when one is fired again, reset is called
+    instead of creating a new object, so the fixed set of attributes is kept in __slots__.
     """
-    
-    def __init__(self, x_pos, y_pos, target, speed=5, damage=1, bullet_type="Default", width=config.GRID_CELL_SIZE//3, height=config.GRID_CELL_SIZE//3, bullet_sprite=sprites.BULLET_SPRITE):
+
+    __slots__ = ("target", "speed", "damage", "type", "x_pos", "y_pos", "prev_x_pos", "prev_y_pos", "active",
+                 "width", "height", "target_x", "target_y", "vx", "vy", "sprite", "hitbox")
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates the projectile and sets it up using reset (see reset for the arguments).
+        """
+        self.hitbox = pygame.Rect(0, 0, 0, 0)  # Updated in place, so a recycled projectile keeps the same Rect
+        self.reset(*args, **kwargs)
+
+    def reset(self, x_pos, y_pos, target, speed=5, damage=1, bullet_type="Default", width=config.GRID_CELL_SIZE//3, height=config.GRID_CELL_SIZE//3, bullet_sprite=None):
         """
-        Initializes the bullet with its properties.
+        Sets up the bullet with its properties (when it is first created, or fired again after being recycled).
 
         Args:
             x_pos (int): The initial x-position of the bullet.
@@ -30,6 +43,7 @@ class Projectile():
 
         self.x_pos = x_pos  # Initial x-position of the bullet
         self.y_pos = y_pos  # Initial y-position of the bullet
+        self.prev_x_pos, self.prev_y_pos = x_pos, y_pos  # Position on the previous tick, used for interpolated drawing
 
         self.active = True  # Tracks whether the bullet is still active. If False, the bullet is removed.
 
@@ -42,8 +56,16 @@ class Projectile():
         self.vx, self.vy = self.get_bullet_velocity()
 
         # Scale sprite to bullet size and initialize hitbox for collision detection
-        self.sprite = pygame.transform.scale(bullet_sprite, (self.width, self.height))
-        self.hitbox = pygame.Rect(self.x_pos - self.width // 2, self.y_pos - self.height // 2, self.width, self.height)
+        if bullet_sprite is None:
+            bullet_sprite = sprites.BULLET_SPRITE
+        self.sprite = sprites.get_scaled_sprite(bullet_sprite, self.width, self.height)  # Shared between bullets, scaled once per size
+        self.hitbox.update(self.x_pos - self.width // 2, self.y_pos - self.height // 2, self.width, self.height)
+
+    def release(self):
+        """
+        Drops the projectile's references to enemies when it is recycled, so they can be freed.
+        """
+        self.target = None
 
     def get_bullet_velocity(self):
         """
@@ -76,6 +98,8 @@ class Projectile():
         # Estimate enemy velocity
         enemy_vx = enemy_x - prev_enemy_x  # Change in x
         enemy_vy = enemy_y - prev_enemy_y  # Change in y
+        if enemy_vx == 0 and enemy_vy == 0:
+            return enemy_x, enemy_y  # A stationary enemy needs no correction
 
         # Distance to current enemy position
         distance = math.sqrt((enemy_x - self.x_pos) ** 2 + (enemy_y - self.y_pos) ** 2)
@@ -101,49 +125,80 @@ class Projectile():
 
         return predicted_x, predicted_y
 
-    def update(self, enemies):
+    def update(self, enemy_grid):
         """
         Update the projectile's movement and check for collisions with enemies.
 
         Args:
-            enemies (list): The list of enemies that the bullet may collide with.
+            enemy_grid (SpatialHash): The enemies bucketed by grid cell.
         """
         self.move()  # Move the bullet based on velocity
-        self.check_collisions(enemies)  # Check if the bullet collides with any enemies
+        self.check_collisions(enemy_grid)  # Check if the bullet collides with any enemies
+        self.check_out_of_bounds()  # Deactivate bullets that missed, so they can be recycled
 
     def move(self):
         """
         Move the projectile based on its velocity.
         """
+        self.prev_x_pos, self.prev_y_pos = self.x_pos, self.y_pos
         self.x_pos += self.vx
         self.y_pos += self.vy
         # Update the hitbox to reflect the new position
-        self.hitbox = pygame.Rect(self.x_pos - self.width // 2, self.y_pos - self.height // 2, self.width, self.height)
+        self.hitbox.update(self.x_pos - self.width // 2, self.y_pos - self.height // 2, self.width, self.height)
 
-    def check_collisions(self, enemies):
+    def check_collisions(self, enemy_grid):
         """
         Check if the bullet collides with any enemies and apply damage.
 
         Args:
-            enemies (list): The list of enemies that the bullet may collide with.
+            enemy_grid (SpatialHash): The enemies bucketed by grid cell. Only enemies in the cells the bullet overlaps are checked.
         """
-        for enemy in enemies:
+        for enemy in enemy_grid.query(self.hitbox):
             if pygame.Rect.colliderect(self.hitbox, enemy.hitbox):  # Check collision
                 enemy.take_damage(self.damage, damage_type=self.type)  # Apply damage to the enemy
                 self.active = False  # Deactivate the bullet after it hits the enemy
     
     def check_out_of_bounds(self):
         """
-        Check if the bullet has gone out of the screen bounds and deactivate it if true.
+        Check if the bullet has gone off the map and deactivate it if true.
         """
-        if self.x_pos > config.SCREEN_SIDEBAR_WIDTH or self.x_pos < 0 or self.y_pos > config.SCREEN_HEIGHT or self.y_pos < 0:
+        if self.x_pos > config.GRID_SIZE or self.x_pos < 0 or self.y_pos > config.SCREEN_HEIGHT or self.y_pos < 0:
             self.active = False
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1):
         """
         Render the bullet on the screen.
 
         Args:
             screen (pygame.Surface): The Pygame screen where the bullet will be drawn.
+            alpha (float): How far between its previous and current tick positions to draw the bullet (0 to 1).
+        """
+        screen.blit(self.sprite, self.get_draw_position(alpha))
+
+    def get_draw_position(self, alpha=1):
+        """
+        Get the screen position the bullet is drawn at.
+
+        Args:
+            alpha (float): How far between its previous and current tick positions the bullet is drawn (0 to 1).
+
+        Returns:
+            tuple: The (x, y) screen position of the bullet sprite's top left corner.
+        """
+        # Interpolate between the last two tick positions so movement looks smooth at any frame rate
+        x = self.prev_x_pos + (self.x_pos - self.prev_x_pos) * alpha
+        y = self.prev_y_pos + (self.y_pos - self.prev_y_pos) * alpha
+        return (x - self.width // 2, y - self.height // 2)
+
+    def get_draw_rect(self, alpha=1):
+        """
+        Get the area of the screen the bullet covers when drawn (used for dirty rectangle rendering).
+
+        Args:
+            alpha (float): How far between its previous and current tick positions the bullet is drawn (0 to 1).
+
+        Returns:
+            pygame.Rect: The covered area, padded by a pixel to allow for rounding.
         """
-        screen.blit(self.sprite, (self.x_pos - self.width // 2, self.y_pos - self.height // 2))
+        x, y = self.get_draw_position(alpha)
+        return self.sprite.get_rect(topleft=(int(x), int(y))).inflate(2, 2)
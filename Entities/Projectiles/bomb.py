@@ -7,9 +7,11 @@ class Bomb(Projectile):
     The Bomb class represents a bomb projectile that deals area-of-effect damage when it collides with an enemy.
     It inherits from the base Projectile class and adds functionality for splash damage.
     """
-    def __init__(self, x_pos, y_pos, target, bullet_speed, bullet_damage, tile_splash_radius):
+    __slots__ = ("tile_splash_radius",)
+
+    def reset(self, x_pos, y_pos, target, bullet_speed, bullet_damage, tile_splash_radius):
         """
-        Initializes a Bomb projectile with specific attributes.
+        Sets up a Bomb projectile with specific attributes.
 
         Args:
             x_pos: The x-position of the bomb on the screen.
@@ -19,25 +21,31 @@ class Bomb(Projectile):
             bullet_damage: The amount of damage the bomb deals to enemies.
             tile_splash_radius: The radius of splash damage applied to nearby enemies.
         """
-        super().__init__(x_pos, y_pos, target, bullet_speed, bullet_damage, bullet_sprite=sprites.BOMB_SPRITE)
+        super().reset(x_pos, y_pos, target, bullet_speed, bullet_damage, bullet_sprite=sprites.BOMB_SPRITE)
         self.type = "Bomb"  # Define the type of projectile
         self.tile_splash_radius = tile_splash_radius  # Set the splash radius for area damage
 
-    def check_collisions(self, enemies):
+    def check_collisions(self, enemy_grid):
         """
         Checks for collisions with enemies and applies damage.
 
         Args:
-            enemies: A list of enemies that might be affected by the bomb's explosion.
+            enemy_grid: The enemies bucketed by grid cell (SpatialHash), used to find enemies near the bomb and its explosion.
         """
-        for initial_enemy in enemies:
+        for initial_enemy in enemy_grid.query(self.hitbox):
             if pygame.Rect.colliderect(self.hitbox, initial_enemy.hitbox):  # Check for a direct collision with the initial enemy
                 initial_enemy.take_damage(self.damage, damage_type=self.type)  # Apply full damage to the initial enemy
 
+                splash_radius = self.tile_splash_radius * config.GRID_CELL_SIZE  # Convert splash radius to pixels
+                # The splash reaches enemies in line with the bomb on either axis - a full height column and a full width
+                # row through the explosion, which between them contain every enemy within the radius on x or on y
+                splash_width = 2 * splash_radius + config.GRID_CELL_SIZE
+                splash_column = pygame.Rect(self.x_pos - splash_radius, 0, splash_width, config.SCREEN_HEIGHT)
+                splash_row = pygame.Rect(0, self.y_pos - splash_radius, config.SCREEN_WIDTH, splash_width)
+
                 # Apply splash damage to nearby enemies within the radius
-                for enemy in enemies:
+                for enemy in enemy_grid.query(splash_column, splash_row):
                     if enemy != initial_enemy:  # Ensure it's not the same enemy
-                        splash_radius = self.tile_splash_radius * config.GRID_CELL_SIZE  # Convert splash radius to pixels
                         # Check if the enemy is within the splash radius
                         if abs(self.x_pos - enemy.position[0]) <= splash_radius or abs(self.y_pos - enemy.position[1]) <= splash_radius:
                             enemy.take_damage(self.damage // 2, damage_type=self.type)  # Apply half damage to enemies within the splash range
@@ -5,9 +5,11 @@ class Bullet(Projectile):
     The Bullet class represents a standard projectile fired by a tower. It inherits from the base Projectile class
     and handles the basic mechanics of bullet movement and collision detection.
     """
-    def __init__(self, x_pos, y_pos, target, bullet_speed, bullet_damage):
+    __slots__ = ()
+
+    def reset(self, x_pos, y_pos, target, bullet_speed, bullet_damage):
         """
-        Initializes a Bullet projectile with specific attributes.
+        Sets up a Bullet projectile with specific attributes.
 
         Args:
             x_pos: The x-position of the bullet on the screen.
@@ -16,4 +18,4 @@ class Bullet(Projectile):
             bullet_speed: The speed at which the bullet travels.
             bullet_damage: The amount of damage the bullet deals to enemies.
         """
-        super().__init__(x_pos, y_pos, target, bullet_speed, bullet_damage)  # Call the parent class constructor
+        super().reset(x_pos, y_pos, target, bullet_speed, bullet_damage)  # Call the parent class setup
@@ -1,15 +1,25 @@
 from Entities.Projectiles.base_projectile import Projectile
 from Constants import config, sprites
 import pygame
+from Game.Core import logger
 
 class Flame(Projectile):
     """
     The Flame class represents a fire-based projectile that deals area-of-effect (AoE) damage to enemies within range.
     It inherits from the base Projectile class and adds functionality for range checking and multiple enemy hits.
     """
-    def __init__(self, x_pos, y_pos, target, bullet_speed, bullet_damage, range, tower_grid_pos):
+    __slots__ = ("range", "tower_grid_pos", "enemy_hit_list")
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates a Flame projectile and sets it up using reset (see reset for the arguments).
+        """
+        self.enemy_hit_list = []  # List to track enemies hit by the flame (cleared when recycled)
+        super().__init__(*args, **kwargs)
+
+    def reset(self, x_pos, y_pos, target, bullet_speed, bullet_damage, range, tower_grid_pos):
         """
-        Initializes a Flame projectile with specific attributes.
+        Sets up a Flame projectile with specific attributes.
 
         Args:
             x_pos: The x-position of the flame projectile.
@@ -20,22 +30,29 @@ class Flame(Projectile):
             range: The range within which the flame affects enemies.
             tower_grid_pos: The grid position of the tower that fired the flame.
         """
-        super().__init__(x_pos, y_pos, target, bullet_speed, bullet_damage, width=config.GRID_CELL_SIZE, height=config.GRID_CELL_SIZE, bullet_sprite=sprites.FIREBALL_SPRITE)
+        super().reset(x_pos, y_pos, target, bullet_speed, bullet_damage, width=config.GRID_CELL_SIZE, height=config.GRID_CELL_SIZE, bullet_sprite=sprites.FIREBALL_SPRITE)
         self.type = "Fire"  # The type of the projectile is fire
         self.range = range + range // 5  # Add extra range to the flame for more reach
         self.tower_grid_pos = tower_grid_pos  # Grid position of the tower that fired the flame
-        self.enemy_hit_list = []  # List to track enemies hit by the flame
+        self.enemy_hit_list.clear()  # No enemies have been hit yet
+
+    def release(self):
+        """
+        Drops the flame's references to enemies when it is recycled.
+        """
+        super().release()
+        self.enemy_hit_list.clear()
 
-    def update(self, enemies):
+    def update(self, enemy_grid):
         """
         Updates the state of the flame projectile, checking if it's still in range of the tower.
         
         Args:
-            enemies: The list of active enemies in the game.
+            enemy_grid: The active enemies bucketed by grid cell (SpatialHash).
         """
-        super().update(enemies)  # Call base class update method
+        super().update(enemy_grid)  # Call base class update method
         if not self.in_range():  # Check if the flame has moved out of range
-            print("Flame died")  # Debugging message
+            logger.combat("Flame died")
             self.active = False  # Deactivate the flame if it's out of range
 
     def in_range(self):
@@ -51,15 +68,15 @@ class Flame(Projectile):
         # Check if the flame is within range of the tower's grid position
         return abs(x_grid_pos - self.tower_grid_pos[0]) <= self.range and abs(y_grid_pos - self.tower_grid_pos[1]) <= self.range
 
-    def check_collisions(self, enemies):
+    def check_collisions(self, enemy_grid):
         """
         Checks for collisions between the flame and any enemies in its path.
         If a collision occurs, the enemy takes damage.
 
         Args:
-            enemies: The list of enemies in the game.
+            enemy_grid: The enemies bucketed by grid cell (SpatialHash). Only enemies near the flame are checked.
         """
-        for enemy in enemies:
+        for enemy in enemy_grid.query(self.hitbox):
             if enemy not in self.enemy_hit_list:  # Avoid re-hitting enemies
                 if pygame.Rect.colliderect(self.hitbox, enemy.hitbox):  # Check for collision
                     enemy.take_damage(self.damage, damage_type=self.type)  # Apply damage to the enemy
@@ -1,15 +1,25 @@
 from Entities.Projectiles.base_projectile import Projectile
 from Constants import sprites
 import pygame
+from Game.Core import logger
 
 class Saw(Projectile):
     """
     The Saw class represents a specialized projectile that can pierce through enemies multiple times before deactivating.
     It inherits from the base Projectile class and modifies the collision and piercing behavior.
     """
-    def __init__(self, x_pos, y_pos, target, bullet_speed, bullet_damage, pierce):
+    __slots__ = ("pierce", "pierce_number", "enemy_hit_list")
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates a Saw projectile and sets it up using reset (see reset for the arguments).
+        """
+        self.enemy_hit_list = []  # List of enemies that have already been hit by this projectile (cleared when recycled)
+        super().__init__(*args, **kwargs)
+
+    def reset(self, x_pos, y_pos, target, bullet_speed, bullet_damage, pierce):
         """
-        Initializes a Saw projectile with specific attributes, including piercing and damage.
+        Sets up a Saw projectile with specific attributes, including piercing and damage.
         
         Args:
             x_pos: The x-position of the projectile.
@@ -19,22 +29,33 @@ class Saw(Projectile):
             bullet_damage: The amount of damage the projectile inflicts on enemies.
             pierce: The number of times the projectile can pierce through enemies.
         """
-        super().__init__(x_pos, y_pos, target, bullet_speed, bullet_damage, bullet_sprite=sprites.SAW_SPRITE)
+        super().reset(x_pos, y_pos, target, bullet_speed, bullet_damage, bullet_sprite=sprites.SAW_SPRITE)
         
         self.type = "Saw"  # Type of projectile
         self.pierce = pierce  # The total number of times the projectile can pierce through enemies
         self.pierce_number = pierce  # Counter for the remaining pierce opportunities
-        self.enemy_hit_list = []  # List of enemies that have already been hit by this projectile
+        self.enemy_hit_list.clear()  # No enemies have been hit yet
 
-    def check_collisions(self, enemies):
+    def release(self):
+        """
+        Drops the saw's references to enemies when it is recycled.
+        """
+        super().release()
+        self.enemy_hit_list.clear()
+
+    def check_collisions(self, enemy_grid):
         """
         Checks for collisions with enemies and applies damage if the projectile hits them.
         The projectile pierces through enemies up to the maximum pierce count.
         
         Args:
-            enemies: A list of all active enemies in the game.
+            enemy_grid: All active enemies bucketed by grid cell (SpatialHash). Only enemies near the saw are checked.
         """
-        for enemy in enemies:
+        if self.pierce_number <= 0:
+            self.active = False  # Deactivate the projectile when pierce count reaches 0
+            return
+
+        for enemy in enemy_grid.query(self.hitbox):
             # If the projectile still has piercing ability
             if self.pierce_number > 0:
                 if pygame.Rect.colliderect(self.hitbox, enemy.hitbox):  # Check if the projectile collides with the enemy
@@ -42,9 +63,10 @@ class Saw(Projectile):
                         enemy.take_damage(self.damage, damage_type=self.type)  # Apply damage to the enemy
                         self.enemy_hit_list.append(enemy)  # Add the enemy to the hit list
                         self.pierce_number -= 1  # Decrease the pierce counter
-                        print(f"Pierce number is: {self.pierce_number}")  # Debug: print current pierce count
-                        print(f"Enemy hit list is {self.enemy_hit_list}")  # Debug: print enemies hit by the projectile
-                    else:
-                        print(f"Enemy not hit as it has been hit already by the saw: {enemy}")  # Debug: enemy already hit
+                        if logger.combat.enabled:
+                            logger.combat("Pierce number is: %s", self.pierce_number)  # Debug: current pierce count
+                            logger.combat("Enemy hit list is %s", self.enemy_hit_list)  # Debug: enemies hit by the projectile
+                    elif logger.combat.enabled:
+                        logger.combat("Enemy not hit as it has been hit already by the saw: %s", enemy)  # Debug: enemy already hit
             else:
                 self.active = False  # Deactivate the projectile when pierce count reaches 0
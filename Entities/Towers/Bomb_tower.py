@@ -8,6 +8,46 @@ class BombTower(Tower):
     and has its own unique attributes, such as range, fire rate, bullet speed, and bullet damage.
     """
 
+    # Stats for each upgrade level, shared by every tower of this type
+    tower_data = {
+
+        "UPGRADE 0":{
+            "Range": 2,
+            "Attack Delay": 75,
+            "Bullet Speed": 6,
+            "Bullet Damage": 11,
+            "Cost": 50,
+            "Splash Radius": 1
+        },
+        
+        "UPGRADE 1": {
+            "Range": 2.5,
+            "Attack Delay": 60,
+            "Bullet Speed": 6,
+            "Bullet Damage": 15,
+            "Cost": 100,
+            "Splash Radius": 1.5
+        },
+
+        "UPGRADE 2": {
+            "Range": 2.75,
+            "Attack Delay": 50,
+            "Bullet Speed": 7,
+            "Bullet Damage": 20,
+            "Cost": 150,
+            "Splash Radius": 2
+        },
+
+        "UPGRADE 3": {
+            "Range": 3,
+            "Attack Delay": 40,
+            "Bullet Speed": 9,
+            "Bullet Damage": 30,
+            "Cost": 250,
+            "Splash Radius": 3
+        }
+    }
+
     def __init__(self, x_grid_pos, y_grid_pos):
         """
         Initializes a Bomb tower with predefined attributes like range, fire rate, bullet speed,
@@ -18,55 +58,16 @@ class BombTower(Tower):
             y_grid_pos: Y grid position of the tower on the map.
         """
         # Initialize the parent Tower class with the given grid position and specific attributes
-        tower_data = {
-
-            "UPGRADE 0":{
-                "Range": 2,
-                "Attack Delay": 75,
-                "Bullet Speed": 6,
-                "Bullet Damage": 11,
-                "Cost": 50,
-                "Splash Radius": 1
-            },
-            
-            "UPGRADE 1": {
-                "Range": 2.5,
-                "Attack Delay": 60,
-                "Bullet Speed": 6,
-                "Bullet Damage": 15,
-                "Cost": 100,
-                "Splash Radius": 1.5
-            },
-
-            "UPGRADE 2": {
-                "Range": 2.75,
-                "Attack Delay": 50,
-                "Bullet Speed": 7,
-                "Bullet Damage": 20,
-                "Cost": 150,
-                "Splash Radius": 2
-            },
-
-            "UPGRADE 3": {
-                "Range": 3,
-                "Attack Delay": 40,
-                "Bullet Speed": 9,
-                "Bullet Damage": 30,
-                "Cost": 250,
-                "Splash Radius": 3
-            }
-            }
-
-        super().__init__(x_grid_pos, y_grid_pos, tower_data=tower_data, sprite=sprites.BOMB_TOWER_SPRITE)
+        super().__init__(x_grid_pos, y_grid_pos, tower_data=self.tower_data, sprite=sprites.BOMB_TOWER_SPRITE)
 
         self.tile_splash_radius = self.tower_data["UPGRADE 0"]["Splash Radius"]
 
-    def shoot(self, bullets):
+    def shoot(self, bullet_manager):
         """
         Fires a bullet towards the target.
         """
-        # Create a bullet and add it to the list of bullets
-        bullets.append(Bomb(self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage, tile_splash_radius=self.tile_splash_radius))
+        # Fire a bullet from the tower's centre
+        bullet_manager.spawn(Bomb, self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage, tile_splash_radius=self.tile_splash_radius)
 
         # Reset the cooldown to the fire rate
         self.shoot_cooldown = self.attack_delay
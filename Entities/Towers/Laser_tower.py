@@ -8,6 +8,42 @@ class LaserTower(Tower):
     and has its own unique attributes such as range, Attack Delay, bullet speed, and bullet damage.
     """
 
+    # Stats for each upgrade level, shared by every tower of this type
+    tower_data = {
+
+        "UPGRADE 0": {
+            "Range": 3,
+            "Attack Delay": 4,
+            "Bullet Speed": 40,
+            "Bullet Damage": 1.5,
+            "Cost": 35,
+        },
+
+        "UPGRADE 1": {
+            "Range": 3.25,
+            "Attack Delay": 3,
+            "Bullet Speed": 45,
+            "Bullet Damage": 2,
+            "Cost": 100
+        },
+
+        "UPGRADE 2": {
+            "Range": 3.5,
+            "Attack Delay": 2,
+            "Bullet Speed": 50,
+            "Bullet Damage": 2.5,
+            "Cost": 150
+        },
+
+        "UPGRADE 3": {
+            "Range": 4,
+            "Attack Delay": 0,
+            "Bullet Speed": 50,
+            "Bullet Damage": 3.5,
+            "Cost": 250
+        }
+    }
+
     def __init__(self, x_grid_pos, y_grid_pos):
         """
         Initializes a Laser tower with predefined attributes like range, Attack Delay, bullet speed,
@@ -18,49 +54,15 @@ class LaserTower(Tower):
             y_grid_pos: Y grid position of the tower on the map.
         """
         # Initialize the parent Tower class with the given grid position and specific attributes
-        tower_data = {
-
-            "UPGRADE 0": {
-                "Range": 3,
-                "Attack Delay": 4,
-                "Bullet Speed": 40,
-                "Bullet Damage": 1.5,
-                "Cost": 35,
-            },
-
-            "UPGRADE 1": {
-                "Range": 3.25,
-                "Attack Delay": 3,
-                "Bullet Speed": 45,
-                "Bullet Damage": 2,
-                "Cost": 100
-            },
-
-            "UPGRADE 2": {
-                "Range": 3.5,
-                "Attack Delay": 2,
-                "Bullet Speed": 50,
-                "Bullet Damage": 2.5,
-                "Cost": 150
-            },
-
-            "UPGRADE 3": {
-                "Range": 4,
-                "Attack Delay": 0,
-                "Bullet Speed": 50,
-                "Bullet Damage": 3.5,
-                "Cost": 250
-            }
-            }
-        super().__init__(x_grid_pos, y_grid_pos, tower_data=tower_data, sprite=sprites.LASER_TOWER_SPRITE)
+        super().__init__(x_grid_pos, y_grid_pos, tower_data=self.tower_data, sprite=sprites.LASER_TOWER_SPRITE)
 
 
-    def shoot(self, bullets):
+    def shoot(self, bullet_manager):
         """
         Fires a bullet towards the target.
         """
-        # Create a bullet and add it to the list of bullets
-        bullets.append(Laser(self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage))
+        # Fire a bullet from the tower's centre
+        bullet_manager.spawn(Laser, self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage)
 
         # Reset the cooldown to the Attack Delay
         self.shoot_cooldown = self.attack_delay
@@ -1,13 +1,38 @@
 from Constants import config
 from Entities.Projectiles.base_projectile import Projectile
 from abc import ABC
-import pygame, sys
+import pygame, sys, math
+from Game.Core import logger
+
+def find_first(low, high, predicate):
+    """
+    Binary searches for the first whole number where a predicate becomes true, given that it stays true after that.
+
+    Args:
+        low (int): The first number to check.
+        high (int): One past the last number to check.
+        predicate (callable): The predicate, taking a number.
+
+    Returns:
+        int: The first number the predicate is true for, or high if there is none.
+    """
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
 
 class Tower(ABC):
     """
     Base class for creating towers in the game. This class handles basic tower mechanics such as shooting, 
     targeting, range checking, and bullet creation. It also includes attributes related to tower stats.
     """
+
+    # Ways a tower can choose which enemy in range to shoot at
+    TARGETING_POLICIES = ("First", "Last", "Strongest", "Weakest", "Closest")
+
     def __init__(self, x_grid_pos, y_grid_pos, sprite=None, tower_data=None):
         """
         Initializes a Tower instance with the given attributes.
@@ -34,6 +59,8 @@ class Tower(ABC):
 
         self.shoot_cooldown = 0  # Cooldown for shooting, starts at 0
         self.target = None  # The current target that the tower is shooting at
+        self.targeting = self.TARGETING_POLICIES[0]  # How the tower picks its target
+        self.range_intervals = {}  # Cache of the stretches of each enemy path inside the tower's range
         self.upgrade_level = 0
 
         try:
@@ -100,15 +127,15 @@ class Tower(ABC):
         # Draw the clamped rectangle
         pygame.draw.rect(screen, (0, 0, 255), (clamped_left, clamped_top, clamped_width, clamped_height), 3)
 
-    def shoot(self, bullets):
+    def shoot(self, bullet_manager):
         """
         Fires a bullet towards the target.
         
         Args:
-            bullets: List of active bullets to append the new bullet to.
+            bullet_manager: The BulletManager that fires (and recycles) bullets.
         """
-        # Create a bullet and add it to the list of bullets
-        bullets.append(Projectile(self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage))
+        # Fire a bullet from the tower's centre
+        bullet_manager.spawn(Projectile, self.x_centre_pos, self.y_centre_pos, self.target, self.bullet_speed, self.bullet_damage)
 
         # Reset the cooldown to the fire rate
         self.shoot_cooldown = self.attack_delay
@@ -123,43 +150,148 @@ class Tower(ABC):
         Returns:
             True if the enemy is within range, False otherwise.
         """
-        # Check if the enemy is within the tower's range in both x and y directions (grid units)
-        return abs(enemy.grid_position[0] - self.x_grid_pos) <= self.range and abs(enemy.grid_position[1] - self.y_grid_pos) <= self.range
+        return self.covers_cell(enemy.grid_position)
+
+    def covers_cell(self, grid_position):
+        """
+        Checks if a grid cell is within the tower's attack range.
+
+        Args:
+            grid_position: The (x, y) grid position to check.
+
+        Returns:
+            True if the cell is within range, False otherwise.
+        """
+        # Check if the cell is within the tower's range in both x and y directions (grid units)
+        return abs(grid_position[0] - self.x_grid_pos) <= self.range and abs(grid_position[1] - self.y_grid_pos) <= self.range
+
+    def get_range_intervals(self, path):
+        """
+        Gets the stretches of an enemy path that are inside the tower's range (worked out once per path, then cached).
+
+        Args:
+            path (EnemyPath): The enemy path.
+
+        Returns:
+            list: (start, end) distances along the path, for each stretch where enemies are in range.
+        """
+        if path not in self.range_intervals:
+            self.range_intervals[path] = self.find_range_intervals(path)
+        return self.range_intervals[path]
 
-    def get_target(self, enemies):
+    def find_range_intervals(self, path):
         """
-        Finds the first enemy in range to target.
+        Works out the stretches of an enemy path that are inside the tower's range.
+
+        Along a straight segment of the path an enemy's grid cell only ever moves one way, so each segment enters the
+        tower's range at most once and leaves it at most once. Both points are found by binary searching the segment's
+        whole pixel distances, instead of checking every pixel of the path.
+
+        Args:
+            path (EnemyPath): The enemy path.
+
+        Returns:
+            list: (start, end) distances along the path, for each stretch where enemies are in range. A stretch that
+            reaches the end of the path ends at infinity.
+        """
+        tower_position = (self.x_grid_pos, self.y_grid_pos)
+
+        def get_sides(distance, directions):
+            # Which side of the range an enemy a distance along the path is on, along each axis, in the direction the
+            # segment is heading (-1 before the range, 0 inside it, 1 past it)
+            grid_position = path.get_grid_position(distance)
+            return [direction * ((cell > centre + self.range) - (cell < centre - self.range))
+                    for cell, centre, direction in zip(grid_position, tower_position, directions)]
+
+        intervals = []
+        path_end = int(path.length)
+        for segment in range(max(1, len(path) - 1)):
+            # The whole pixel distances on this segment (the last segment runs to the end of the path)
+            first = math.ceil(path.distances[segment]) if segment else 0
+            last = math.ceil(path.distances[segment + 1]) - 1 if segment < len(path) - 2 else path_end
+            if first > last:
+                continue
+
+            if len(path) > 1:
+                (x1, y1), (x2, y2) = path.waypoints[segment], path.waypoints[segment + 1]
+                directions = ((x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1))
+            else:
+                directions = (0, 0)
+            # An axis the segment doesn't move along keeps the whole segment on one side of the range
+            if any(direction == 0 and abs(cell - centre) > self.range
+                   for cell, centre, direction in zip(path.get_grid_position(first), tower_position, directions)):
+                continue
+
+            # The segment is in range from where it has reached the range on both axes until it passes it on either
+            enter = find_first(first, last + 1, lambda distance: min(get_sides(distance, directions)) >= 0)
+            leave = find_first(enter, last + 1, lambda distance: max(get_sides(distance, directions)) > 0)
+            if enter < leave:
+                if intervals and intervals[-1][1] == enter:
+                    intervals[-1] = (intervals[-1][0], leave)  # Carries on from the previous segment
+                else:
+                    intervals.append((enter, leave))
+
+        if intervals and intervals[-1][1] > path_end:
+            intervals[-1] = (intervals[-1][0], math.inf)  # In range up to the end of the path
+        return intervals
+
+    def cycle_targeting(self):
+        """
+        Switches the tower to the next targeting policy.
+        """
+        index = self.TARGETING_POLICIES.index(self.targeting)
+        self.targeting = self.TARGETING_POLICIES[(index + 1) % len(self.TARGETING_POLICIES)]
+        self.target = None  # Pick the next target with the new policy
+        logger.placement("Tower %s is now targeting: %s", self, self.targeting)
+
+    def get_target(self, progress_index):
+        """
+        Finds the enemy in range to target, based on the tower's targeting policy:
+        - First: The enemy furthest along the path.
+        - Last: The enemy least far along the path.
+        - Strongest / Weakest: The enemy with the most / least health.
+        - Closest: The enemy closest to the tower.
         
         Args:
-            enemies: List of all enemies in the game.
+            progress_index: All enemies in the game, sorted by progress along their path (ProgressIndex).
         
         Returns:
-            The first enemy that is in range, or None if no enemy is in range.
+            The chosen enemy, or None if no enemy is in range.
         """
-        for enemy in enemies:
-            if self.in_range(enemy):  # Check if the enemy is within range
-                return enemy
-        return None  # Return None if no enemies are in range
+        in_range = progress_index.get_in_range(self)  # Enemies in range on each path, sorted by progress
+        if not in_range:
+            return None  # Return None if no enemies are in range
+
+        if self.targeting == "First":
+            return max((enemies[-1] for enemies in in_range), key=lambda enemy: enemy.get_progress())
+        if self.targeting == "Last":
+            return min((enemies[0] for enemies in in_range), key=lambda enemy: enemy.get_progress())
 
-    def update(self, enemies, bullets):
+        candidates = [enemy for enemies in in_range for enemy in enemies]
+        if self.targeting == "Strongest":
+            return max(candidates, key=lambda enemy: enemy.health)
+        if self.targeting == "Weakest":
+            return min(candidates, key=lambda enemy: enemy.health)
+        # Closest
+        return min(candidates, key=lambda enemy: (enemy.centre_position[0] - self.x_centre_pos) ** 2 + (enemy.centre_position[1] - self.y_centre_pos) ** 2)
+
+    def update(self, progress_index, bullet_manager):
         """
-        Updates the tower's state: checks if it has a target, if it needs to shoot, and updates the bullets.
+        Updates the tower's state: keeps its target until it dies or leaves the range (then picks a new one with its
+        targeting policy), and shoots when its cooldown has elapsed.
         
         Args:
-            enemies: List of all enemies in the game.
-            bullets: List of all active bullets.
+            progress_index: All enemies in the game, sorted by progress along their path (ProgressIndex).
+            bullet_manager: The BulletManager used to fire bullets.
         """
-        # If the tower has no target, or the target is dead or has reached the end, find a new target
-        if self.target is not None:
-            if not self.target.active or not self.in_range(self.target):
-                self.target = self.get_target(enemies)
-        else:
-            self.target = self.get_target(enemies)
+        # If the tower has no target, or the target is dead, has reached the end or left the range, find a new target
+        if self.target is None or not self.target.active or not self.in_range(self.target):
+            self.target = self.get_target(progress_index)
 
         # If the shoot cooldown has elapsed, shoot at the target
         if self.shoot_cooldown <= 0:
             if self.target is not None:
-                self.shoot(bullets)
+                self.shoot(bullet_manager)
         else:
             # Decrease the cooldown timer
             self.shoot_cooldown -= 1
@@ -179,14 +311,15 @@ class Tower(ABC):
                 self.upgrade_level += 1
                 self.value += self.tower_data[f"UPGRADE {self.upgrade_level}"]["Cost"]
                 self.range = self.tower_data[f"UPGRADE {self.upgrade_level}"]["Range"]
+                self.range_intervals = {}  # The range has changed, so the path stretches in range need working out again
                 self.attack_delay = self.tower_data[f"UPGRADE {self.upgrade_level}"]["Attack Delay"]
                 self.bullet_speed = self.tower_data[f"UPGRADE {self.upgrade_level}"]["Bullet Speed"]
                 self.bullet_damage = self.tower_data[f"UPGRADE {self.upgrade_level}"]["Bullet Damage"]
-                print(f"Tower {self} has been successfully upgraded")
+                logger.placement("Tower %s has been successfully upgraded", self)
                 return True, self.tower_data[f"UPGRADE {self.upgrade_level}"]["Cost"]
             else:
-                print("Upgrade failed: Not enough money")
+                logger.placement("Upgrade failed: Not enough money")
                 return False, "Not Enough Money to Upgrade Tower"
         else:
-            print("Upgrade Failed: Max Level Already!")
+            logger.placement("Upgrade Failed: Max Level Already!")
             return False, "Max Upgrade Level Reached"
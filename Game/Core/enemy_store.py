@@ -0,0 +1,202 @@
+from Constants import config
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - without it, enemies move themselves one at a time
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+class EnemyStore:
+    """
+    Struct-of-arrays storage for enemy movement, backed by NumPy.
+
+    The distance along the path, speed and path of every stored enemy live in NumPy arrays (one row per enemy), so all
+    enemies can be moved along their paths in a single batched operation each tick. The results are then written back
+    to each enemy's own attributes in one pass, so towers, projectiles and drawing read plain attributes as usual.
+    """
+
+    # The arrays holding one row per enemy
+    ROW_ARRAYS = ("speeds", "distances", "path_ids")
+
+    def __init__(self, capacity=64):
+        """
+        Initializes an empty EnemyStore.
+
+        Args:
+            capacity (int): Number of enemies to allocate space for up front (the arrays grow as needed).
+        """
+        self.capacity = capacity
+        self.count = 0  # Number of enemies currently stored (rows 0 to count - 1 are in use)
+        self.enemies = [None] * capacity  # The enemy object stored in each row
+
+        # Path progress - each enemy has travelled distances[row] pixels along paths[path_ids[row]], moving speeds[row] a tick
+        self.speeds = np.zeros(capacity, dtype=np.int64)
+        self.distances = np.zeros(capacity, dtype=np.float64)
+        self.path_ids = np.zeros(capacity, dtype=np.int64)
+
+        # Every path in use, with their distance tables joined end to end, so enemies on any path are moved in one batch
+        self.paths = []  # EnemyPath objects, indexed by path ID
+        self.known_paths = {}  # Maps each EnemyPath to its ID
+        self.path_lengths = np.zeros(0, dtype=np.float64)  # Length of each path
+        self.path_starts = np.zeros(0, dtype=np.int64)  # Index of each path's first waypoint in the joined tables
+        self.path_ends = np.zeros(0, dtype=np.int64)  # Index after each path's last waypoint
+        self.path_offsets = np.zeros(0, dtype=np.float64)  # Added to distances along each path to search the joined table
+        self.cumulative = np.zeros(0, dtype=np.float64)  # Cumulative distance to each waypoint, along its own path
+        self.search_table = np.zeros(0, dtype=np.float64)  # Cumulative distances plus their path's offset (sorted)
+        self.waypoints = np.zeros((0, 2), dtype=np.float64)  # Every path's waypoints
+
+    def clear(self):
+        """
+        Removes all enemies and paths from the store.
+        """
+        self.__init__(self.capacity)
+
+    def grow(self):
+        """
+        Doubles the number of enemies the arrays have space for.
+        """
+        self.capacity *= 2
+        self.enemies.extend([None] * (self.capacity - len(self.enemies)))
+        for name in self.ROW_ARRAYS:
+            old_array = getattr(self, name)
+            new_array = np.zeros((self.capacity,) + old_array.shape[1:], dtype=old_array.dtype)
+            new_array[:self.count] = old_array[:self.count]
+            setattr(self, name, new_array)
+
+    def register_path(self, path):
+        """
+        Adds a path's distance table to the store, if it isn't already there.
+
+        Args:
+            path (EnemyPath): The path.
+
+        Returns:
+            int: The path's ID.
+        """
+        path_id = self.known_paths.get(path)
+        if path_id is not None:
+            return path_id
+
+        # Paths without waypoints keep their enemies at (0, 0), like EnemyPath.get_position
+        waypoints = path.waypoints or ((0, 0),)
+        cumulative = np.array(path.distances if path.waypoints else (0,), dtype=np.float64)
+
+        # Offset the path's distances past the end of the last path's, so the joined search table stays sorted
+        offset = self.search_table[-1] + 1 if len(self.search_table) else 0
+
+        path_id = self.known_paths[path] = len(self.paths)
+        self.paths.append(path)
+        self.path_lengths = np.append(self.path_lengths, path.length)
+        self.path_starts = np.append(self.path_starts, len(self.cumulative))
+        self.path_ends = np.append(self.path_ends, len(self.cumulative) + len(waypoints))
+        self.path_offsets = np.append(self.path_offsets, offset)
+        self.cumulative = np.append(self.cumulative, cumulative)
+        self.search_table = np.append(self.search_table, cumulative + offset)
+        self.waypoints = np.concatenate((self.waypoints, np.array(waypoints, dtype=np.float64).reshape(-1, 2)))
+        return path_id
+
+    def get_positions(self, path_ids, distances):
+        """
+        Looks up the screen positions at several distances along paths (the batched version of EnemyPath.get_position).
+
+        Args:
+            path_ids (numpy.ndarray): The ID of the path each distance is along.
+            distances (numpy.ndarray): Distances along the paths in pixels.
+
+        Returns:
+            numpy.ndarray: The (x, y) screen position at each distance, rounded to whole pixels.
+        """
+        # Find the segment each distance falls on (kept within its own path), then interpolate between its waypoints
+        starts, ends = self.path_starts[path_ids], self.path_ends[path_ids]
+        segments = np.searchsorted(self.search_table, distances + self.path_offsets[path_ids], side="right") - 1
+        segments = np.clip(segments, starts, np.maximum(starts, ends - 2))
+        next_waypoints = np.minimum(segments + 1, ends - 1)  # The same waypoint on single waypoint paths
+
+        segment_starts, segment_ends = self.cumulative[segments], self.cumulative[next_waypoints]
+        segment_lengths = np.where(segment_ends > segment_starts, segment_ends - segment_starts, 1)
+        fractions = np.clip((distances - segment_starts) / segment_lengths, 0, 1)
+        points = self.waypoints[segments] + (self.waypoints[next_waypoints] - self.waypoints[segments]) * fractions[:, None]
+        return np.round(points).astype(np.int64)
+
+    def add(self, enemy):
+        """
+        Adds an enemy to the store, so it is moved with the others.
+
+        Args:
+            enemy (Enemy): The enemy to add. Must not already be in a store.
+        """
+        if self.count == self.capacity:
+            self.grow()
+
+        slot = self.count
+        self.count += 1
+        self.enemies[slot] = enemy
+        self.speeds[slot] = enemy.speed
+        self.distances[slot] = enemy.distance
+        self.path_ids[slot] = self.register_path(enemy.path)
+
+        enemy.store = self
+        enemy.slot = slot
+
+    def remove(self, enemy):
+        """
+        Removes an enemy from the store and frees its row. The enemy keeps its own attributes as they were last written.
+
+        Args:
+            enemy (Enemy): The enemy to remove.
+        """
+        slot = enemy.slot
+        enemy.store = None
+        enemy.slot = None
+
+        # Fill the gap with the last row, so rows 0 to count - 1 stay in use
+        last = self.count - 1
+        if slot != last:
+            for name in self.ROW_ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved_enemy = self.enemies[last]
+            self.enemies[slot] = moved_enemy
+            moved_enemy.slot = slot
+        self.enemies[last] = None
+        self.count -= 1
+
+    def move_enemies(self):
+        """
+        Moves every stored enemy along its path by its speed, in one batched operation, and writes the results back to
+        the enemies (the batched version of Enemy.move).
+        """
+        count = self.count
+        if count == 0:
+            return
+
+        enemies = self.enemies
+        distances = self.distances[:count]
+        path_ids = self.path_ids[:count]
+        path_lengths = self.path_lengths[path_ids]
+        moving = distances < path_lengths  # Enemies that haven't reached the end of their path
+
+        # Enemies at the end of their path stay where they are
+        for slot in np.flatnonzero(~moving).tolist():
+            enemies[slot].prev_position = enemies[slot].position
+        if not moving.any():
+            return
+
+        # Advance along the paths, then look up the new positions (for every path at once)
+        distances[moving] = np.minimum(distances + self.speeds[:count], path_lengths)[moving]
+        positions = self.get_positions(path_ids[moving], distances[moving])
+        grid_xs = (positions[:, 0] + config.GRID_CELL_SIZE // 2) // config.GRID_CELL_SIZE
+        grid_ys = (positions[:, 1] + config.GRID_CELL_SIZE // 2 - config.SCREEN_TOPBAR_HEIGHT) // config.GRID_CELL_SIZE
+
+        # Write the new state back to the enemies, converted to plain Python types
+        for slot, distance, (x, y), grid_x, grid_y in zip(np.flatnonzero(moving).tolist(), distances[moving].tolist(),
+                                                          positions.tolist(), grid_xs.tolist(), grid_ys.tolist()):
+            enemy = enemies[slot]
+            enemy.prev_position = enemy.position  # Remember where the enemy was last tick for interpolated drawing
+            enemy.distance = int(distance) if distance.is_integer() else distance  # Whole distances stay ints, like unstored enemies
+            enemy.position = (x, y)
+            enemy.grid_position = (grid_x, grid_y)
+            enemy.hitbox = hitbox = pygame.Rect(x, y, enemy.width, enemy.height)
+            enemy.centre_position = enemy.prev_centre_position = hitbox.center
@@ -1,5 +1,9 @@
 import pygame
-from Constants import config
+import time
+from Constants import config, sprites
+from Game.Core.profiler import profiler
+from UI.text_cache import render_text
+from Game.Core import logger
 from States.state_manager import StateManager
 from States.game_state import Game_State
 from States.menu_state import Menu_State
@@ -23,10 +27,23 @@ class Game():
         # Create the game window with dimensions from config
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         pygame.display.set_caption("Marsh Tower Defense")  # Set window title
+        sprites.assets.convert_all()  # Convert any sprites loaded before the window existed to its pixel format
 
         self.clock = pygame.time.Clock()  # Create a clock to manage frame rate
         self.running = True  # Controls the game loop execution
         self.debug = True  # Debug mode flag
+
+        # Fixed timestep settings (the game logic ticks at a fixed rate, independent of the frame rate)
+        self.tick_duration = 1 / config.TICK_RATE  # Length of a single tick, in seconds
+        self.accumulator = 0  # Elapsed time that has not been simulated yet, in seconds
+        self.render_alpha = 1  # How far rendering is between the previous tick and the current one (0 to 1)
+        self.game_speed = config.GAME_SPEEDS[0]  # Current fast-forward speed (None = uncapped)
+        self.uncapped_frame = False  # Whether the last frame ran uncapped ticks (and so shouldn't wait for the frame rate cap)
+
+        # Profiler overlay (F3 toggles profiling and the overlay, F4 exports the measurements)
+        self.profiler_font = pygame.font.Font(None, 20)
+        self.profiler_lines = []  # The overlay's text, refreshed every config.PROFILER_OVERLAY_REFRESH frames
+        self.frame_count = 0
         
         # Initialize the state manager and add different game states
         self.state_manager = StateManager() 
@@ -43,10 +60,13 @@ class Game():
         Runs the main game loop, handling events, updating states, 
         and rendering the game.
 
-        Continuously checks for user input, updates the current state 
-        based on input, and renders the game on the screen at a fixed 
-        frame rate. This loop runs until the user quits the game.
+        Continuously checks for user input and renders the game on the screen 
+        at a fixed frame rate, while the game logic is advanced in fixed-size 
+        ticks based on the real time that has elapsed (see update_ticks). 
+        This loop runs until the user quits the game.
         """
+        previous_time = time.perf_counter()
+
         while self.running:
             # Get all user input events
             events = pygame.event.get()  
@@ -55,18 +75,139 @@ class Game():
             for event in events:
                 if event.type == pygame.QUIT:  
                     self.running = False  # Stop the game loop
+                if event.type == pygame.WINDOWEXPOSED:
+                    self.state_manager.redraw_all()  # The window's contents may have been lost
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    self.export_profile()
 
             # Update the current state based on user input
-            self.state_manager.update(events)
+            with profiler.section("Events"):
+                self.state_manager.update(events)
+
+            # Advance the game logic by the time elapsed since the last frame
+            current_time = time.perf_counter()
+            with profiler.section("Ticks"):
+                self.update_ticks(current_time - previous_time)
+            previous_time = current_time
 
-            # Clear the screen (set background to black)
-            self.screen.fill((0, 0, 0))
+            with profiler.section("Draw"):
+                if config.DIRTY_RECT_RENDERING:
+                    # Redraw and refresh only the parts of the screen that changed
+                    dirty_rects = self.state_manager.draw_dirty(self.screen, round(self.clock.get_fps()))
+                    if profiler.enabled:
+                        overlay_rect = self.draw_profiler_overlay(self.screen)
+                        self.state_manager.current_state.invalidate(overlay_rect)  # Clear the overlay next frame
+                        dirty_rects.append(overlay_rect)
+                    if dirty_rects:
+                        pygame.display.update(dirty_rects)
+                else:
+                    # Clear the screen (set background to black)
+                    self.screen.fill((0, 0, 0))
 
-            # Draw the current state on the screen
-            self.state_manager.draw(self.screen, round(self.clock.get_fps()))
+                    # Draw the current state on the screen
+                    self.state_manager.draw(self.screen, round(self.clock.get_fps()))
+                    if profiler.enabled:
+                        self.draw_profiler_overlay(self.screen)
 
-            # Refresh the display
-            pygame.display.flip()
+                    # Refresh the display
+                    pygame.display.flip()
+
+            # Limit the frame rate to config.FPS (uncapped frames already used up their time running ticks)
+            if self.uncapped_frame:
+                self.clock.tick()
+            else:
+                self.clock.tick(config.FPS)
+            self.frame_count += 1
+
+    def toggle_profiler(self):
+        """
+        Switches profiling, and the profiler overlay, on or off.
+        """
+        profiler.enabled = not profiler.enabled
+        if profiler.enabled:
+            profiler.clear()
+        self.profiler_lines = []
+        self.state_manager.redraw_all()  # Clear the overlay away if it was just turned off
+        print(f"Profiler turned {'on' if profiler.enabled else 'off'}")
 
-            # Limit the frame rate to 60 FPS
-            self.clock.tick(config.FPS)
+    def export_profile(self):
+        """
+        Writes the profiler's measurements to a CSV file and a Chrome trace file (see config.PROFILE_CSV_PATH and config.PROFILE_TRACE_PATH).
+        """
+        profiler.export_csv(config.PROFILE_CSV_PATH)
+        profiler.export_chrome_trace(config.PROFILE_TRACE_PATH)
+        print(f"Exported {len(profiler.events)} profiler measurements to {config.PROFILE_CSV_PATH} and {config.PROFILE_TRACE_PATH}")
+
+    def draw_profiler_overlay(self, screen):
+        """
+        Draws the p50 and p99 time of each profiled section in a box at the bottom left of the screen.
+
+        Args:
+            screen: pygame display surface to draw on.
+
+        Returns:
+            pygame.Rect: The area the overlay covers.
+        """
+        # Refresh the numbers every few frames, so they can be read
+        if not self.profiler_lines or self.frame_count % config.PROFILER_OVERLAY_REFRESH == 0:
+            self.profiler_lines = [("Section", "p50 ms", "p99 ms")]
+            self.profiler_lines.extend((name, f"{p50:.2f}", f"{p99:.2f}") for name, p50, p99 in profiler.get_summary())
+
+        line_height = self.profiler_font.get_linesize()
+        overlay = pygame.Surface((260, line_height * len(self.profiler_lines) + 10), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 200))
+        for index, line in enumerate(self.profiler_lines):
+            for column_x, text in zip((5, 130, 195), line):  # Section name, p50 and p99 columns
+                overlay.blit(render_text(self.profiler_font, text, (255, 255, 0)), (column_x, 5 + index * line_height))
+        return screen.blit(overlay, overlay.get_rect(bottomleft=(0, config.SCREEN_HEIGHT)))
+
+    def update_ticks(self, frame_time):
+        """
+        Advances the current state by as many fixed-size ticks as fit in the elapsed time.
+
+        Elapsed time (scaled by the game speed) is added to an accumulator, and a tick is run for every 
+        tick_duration it holds. At most MAX_CATCH_UP_TICKS ticks (per 1x of game speed) are run in a frame; 
+        any time beyond that is dropped, so a slow frame can't cause ever more ticks to be needed. 
+        The leftover time decides how far rendering interpolates towards the latest tick.
+
+        At uncapped speed, ticks are run for a whole frame's time while a game is being simulated. Menus and the
+        pause screen have nothing to simulate, so they tick at 1x instead.
+
+        Args:
+            frame_time (float): Real time elapsed since the previous frame, in seconds.
+        """
+        self.uncapped_frame = self.game_speed is None and self.state_manager.is_simulating()
+        if self.uncapped_frame:
+            # Uncapped speed: run as many ticks as fit in a single frame's time budget
+            deadline = time.perf_counter() + 1 / config.FPS
+            while time.perf_counter() < deadline:
+                self.state_manager.tick()
+            self.accumulator = 0
+            self.render_alpha = 1
+            return
+
+        game_speed = self.game_speed or 1
+        self.accumulator += frame_time * game_speed
+        max_ticks = config.MAX_CATCH_UP_TICKS * game_speed
+
+        ticks = 0
+        while self.accumulator >= self.tick_duration and ticks < max_ticks:
+            self.state_manager.tick()
+            self.accumulator -= self.tick_duration
+            ticks += 1
+
+        if self.accumulator >= self.tick_duration:
+            self.accumulator = 0  # Too far behind to catch up, drop the excess time
+
+        self.render_alpha = self.accumulator / self.tick_duration
+
+    def cycle_game_speed(self):
+        """
+        Switches to the next fast-forward speed in config.GAME_SPEEDS (wrapping back around to the first).
+        """
+        index = config.GAME_SPEEDS.index(self.game_speed)
+        self.game_speed = config.GAME_SPEEDS[(index + 1) % len(config.GAME_SPEEDS)]
+        self.accumulator = 0
+        logger.game("Game speed changed to %s", self.game_speed or "uncapped")
@@ -0,0 +1,90 @@
+import os
+from Constants import config
+
+class LogCategory:
+    """
+    A category of log messages (combat, spawning, ...) that can be switched on and off at runtime.
+
+    Calling a disabled category returns straight away, without formatting its message. Messages are given
+    %-style, with their arguments passed separately, so nothing is formatted unless the category is on.
+    Hot paths can check `enabled` first to skip the call entirely.
+    """
+
+    __slots__ = ("name", "enabled")
+
+    def __init__(self, name, enabled=False):
+        """
+        Initializes the LogCategory.
+
+        Args:
+            name (str): The category's name, shown before each of its messages.
+            enabled (bool): Whether the category's messages are printed.
+        """
+        self.name = name
+        self.enabled = enabled
+
+    def __call__(self, message, *args):
+        """
+        Prints a message if the category is enabled.
+
+        Args:
+            message (str): The message, with %-style placeholders for args.
+            *args: Values for the message's placeholders.
+        """
+        if self.enabled:
+            print(f"[{self.name}] {message % args if args else message}")
+
+# Log categories
+combat = LogCategory("combat")  # Damage, deaths and projectile hits
+spawn = LogCategory("spawn")  # Enemy spawning and wave progress
+placement = LogCategory("placement")  # Placing, selecting, upgrading and selling towers
+path = LogCategory("path")  # Enemy path finding
+game = LogCategory("game")  # Game and level state changes (difficulty, speed, entering levels, ...)
+
+CATEGORIES = {category.name: category for category in (combat, spawn, placement, path, game)}
+
+def set_enabled(name, enabled):
+    """
+    Switches a log category on or off.
+
+    Args:
+        name (str): The category's name.
+        enabled (bool): Whether the category's messages should be printed.
+
+    Raises:
+        ValueError: If there is no category with the given name.
+    """
+    if name not in CATEGORIES:
+        raise ValueError(f"Unknown log category '{name}' (choose from {', '.join(CATEGORIES)})")
+    CATEGORIES[name].enabled = enabled
+
+def toggle(name):
+    """
+    Switches a log category on if it is off, or off if it is on.
+
+    Args:
+        name (str): The category's name.
+
+    Returns:
+        bool: Whether the category is now enabled.
+    """
+    set_enabled(name, not CATEGORIES[name].enabled)
+    return CATEGORIES[name].enabled
+
+def configure(names):
+    """
+    Enables exactly the given log categories, disabling the rest.
+
+    Args:
+        names (iterable): Names of the categories to enable ("all" enables every category, "none" none of them).
+    """
+    names = set(names) - {"none"}
+    if "all" in names:
+        names = set(CATEGORIES)
+    for name in names - set(CATEGORIES):
+        print(f"Warning: Ignoring unknown log category '{name}'")
+    for name in CATEGORIES:
+        set_enabled(name, name in names)
+
+# Start with the categories from config, unless the TD_LOG environment variable lists others (e.g. TD_LOG=combat,path)
+configure(name.strip() for name in os.environ.get("TD_LOG", ",".join(config.LOG_CATEGORIES)).split(",") if name.strip())
@@ -0,0 +1,133 @@
+from collections import deque
+import contextlib
+import csv
+import json
+import time
+
+class Profiler:
+    """
+    Times sections of the game loop (each simulation system, each draw call, event handling, ...).
+
+    Every timed section keeps a rolling window of its most recent durations, for p50/p99 summaries, and every
+    measurement is also kept (up to a limit) as a timeline that can be exported as CSV or a Chrome trace.
+    Nothing is recorded while the profiler is disabled, so it costs next to nothing when it is off.
+    """
+
+    def __init__(self, window=240, max_events=100000):
+        """
+        Initializes a disabled Profiler.
+
+        Args:
+            window (int): Number of recent durations kept per section for the percentile summaries.
+            max_events (int): Number of measurements kept for exporting (the oldest are dropped first).
+        """
+        self.enabled = False
+        self.window = window
+        self.samples = {}  # Maps each section's name to its recent durations, in nanoseconds
+        self.events = deque(maxlen=max_events)  # (name, start, duration) of each measurement, in nanoseconds
+        self.null_section = contextlib.nullcontext()  # Used in place of a timed section while disabled
+
+    def clear(self):
+        """
+        Discards all recorded measurements.
+        """
+        self.samples = {}
+        self.events.clear()
+
+    def record(self, name, start, end):
+        """
+        Records a measurement of a section (ignored while the profiler is disabled).
+
+        Args:
+            name (str): The section's name.
+            start (int): When the section started, from time.perf_counter_ns().
+            end (int): When the section ended, from time.perf_counter_ns().
+        """
+        if not self.enabled:
+            return
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(end - start)
+        self.events.append((name, start, end - start))
+
+    @contextlib.contextmanager
+    def timed_section(self, name):
+        """
+        Times the code run inside the with block.
+
+        Args:
+            name (str): The section's name.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter_ns())
+
+    def section(self, name):
+        """
+        Gets a context manager that times the code run inside it, e.g. `with profiler.section("Draw Map"):`.
+
+        Args:
+            name (str): The section's name.
+
+        Returns:
+            A context manager (one that does nothing while the profiler is disabled).
+        """
+        if not self.enabled:
+            return self.null_section
+        return self.timed_section(name)
+
+    def get_percentiles(self, name, percentiles=(50, 99)):
+        """
+        Gets percentiles of a section's recent durations.
+
+        Args:
+            name (str): The section's name.
+            percentiles (tuple): The percentiles to get (0 to 100).
+
+        Returns:
+            tuple: The duration at each percentile, in milliseconds (empty if the section has no measurements).
+        """
+        samples = sorted(self.samples.get(name, ()))
+        if not samples:
+            return ()
+        return tuple(samples[min(len(samples) - 1, len(samples) * percentile // 100)] / 1e6 for percentile in percentiles)
+
+    def get_summary(self):
+        """
+        Gets the p50 and p99 durations of every section.
+
+        Returns:
+            list: (name, p50, p99) for each section in the order they were first measured, in milliseconds.
+        """
+        return [(name, *self.get_percentiles(name)) for name, samples in self.samples.items() if samples]
+
+    def export_csv(self, path):
+        """
+        Writes every kept measurement to a CSV file, one row per measurement.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["section", "start_us", "duration_us"])
+            for name, start, duration in self.events:
+                writer.writerow([name, start / 1000, duration / 1000])
+
+    def export_chrome_trace(self, path):
+        """
+        Writes every kept measurement to a Chrome trace file (open it at chrome://tracing or ui.perfetto.dev).
+
+        Args:
+            path (str): The file to write.
+        """
+        trace_events = [{"name": name, "ph": "X", "ts": start / 1000, "dur": duration / 1000, "pid": 0, "tid": 0}
+                        for name, start, duration in self.events]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+
+# The profiler shared by the whole game
+profiler = Profiler()
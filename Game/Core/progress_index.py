@@ -0,0 +1,91 @@
+from bisect import bisect_left, bisect_right
+
+class ProgressIndex:
+    """
+    The active enemies on each path, sorted by how far along the path they are.
+
+    Kept up to date as the game runs and shared by every tower. Enemies are inserted in place when they spawn, and
+    once per tick the index drops removed enemies and moves any enemy that overtook another back into place - enemies
+    rarely pass each other, so the index is almost always still in order and is never fully re-sorted. Towers look up
+    the enemies in range by binary searching the stretches of path inside their range, instead of checking every enemy
+    in the game.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty ProgressIndex.
+        """
+        self.paths = {}  # Maps each EnemyPath to (sorted distances, enemies in the same order)
+
+    def clear(self):
+        """
+        Removes all enemies from the index.
+        """
+        self.paths = {}
+
+    def add(self, enemy):
+        """
+        Inserts a newly spawned enemy at its place along its path.
+
+        Args:
+            enemy (Enemy): The enemy to add.
+        """
+        distances, enemies = self.paths.setdefault(enemy.path, ([], []))
+        index = bisect_right(distances, enemy.distance)  # After any tied enemies, so they stay in spawn order
+        distances.insert(index, enemy.distance)
+        enemies.insert(index, enemy)
+
+    def update(self):
+        """
+        Brings the index up to date after the enemies have moved, dropping enemies that have been removed from the game
+        and moving enemies that overtook others back into order.
+        """
+        for path, (distances, enemies) in list(self.paths.items()):
+            enemies[:] = [enemy for enemy in enemies if enemy.active]
+            if not enemies:
+                del self.paths[path]
+                continue
+            distances[:] = [enemy.distance for enemy in enemies]
+
+            # Insertion sort - only enemies that overtook another this tick are moved, usually by a single place
+            for i in range(1, len(distances)):
+                distance = distances[i]
+                if distance < distances[i - 1]:
+                    enemy = enemies[i]
+                    j = i
+                    while j > 0 and distances[j - 1] > distance:  # Stable, so tied enemies keep their order
+                        distances[j], enemies[j] = distances[j - 1], enemies[j - 1]
+                        j -= 1
+                    distances[j], enemies[j] = distance, enemy
+
+    def rebuild(self, enemies):
+        """
+        Replaces the index's enemies, adding them in order.
+
+        Args:
+            enemies (list): All active enemies.
+        """
+        self.clear()
+        for enemy in enemies:
+            self.add(enemy)
+
+    def get_in_range(self, tower):
+        """
+        Finds the enemies within a tower's range on each path.
+
+        Args:
+            tower (Tower): The tower to look up enemies for.
+
+        Returns:
+            list: A list of enemies for each path, each sorted from least to most progress along the path.
+        """
+        in_range = []
+        for path, (distances, enemies) in self.paths.items():
+            path_in_range = []
+            for start, end in tower.get_range_intervals(path):
+                # Binary search for the enemies on this stretch of path
+                first, last = bisect_left(distances, start), bisect_left(distances, end)
+                path_in_range.extend(enemy for enemy in enemies[first:last] if tower.in_range(enemy))
+            if path_in_range:
+                in_range.append(path_in_range)
+        return in_range
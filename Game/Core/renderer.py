@@ -0,0 +1,49 @@
+from Game.Core.profiler import profiler
+
+class SimulationRenderer:
+    """
+    Draws a simulation's map and entities to the screen.
+
+    The renderer only reads the simulation's state, and the simulation has no knowledge of it,
+    so headless runs can simply leave the renderer out.
+    """
+
+    def __init__(self, simulation):
+        """
+        Initializes the SimulationRenderer.
+
+        Args:
+            simulation (Simulation): The simulation to draw.
+        """
+        self.simulation = simulation
+
+    def draw(self, screen, alpha=1):
+        """
+        Draws the map, towers, bullets and enemies, in that order.
+
+        Args:
+            screen: pygame display surface where the simulation will be drawn.
+            alpha (float): How far between the previous tick and the current one to draw moving entities (0 to 1).
+        """
+        with profiler.section("Draw Map"):
+            self.simulation.map.draw(screen)  # Draw the game map
+        with profiler.section("Draw Towers"):
+            self.simulation.tower_manager.draw(screen)  # Draw towers
+        with profiler.section("Draw Bullets"):
+            self.simulation.bullet_manager.draw(screen, alpha)  # Draw bullets
+        with profiler.section("Draw Enemies"):
+            self.simulation.enemy_manager.draw(screen, alpha)  # Draw enemies
+
+    def get_moving_rects(self, alpha=1):
+        """
+        Gets the areas of the screen covered by moving entities (enemies and bullets) when drawn.
+
+        Args:
+            alpha (float): How far between the previous tick and the current one moving entities are drawn (0 to 1).
+
+        Returns:
+            list: A pygame.Rect for each drawn enemy and bullet.
+        """
+        rects = [enemy.get_draw_rect(alpha) for enemy in self.simulation.enemy_manager.enemies]
+        rects.extend(bullet.get_draw_rect(alpha) for bullet in self.simulation.bullet_manager.bullets)
+        return [rect for rect in rects if rect is not None]
@@ -0,0 +1,95 @@
+import json
+
+class Replay:
+    """
+    A recording of a game: its settings and RNG seed, and every player action with the tick it happened on.
+
+    The simulation is deterministic for a given seed, so replaying the actions on the same ticks reproduces
+    the game exactly (see Game/Core/replay_runner.py).
+    """
+
+    VERSION = 1  # Bumped whenever the file format changes
+
+    def __init__(self, map_name, difficulty, practise, seed):
+        """
+        Initializes an empty Replay.
+
+        Args:
+            map_name (str): The name of the map played.
+            difficulty (str): The difficulty played on.
+            practise (bool): Whether practise mode was enabled.
+            seed (int): The seed of the simulation's random number generator.
+        """
+        self.map_name = map_name
+        self.difficulty = difficulty
+        self.practise = practise
+        self.seed = seed
+        self.actions = []  # (tick, action name, args) for each player action, in order
+        self.ticks = 0  # Number of ticks the recorded game lasted
+        self.result = None  # Summary of the game's final state, used to check a replay matches the recording
+
+    def record(self, tick, action, *args):
+        """
+        Records a player action.
+
+        Args:
+            tick (int): The simulation tick the action happened on (before that tick was simulated).
+            action (str): The action's name (e.g. "place_tower").
+            *args: The action's arguments (must be JSON serialisable).
+        """
+        self.actions.append((tick, action, args))
+
+    def finish(self, simulation):
+        """
+        Stores how long the game lasted and how it ended, so replays can be checked against it.
+
+        Args:
+            simulation (Simulation): The recorded simulation, in its final state.
+        """
+        self.ticks = simulation.tick
+        self.result = simulation.get_summary()
+
+    def save(self, path):
+        """
+        Writes the replay to a compact JSON file.
+
+        Args:
+            path (str): The file to write.
+        """
+        data = {
+            "version": self.VERSION,
+            "map": self.map_name,
+            "difficulty": self.difficulty,
+            "practise": self.practise,
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "result": self.result,
+            "actions": [[tick, action, *args] for tick, action, args in self.actions],
+        }
+        with open(path, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a replay from a file written by save.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            Replay: The loaded replay.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version of the game.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported replay version {data.get('version')} (expected {cls.VERSION})")
+
+        replay = cls(data["map"], data["difficulty"], data["practise"], data["seed"])
+        replay.ticks = data["ticks"]
+        replay.result = data["result"]
+        replay.actions = [(tick, action, tuple(args)) for tick, action, *args in data["actions"]]
+        return replay
@@ -0,0 +1,71 @@
+from Game.Core.simulation import Simulation
+from Entities.Towers.base_tower import Tower
+
+def get_tower_class(name):
+    """
+    Finds a tower class by its name.
+
+    Args:
+        name (str): The tower class's name (e.g. "TurretTower").
+
+    Returns:
+        type: The tower class.
+
+    Raises:
+        ValueError: If there is no tower with that name.
+    """
+    for tower_class in Tower.__subclasses__():
+        if tower_class.__name__ == name:
+            return tower_class
+    raise ValueError(f"Unknown tower type '{name}'")
+
+def apply_action(simulation, action, args):
+    """
+    Performs a recorded player action on a simulation.
+
+    Args:
+        simulation (Simulation): The simulation to act on.
+        action (str): The action's name.
+        args (tuple): The action's recorded arguments.
+    """
+    if action == "place_tower":
+        tower_name, grid_x, grid_y = args
+        simulation.tower_manager.place_tower(get_tower_class(tower_name), grid_x, grid_y)
+    elif action == "remove_tower":
+        simulation.tower_manager.remove_tower(*args)
+    elif action == "upgrade_tower":
+        simulation.tower_manager.upgrade_tower(*args)
+    elif action == "next_wave":
+        simulation.wave_manager.next_wave()
+    else:
+        raise ValueError(f"Unknown replay action '{action}'")
+
+def run_replay(replay, timings=None):
+    """
+    Re-runs a recorded game headlessly, as fast as possible.
+
+    Args:
+        replay (Replay): The recording to run.
+        timings (dict, optional): Passed on to Simulation.update to time each system.
+
+    Returns:
+        Simulation: The simulation after the recorded number of ticks, which should match the recording
+        (compare its get_summary() with replay.result).
+    """
+    simulation = Simulation(replay.map_name, difficulty=replay.difficulty, practise=replay.practise)
+    simulation.load_level(replay.map_name, seed=replay.seed)
+
+    actions = replay.actions
+    next_action = 0
+    while simulation.tick < replay.ticks:
+        # Perform the actions the player took before this tick
+        while next_action < len(actions) and actions[next_action][0] <= simulation.tick:
+            _, action, args = actions[next_action]
+            apply_action(simulation, action, args)
+            next_action += 1
+        simulation.update(timings)
+
+    # Actions taken after the last tick (e.g. just before quitting)
+    for _, action, args in actions[next_action:]:
+        apply_action(simulation, action, args)
+    return simulation
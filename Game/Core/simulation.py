@@ -0,0 +1,221 @@
+import random
+import time
+from Game.Core.profiler import profiler
+from Game.Core.replay import Replay
+
+# Import Game Data
+from Game.Core.game_data import GAME_DATA
+
+# Import Map
+from Game.Map.map import Map
+
+# Import Managers
+from Game.Managers.wave_manager import WaveManager
+from Game.Managers.bullet_manager import BulletManager
+from Game.Managers.enemy_manager import EnemyManager
+from Game.Managers.tower_manager import TowerManager
+
+class Simulation:
+    """
+    Headless game simulation - Owns the map and the enemy, tower, bullet and wave managers, and advances the game tick by tick.
+
+    The simulation never touches the display, fonts, the mouse or the event queue, so it can be stepped without a window
+    (e.g. for balance runs on CI machines). Rendering is done separately by reading the simulation's state.
+    """
+
+    def __init__(self, map_name="Demonstration_Map", difficulty="Normal", practise=False, seed=None):
+        """
+        Initializes the Simulation.
+
+        Args:
+            map_name (str): The name of the map to load (must exist in MAP_DATA).
+            difficulty (str): The difficulty to play on (must exist in GAME_DATA).
+            practise (bool): Whether practise mode (unlimited health and money) is enabled.
+            seed (int, optional): Seed for the simulation's random number generator (a random seed is picked if not given).
+        """
+        # All randomness in the simulation comes from this generator, so a game can be reproduced from its seed
+        self.rng = random.Random()
+        self.route_rng = random.Random()  # Picks the route each enemy takes, kept apart so it can't change spawn orders
+        self.seed = None
+
+        # Initialize game map
+        self.map = Map(map_name)
+
+        # Initialize all game managers responsible for specific components
+        self.tower_manager = TowerManager(self)
+        self.bullet_manager = BulletManager(self)
+        self.enemy_manager = EnemyManager(self)
+        self.wave_manager = WaveManager(self)
+
+        # Set game settings and starting stats based on difficulty
+        self.practise = practise
+        self.change_difficulty(difficulty)
+        self.money = self.starting_money
+        self.health = self.starting_health
+
+        self.tick = 0  # Number of ticks simulated since the level was loaded
+        self.reseed(seed)
+
+        # The systems updated each tick, in order, with a name for each (used when timing them)
+        self.systems = [
+            ("Enemies", self.enemy_manager.update_enemies),  # Update enemy positions and check for removals
+            ("Towers", self.tower_manager.update_towers),  # Update tower behavior (attacking, targeting, etc.)
+            ("Bullets", self.bullet_manager.check_bullet_collisions),  # Check and handle bullet collisions with enemies
+            ("Waves", self.wave_manager.update),  # Update wave logic (spawning, progress)
+        ]
+
+    def change_difficulty(self, difficulty):
+        """
+        Changes the difficulty level and updates the starting stats accordingly.
+
+        Args:
+            difficulty (str): The new difficulty level (e.g. 'Easy', 'Normal', 'Hard').
+        """
+        self.difficulty = difficulty
+        self.wave_manager.difficulty = difficulty
+        self.update_starting_stats()
+
+    def toggle_practise(self):
+        """
+        Toggles practise mode on or off, updating the starting stats accordingly.
+        """
+        self.practise = not self.practise
+        self.update_starting_stats()
+
+    def update_starting_stats(self):
+        """
+        Sets the starting health and money from the current difficulty, or to unlimited values in practise mode.
+        """
+        if self.practise:
+            self.starting_health = 9999
+            self.starting_money = 9999
+        else:
+            self.starting_health = GAME_DATA[self.difficulty]["Game_Stats"]["Starting Health"]
+            self.starting_money = GAME_DATA[self.difficulty]["Game_Stats"]["Starting Money"]
+
+    def load_level(self, map_name, seed=None):
+        """
+        Loads a level, resetting the waves, health and money for a fresh game.
+
+        Args:
+            map_name (str): The name of the map to load.
+            seed (int, optional): Seed for the random number generator (a random seed is picked if not given).
+        """
+        self.map = Map(map_name)
+        self.wave_manager.reset_waves()  # Reset wave manager when entering a new level
+        self.health = self.starting_health  # Reset health
+        self.money = self.starting_money  # Reset money
+        self.tick = 0
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Reseeds the random number generator and starts a new replay recording from the current state.
+
+        Args:
+            seed (int, optional): The new seed (a random seed is picked if not given).
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng.seed(self.seed)
+        self.route_rng.seed(f"{self.seed} routes")
+        self.wave_manager.schedule = None  # The schedule's spawn orders come from the generator, so work them out again
+        self.replay = Replay(self.map.name, self.difficulty, self.practise, self.seed)
+
+    def record_action(self, action, *args):
+        """
+        Records a player action in the replay, with the current tick.
+
+        Args:
+            action (str): The action's name (e.g. "place_tower").
+            *args: The action's arguments.
+        """
+        self.replay.record(self.tick, action, *args)
+
+    def get_summary(self):
+        """
+        Gets a summary of the simulation's current state (used to check replays reproduce a game exactly).
+
+        Returns:
+            dict: The tick, wave, health, money, and remaining enemies and towers.
+        """
+        return {
+            "tick": self.tick,
+            "wave": self.wave_manager.wave_number,
+            "health": self.health,
+            "money": self.money,
+            "enemies": [[type(enemy).__name__, enemy.distance, enemy.health] for enemy in self.enemy_manager.enemies],
+            "towers": [[type(tower).__name__, x, y, tower.upgrade_level] for (x, y), tower in self.tower_manager.towers.items()],
+        }
+
+    def clear(self):
+        """
+        Resets the map and removes all enemies, towers and bullets.
+        """
+        self.map.reset_map()  # Reset map
+        self.enemy_manager.enemies = []  # Clear enemies
+        self.enemy_manager.enemy_grid.clear()  # Clear the enemy collision grid
+        self.enemy_manager.progress_index.clear()  # Clear the enemy targeting index
+        if self.enemy_manager.enemy_store is not None:
+            self.enemy_manager.enemy_store.clear()  # Clear the vectorized enemy state
+        self.tower_manager.towers = {}  # Clear towers
+        self.bullet_manager.clear()  # Clear bullets
+
+    def update(self, timings=None):
+        """
+        Advances the simulation by a single tick.
+
+        Updates the enemies, towers, bullets and waves, in that order.
+
+        Args:
+            timings (dict, optional): If given, the time spent in each system (in seconds) is added to it, keyed by the system's name.
+        """
+        for name, system in self.systems:
+            if timings is None and not profiler.enabled:
+                system()
+            else:
+                start = time.perf_counter_ns()
+                system()
+                end = time.perf_counter_ns()
+                if timings is not None:
+                    timings[name] = timings.get(name, 0) + (end - start) / 1e9
+                profiler.record(name, start, end)  # Shown in the profiler overlay, if it is on
+        self.tick += 1
+
+    def run_wave(self, max_ticks=None):
+        """
+        Starts the next wave and simulates until it is over, the game is lost, or max_ticks is reached.
+
+        Args:
+            max_ticks (int, optional): Maximum number of ticks to simulate before giving up.
+
+        Returns:
+            int: The number of ticks that were simulated.
+        """
+        self.wave_manager.next_wave()
+        ticks = 0
+        while self.wave_manager.wave_ongoing and not self.is_game_over():
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            self.update()
+            ticks += 1
+        return ticks
+
+    def is_game_over(self):
+        """
+        Checks if the game has been lost.
+
+        Returns:
+            bool: True if the player's health has run out.
+        """
+        return self.health <= 0
+
+    def is_won(self):
+        """
+        Checks if the game has been won (last wave of the difficulty completed with health remaining).
+
+        Returns:
+            bool: True if the game has been won.
+        """
+        if self.wave_manager.wave_ongoing or self.health <= 0:
+            return False
+        return self.wave_manager.wave_number == GAME_DATA[self.difficulty]["Last Wave"]
@@ -0,0 +1,85 @@
+from Constants import config
+
+class SpatialHash:
+    """
+    A uniform grid that buckets objects by the cells their hitbox overlaps, so collision checks only need to look at
+    objects near a given area instead of every object in the game.
+    """
+
+    def __init__(self, cell_size=config.GRID_CELL_SIZE):
+        """
+        Initializes an empty SpatialHash.
+
+        Args:
+            cell_size (int): The width and height of each cell in pixels. Default is the map's grid cell size.
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # Maps (cell_x, cell_y) to a list of (insertion index, object) pairs
+        self.count = 0  # Number of objects inserted since the last clear
+
+    def clear(self):
+        """
+        Removes all objects from the hash.
+        """
+        self.cells = {}
+        self.count = 0
+
+    def get_cell_range(self, rect):
+        """
+        Gets the range of cells a rectangle overlaps.
+
+        Args:
+            rect (pygame.Rect): The rectangle to look up.
+
+        Returns:
+            tuple: The first and last cell x and y indices (min_x, min_y, max_x, max_y), inclusive.
+        """
+        return (rect.left // self.cell_size, rect.top // self.cell_size,
+                (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size)
+
+    def insert(self, obj, rect):
+        """
+        Adds an object to every cell its rectangle overlaps.
+
+        Args:
+            obj: The object to add.
+            rect (pygame.Rect): The object's hitbox.
+        """
+        min_x, min_y, max_x, max_y = self.get_cell_range(rect)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append((self.count, obj))
+        self.count += 1
+
+    def rebuild(self, objects):
+        """
+        Clears the hash and inserts every object using its hitbox.
+
+        Args:
+            objects (list): Objects with a `hitbox` attribute (e.g. enemies).
+        """
+        self.clear()
+        for obj in objects:
+            self.insert(obj, obj.hitbox)
+
+    def query(self, *rects):
+        """
+        Gets the objects in the cells one or more rectangles overlap. These are only candidates -
+        callers still need to do their own exact collision check.
+
+        Args:
+            *rects (pygame.Rect): The areas to look up.
+
+        Returns:
+            list: Each nearby object once (even if several areas overlap it), in the order they were inserted.
+        """
+        found = {}
+        for rect in rects:
+            min_x, min_y, max_x, max_y = self.get_cell_range(rect)
+            for cell_x in range(min_x, max_x + 1):
+                for cell_y in range(min_y, max_y + 1):
+                    for index, obj in self.cells.get((cell_x, cell_y), ()):
+                        found[index] = obj
+
+        # Keep insertion order so results match checking the full object list
+        return [found[index] for index in sorted(found)]
@@ -0,0 +1,124 @@
+from array import array
+from collections import Counter
+import math
+from Game.Core.game_data import GAME_DATA
+
+class WaveSchedule:
+    """
+    The spawns of every wave of a difficulty, worked out up front.
+
+    Each wave is stored as two compact arrays - the tick (counted from the start of the wave) each enemy spawns on, and
+    the enemy's type id (its index in enemy_names) - in spawn order. The WaveManager steps through them with an index,
+    and the UI can read them to preview upcoming waves without simulating anything.
+
+    Spawn orders are shuffled with the simulation's seeded random number generator, one wave after another, so the
+    schedule is the same every time a game with the same seed is played.
+    """
+
+    MIN_SPAWN_INTERVAL = 5  # The spawn interval stops shrinking once it reaches this
+
+    def __init__(self, difficulty, rng):
+        """
+        Initializes the WaveSchedule, working out every wave up to the difficulty's last wave.
+
+        Args:
+            difficulty (str): The difficulty to schedule (must exist in GAME_DATA).
+            rng (random.Random): The generator used to shuffle each wave's spawn order.
+        """
+        self.difficulty = difficulty
+        self.rng = rng
+        self.enemy_names = tuple(GAME_DATA[difficulty]["Default_Spawn"])  # Enemy names, indexed by type id
+
+        self.ticks = []  # Spawn ticks of each wave (wave 1 first), as arrays
+        self.enemy_ids = []  # Enemy type ids of each wave (wave 1 first), as arrays
+        self.spawn_intervals = []  # Ticks between the spawns of each wave (wave 1 first)
+
+        # Counters for working out the next wave (the same ones the game used to keep while playing)
+        self.spawn_interval = GAME_DATA[difficulty]["Default_Spawn_Interval"]
+        self.accumulated_spawns = dict(GAME_DATA[difficulty]["Default_Spawn"])
+        self.start_delay = 0  # Ticks before the next wave's first spawn
+
+        self.extend(GAME_DATA[difficulty]["Last Wave"])
+
+    def extend(self, wave_number):
+        """
+        Works out every wave up to the given wave, if they haven't been already (waves after the last wave are only
+        scheduled when they are needed).
+
+        Args:
+            wave_number (int): The last wave that must be scheduled.
+        """
+        increments = GAME_DATA[self.difficulty]["Increment"]
+        while len(self.ticks) < wave_number:
+            # Each wave spawns enemies a little faster, and more of them
+            if self.spawn_interval > self.MIN_SPAWN_INTERVAL:
+                self.spawn_interval -= 1
+            if self.ticks:
+                for enemy_name, increment in increments.items():
+                    self.accumulated_spawns[enemy_name] += increment
+
+            wave_ids = []
+            for enemy_id, enemy_name in enumerate(self.enemy_names):
+                wave_ids.extend([enemy_id] * math.floor(self.accumulated_spawns[enemy_name]))
+            self.rng.shuffle(wave_ids)
+
+            # One enemy spawns every spawn_interval + 1 ticks, after the delay left over from the previous wave
+            period = self.spawn_interval + 1
+            self.ticks.append(array("I", (self.start_delay + i * period for i in range(len(wave_ids)))))
+            self.enemy_ids.append(array("B", wave_ids))
+            self.spawn_intervals.append(self.spawn_interval)
+            if wave_ids:
+                self.start_delay = self.spawn_interval
+
+    def get_wave(self, wave_number):
+        """
+        Gets a wave's spawns, for stepping through while the wave is played.
+
+        Args:
+            wave_number (int): The wave (starting at 1).
+
+        Returns:
+            tuple: (ticks, enemy_ids) - read-only views of the wave's spawn ticks and enemy type ids, in spawn order.
+        """
+        self.extend(wave_number)
+        return memoryview(self.ticks[wave_number - 1]).toreadonly(), memoryview(self.enemy_ids[wave_number - 1]).toreadonly()
+
+    def get_spawns(self, wave_number):
+        """
+        Gets a wave's spawns with the enemies' names (e.g. for previewing an upcoming wave).
+
+        Args:
+            wave_number (int): The wave (starting at 1).
+
+        Returns:
+            tuple: (tick, enemy name) for each spawn, in spawn order.
+        """
+        ticks, enemy_ids = self.get_wave(wave_number)
+        return tuple((tick, self.enemy_names[enemy_id]) for tick, enemy_id in zip(ticks, enemy_ids))
+
+    def get_enemy_counts(self, wave_number):
+        """
+        Gets how many of each enemy a wave spawns.
+
+        Args:
+            wave_number (int): The wave (starting at 1).
+
+        Returns:
+            dict: Maps each enemy name to the number spawned.
+        """
+        _, enemy_ids = self.get_wave(wave_number)
+        counts = Counter(enemy_ids)
+        return {enemy_name: counts[enemy_id] for enemy_id, enemy_name in enumerate(self.enemy_names)}
+
+    def get_spawn_interval(self, wave_number):
+        """
+        Gets the number of ticks between a wave's spawns.
+
+        Args:
+            wave_number (int): The wave (starting at 1).
+
+        Returns:
+            int: The spawn interval.
+        """
+        self.extend(wave_number)
+        return self.spawn_intervals[wave_number - 1]
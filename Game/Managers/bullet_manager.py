@@ -1,6 +1,9 @@
 class BulletManager():
     """
     Manages the active bullets in the game, including checking collisions and drawing bullets.
+
+    Inactive bullets are kept in a pool for each projectile class and recycled when a tower fires again,
+    so long waves don't keep creating new projectile objects.
     """
     
     def __init__(self, game_state):
@@ -12,35 +15,97 @@ class BulletManager():
         """
         self.game_state = game_state
         self.bullets = []  # List to store active bullets
+        self.pools = {}  # Maps each projectile class to a list of its inactive projectiles, ready to be reused
+
+        # Allocation counters, to check that projectiles are being recycled
+        self.allocated_count = 0  # Number of projectile objects created
+        self.reused_count = 0  # Number of shots fired using a recycled projectile
+
+    def spawn(self, projectile_class, *args, **kwargs):
+        """
+        Fires a new projectile, reusing an inactive one of the same class if there is one.
+
+        Args:
+            projectile_class: The class of projectile to fire (e.g. Bomb).
+            *args, **kwargs: The arguments for the projectile's reset method.
+
+        Returns:
+            Projectile: The fired projectile.
+        """
+        pool = self.pools.get(projectile_class)
+        if pool:
+            projectile = pool.pop()
+            projectile.reset(*args, **kwargs)  # Set the recycled projectile up as if it were new
+            self.reused_count += 1
+        else:
+            projectile = projectile_class(*args, **kwargs)
+            self.allocated_count += 1
+
+        self.bullets.append(projectile)
+        return projectile
+
+    def release(self, projectile):
+        """
+        Puts an inactive projectile in its class's pool so it can be reused.
+
+        Args:
+            projectile (Projectile): The inactive projectile.
+        """
+        projectile.release()
+        pool = self.pools.get(type(projectile))
+        if pool is None:
+            pool = self.pools[type(projectile)] = []
+        pool.append(projectile)
+
+    def clear(self):
+        """
+        Removes all active bullets, recycling them.
+        """
+        for bullet in self.bullets:
+            self.release(bullet)
+        self.bullets.clear()
 
     def check_bullet_collisions(self):
         """
         Checks for bullet collisions with enemies and applies damage if a bullet hits an enemy.
 
-        Loops through all active bullets, updates their position, and checks if they collide with any enemies.
-        Removes inactive bullets from the list.
+        Loops through all active bullets, updates their position, and checks if they collide with any enemies
+        (only enemies in the enemy grid cells near each bullet are checked). Removes inactive bullets from the list.
         """
+        enemy_grid = self.game_state.enemy_manager.enemy_grid
         for bullet in self.bullets:
-            bullet.update(self.game_state.enemy_manager.enemies)  # Update the position and check for collisions with enemies
+            bullet.update(enemy_grid)  # Update the position and check for collisions with nearby enemies
 
-        # Remove any inactive bullets (bullets that have hit an enemy or are otherwise inactive)
-        self.bullets = [bullet for bullet in self.bullets if bullet.active]
+        # Remove any inactive bullets (bullets that have hit an enemy or are otherwise inactive) in place,
+        # by moving the last bullet into each gap, and recycle them
+        bullets = self.bullets
+        index = 0
+        while index < len(bullets):
+            bullet = bullets[index]
+            if bullet.active:
+                index += 1
+            else:
+                bullets[index] = bullets[-1]
+                bullets.pop()
+                self.release(bullet)
 
-    def draw_bullets(self, screen):
+    def draw_bullets(self, screen, alpha=1):
         """
         Draws all active bullets on the screen.
 
         Args:
             screen: The screen to draw the bullets on.
+            alpha: How far between their previous and current tick positions to draw the bullets (0 to 1).
         """
-        for bullet in self.bullets:
-            bullet.draw(screen)  # Draw each bullet on the screen
+        # Draw every bullet in a single call
+        screen.blits([(bullet.sprite, bullet.get_draw_position(alpha)) for bullet in self.bullets], doreturn=False)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1):
         """
         Draws all bullets by calling the draw_bullets method.
 
         Args:
             screen: The screen to draw the bullets on.
+            alpha: How far between their previous and current tick positions to draw the bullets (0 to 1).
         """
-        self.draw_bullets(screen)  # Draws all bullets
+        self.draw_bullets(screen, alpha)  # Draws all bullets
@@ -1,4 +1,9 @@
 from Game.Core.game_data import ENEMY_CLASS_MAP
+from Game.Core.spatial_hash import SpatialHash
+from Game.Core.progress_index import ProgressIndex
+from Game.Core.enemy_store import EnemyStore, NUMPY_AVAILABLE
+from Constants import config
+from Game.Core import logger
 
 class EnemyManager():
     """
@@ -13,55 +18,87 @@ class EnemyManager():
         """
         self.game_state = game_state
         self.enemies = []  # List to store active enemies
+        self.spawned_count = 0  # Total number of enemies created
+        self.enemy_grid = SpatialHash()  # Enemies bucketed by grid cell, for fast collision checks
+        self.progress_index = ProgressIndex()  # Enemies sorted by progress along their path, for fast tower targeting
+
+        # Vectorized enemy state, used when enabled in the config and NumPy is installed (None = enemies move themselves)
+        self.enemy_store = EnemyStore() if config.VECTORIZED_ENEMIES and NUMPY_AVAILABLE else None
 
     def update_enemies(self):
         """
         Updates each enemy's movement and removes dead or finished enemies from the list.
 
         Loops through all active enemies, calling the update method for each, and removes enemies that are no longer active.
+        The loop runs over a copy of the list, so removing an enemy doesn't make the next one skip its update.
+        The enemy grid is then rebuilt from the enemies' new positions, and the progress index brought up to date.
         """
-        for enemy in self.enemies:
+        if self.enemy_store is not None:
+            self.enemy_store.move_enemies()  # Move all stored enemies in one batch
+
+        for enemy in list(self.enemies):
             enemy.update(self.game_state)  # Update each enemy's state
 
+        self.enemy_grid.rebuild(self.enemies)  # Re-bucket enemies for this tick's collision checks
+        self.progress_index.update()  # Drop removed enemies and re-order overtaking ones for this tick's tower targeting
+
     def create_enemy(self, enemy_name, **kwargs):
         """
         Creates and adds an enemy to the game based on the provided enemy name and optional parameters.
 
         Args:
             enemy_name (str): The name of the enemy to create.
-            kwargs: Optional keyword arguments for custom starting position and path.
+            kwargs: Optional keyword arguments for a custom path and distance along it to start at.
         """
         if kwargs:
-            # If custom parameters are provided, use them for the enemy's starting position and path
-            start_position = kwargs["Start_Position"]
+            # If custom parameters are provided, use them for the enemy's path and starting distance
             enemy_path = kwargs["Path"]
+            distance = kwargs["Distance"]
         else:
-            # Otherwise, use the default values from the game state
-            start_position = self.game_state.map.enemy_start_pos
-            enemy_path = self.game_state.map.enemy_path
-        print(f"Created enemy {enemy_name}")
+            # Otherwise, start at the beginning of one of the map's paths
+            enemy_path = self.game_state.map.choose_enemy_path(self.game_state.route_rng)
+            distance = 0
+        logger.spawn("Created enemy %s", enemy_name)
         
         # Get the appropriate enemy class from the class map
         enemy_class = ENEMY_CLASS_MAP.get(enemy_name)
         if enemy_class:
             # If the enemy class exists, create an instance and add it to the list of enemies
-            self.enemies.append(enemy_class(start_position, enemy_path))
+            enemy = enemy_class(enemy_path, distance)
+            if self.enemy_store is not None:
+                self.enemy_store.add(enemy)
+            self.enemies.append(enemy)
+            self.progress_index.add(enemy)
+            self.spawned_count += 1
 
-    def draw_enemies(self, screen):
+    def draw_enemies(self, screen, alpha=1):
         """
         Draws all active enemies on the screen.
 
         Args:
             screen: The screen to draw the enemies on.
+            alpha: How far between their previous and current tick positions to draw the enemies (0 to 1).
+        """
+        screen.blits(self.get_blit_sequence(alpha), doreturn=False)  # Draw every enemy in a single call
+
+    def get_blit_sequence(self, alpha=1):
+        """
+        Gets the sprite and draw position of every active enemy, in drawing order.
+
+        Args:
+            alpha: How far between their previous and current tick positions the enemies are drawn (0 to 1).
+
+        Returns:
+            list: (sprite, position) pairs for Surface.blits.
         """
-        for enemy in self.enemies:
-            enemy.draw(screen)  # Draw each enemy on the screen
+        return [(enemy.sprite, enemy.get_draw_position(alpha)) for enemy in self.enemies if enemy.sprite is not None]
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1):
         """
         Draws all enemies by calling the draw_enemies method.
 
         Args:
             screen: The screen to draw the enemies on.
+            alpha: How far between their previous and current tick positions to draw the enemies (0 to 1).
         """
-        self.draw_enemies(screen)  # Draws all enemies
+        self.draw_enemies(screen, alpha)  # Draws all enemies
@@ -3,6 +3,7 @@ from Entities.Towers.Bomb_tower import BombTower
 from Entities.Towers.Laser_tower import LaserTower
 from Entities.Towers.Saw_tower import SawTower
 from Entities.Towers.Turret_Tower import TurretTower
+from Game.Core import logger
 
 class TowerManager:
     """
@@ -25,7 +26,7 @@ class TowerManager:
         This method is called every frame to update the status of each tower.
         """
         for _, tower in self.towers.items():
-            tower.update(self.game_state.enemy_manager.enemies, self.game_state.bullet_manager.bullets)
+            tower.update(self.game_state.enemy_manager.progress_index, self.game_state.bullet_manager)
 
     def create_tower(self, tower, position):
         """
@@ -35,60 +36,72 @@ class TowerManager:
             tower: The class of the tower to be placed (e.g., BirdFlamethrowerTower).
             position: A tuple (x, y) specifying the grid position for the tower.
         """
-        self.towers[(self.game_state.mouse.map_grid_x, self.game_state.mouse.map_grid_y)] = tower(*position)
+        self.towers[position] = tower(*position)
 
-    def place_tower(self):
+    def place_tower(self, tower_type, grid_x, grid_y):
         """
-        Places a tower on the map grid and adds the selected tower to the game_state tower dict.
+        Places a tower on the map grid and adds it to the tower dict.
 
         Checks if the player has enough money and if the tower placement is valid.
-        Displays an error message if the tower cannot be placed.
+
+        Args:
+            tower_type: The class of the tower to be placed (e.g., BirdFlamethrowerTower).
+            grid_x: X grid position to place the tower at.
+            grid_y: Y grid position to place the tower at.
+
+        Returns:
+            A tuple (success, result), where result is the cost of the tower if it was placed, or an error message if not.
         """
-        print("Trying to place tower")
+        logger.placement("Trying to place tower")
+        self.game_state.record_action("place_tower", tower_type.__name__, grid_x, grid_y)
+        tower = tower_type(grid_x, grid_y)
         # Check if player has enough money to place the selected tower
-        if self.game_state.money >= self.game_state.mouse.current_selection(0, 0).cost:
-            # Check if the tower can be placed on the grid
-            if self.game_state.map.place_tower(self.game_state.mouse.map_grid_x, self.game_state.mouse.map_grid_y):
-                # Create the tower and update the player's money
-                self.create_tower(self.game_state.mouse.current_selection, (self.game_state.mouse.map_grid_x, self.game_state.mouse.map_grid_y))
-                self.game_state.money -= self.game_state.mouse.current_selection(0, 0).cost
-                print(f"Successfully placed tower, tower list is {self.towers}")
-                self.game_state.mouse.change_current_action(None, None)  # Reset mouse action and selection
-            else:
-                self.game_state.ui_manager.select_tile()
-                if self.game_state.mouse.map_grid_x is not None and self.game_state.mouse.map_grid_y is not None:
-                    self.game_state.ui_manager.change_error_message("Invalid Tower Placement")
-        else:
-            if self.game_state.map.check_tile((self.game_state.mouse.map_grid_x, self.game_state.mouse.map_grid_y)) != "outside grid":
-                self.game_state.ui_manager.change_error_message("Not enough money to place tower")
-                self.game_state.mouse.change_current_action(None, None)
-            else:
-                self.game_state.ui_manager.select_tile()
-
-    def remove_tower(self):
-        """
-        Removes a tower from the map grid and deletes the selected tower from the game_state tower dict.
+        if self.game_state.money < tower.cost:
+            return False, "Not enough money to place tower"
 
-        Adds half the value of the tower back to the player's money.
+        # Check if the tower can be placed on the grid
+        if not self.game_state.map.place_tower(grid_x, grid_y):
+            return False, "Invalid Tower Placement"
+
+        # Add the tower and update the player's money
+        self.towers[(grid_x, grid_y)] = tower
+        self.game_state.money -= tower.cost
+        logger.placement("Successfully placed tower, tower list is %s", self.towers)
+        return True, tower.cost
+
+    def remove_tower(self, grid_x, grid_y):
         """
-        self.game_state.money += self.towers[(self.game_state.mouse.current_selection.x_grid_pos, self.game_state.mouse.current_selection.y_grid_pos)].value // 2
-        self.game_state.map.remove_tower(self.game_state.mouse.current_selection.x_grid_pos, self.game_state.mouse.current_selection.y_grid_pos)
-        del self.towers[(self.game_state.mouse.current_selection.x_grid_pos, self.game_state.mouse.current_selection.y_grid_pos)]  # Delete selected tower
-        print(f"Successfully deleted tower, tower list is {self.towers}")
-        self.game_state.mouse.change_current_action(None, None)  # Reset mouse action and selection
+        Removes a tower from the map grid and deletes it from the tower dict.
 
-    def upgrade_tower(self):
+        Adds half the value of the tower back to the player's money.
+
+        Args:
+            grid_x: X grid position of the tower to remove.
+            grid_y: Y grid position of the tower to remove.
+        """
+        self.game_state.record_action("remove_tower", grid_x, grid_y)
+        self.game_state.money += self.towers[(grid_x, grid_y)].value // 2
+        self.game_state.map.remove_tower(grid_x, grid_y)
+        del self.towers[(grid_x, grid_y)]  # Delete selected tower
+        logger.placement("Successfully deleted tower, tower list is %s", self.towers)
+
+    def upgrade_tower(self, grid_x, grid_y):
         """
-        Upgrades the selected tower if the player has enough money.
+        Upgrades a tower if the player has enough money.
 
-        Displays an error message if the upgrade cannot be completed.
+        Args:
+            grid_x: X grid position of the tower to upgrade.
+            grid_y: Y grid position of the tower to upgrade.
+
+        Returns:
+            A tuple (success, result), where result is the cost of the upgrade, or an error message if it failed.
         """
-        result = self.game_state.mouse.current_selection.upgrade(self.game_state.money)
-        print(result)
+        self.game_state.record_action("upgrade_tower", grid_x, grid_y)
+        result = self.towers[(grid_x, grid_y)].upgrade(self.game_state.money)
+        logger.placement("Upgrade result: %s", result)
         if result[0]:
             self.game_state.money -= result[1]  # Deduct cost of upgrade
-        else:
-            self.game_state.ui_manager.change_error_message(result[1])
+        return result
 
     def draw_towers(self, screen):
         """
@@ -97,8 +110,8 @@ class TowerManager:
         Args:
             screen: The game screen where the towers will be drawn.
         """
-        for _, tower in self.towers.items():
-            tower.draw(screen)
+        # Draw every tower in a single call
+        screen.blits([(tower.sprite, (tower.x_pos, tower.y_pos)) for tower in self.towers.values() if tower.sprite is not None], doreturn=False)
 
     def draw(self, screen):
         """
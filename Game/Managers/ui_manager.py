@@ -2,6 +2,8 @@ import pygame
 from UI.Menus.in_game_menu import GameButtons
 from UI.Menus.tower_selection_menu import TowerSelectionMenu
 from Constants import config
+from UI.text_cache import render_text
+from Game.Core import logger
 
 class UIManager:
     """
@@ -43,7 +45,7 @@ class UIManager:
         """
         if self.error_message_display_time > 0:
             if self.error_message:
-                message_text = self.error_font.render(f"Error: {self.error_message}", True, (255, 0, 0))
+                message_text = render_text(self.error_font, f"Error: {self.error_message}", (255, 0, 0))
                 screen.blit(message_text, (0, config.SCREEN_TOPBAR_HEIGHT - 20))
                 self.error_message_display_time -= 1
         else:
@@ -106,10 +108,54 @@ class UIManager:
         if selected_tile in self.game_state.tower_manager.towers:
             selected_tower = self.game_state.tower_manager.towers[selected_tile]
             self.game_state.mouse.change_current_action("Selected Tower", selected_tower)
-            print(f"Successfully selected tower {selected_tower}")
+            logger.placement("Successfully selected tower %s", selected_tower)
         else:
             self.game_state.mouse.change_current_action(None, None)
-            print("Successfully unselected")
+            logger.placement("Successfully unselected")
+
+    def place_selected_tower(self):
+        """
+        Places the tower type selected by the mouse on the grid tile under the mouse pointer.
+
+        Displays an error message if the tower cannot be placed.
+        """
+        mouse = self.game_state.mouse
+        if not mouse.is_on_grid():
+            self.select_tile()  # Clicking outside the grid cancels the placement
+            return
+
+        success, result = self.game_state.tower_manager.place_tower(mouse.current_selection, mouse.map_grid_x, mouse.map_grid_y)
+        if success:
+            mouse.change_current_action(None, None)  # Reset mouse action and selection
+        else:
+            self.select_tile()
+            self.change_error_message(result)
+
+    def sell_selected_tower(self):
+        """
+        Sells the tower currently selected by the mouse.
+        """
+        tower = self.game_state.mouse.current_selection
+        self.game_state.tower_manager.remove_tower(tower.x_grid_pos, tower.y_grid_pos)
+        self.game_state.mouse.change_current_action(None, None)  # Reset mouse action and selection
+
+    def upgrade_selected_tower(self):
+        """
+        Upgrades the tower currently selected by the mouse.
+
+        Displays an error message if the upgrade cannot be completed.
+        """
+        tower = self.game_state.mouse.current_selection
+        success, result = self.game_state.tower_manager.upgrade_tower(tower.x_grid_pos, tower.y_grid_pos)
+        if not success:
+            self.change_error_message(result)
+
+    def cycle_selected_tower_targeting(self):
+        """
+        Switches the tower currently selected by the mouse to its next targeting policy.
+        """
+        if self.game_state.mouse.current_action == "Selected Tower":
+            self.game_state.mouse.current_selection.cycle_targeting()
 
     def highlight_selected_tower(self, screen):
         """
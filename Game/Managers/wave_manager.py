@@ -1,10 +1,12 @@
-import math
-import random
-from Game.Core.game_data import GAME_DATA
+from Game.Core.wave_schedule import WaveSchedule
+from Game.Core import logger
 
 class WaveManager:
     """
     Manages enemy waves in the game.
+
+    Every wave's spawns are worked out up front in a WaveSchedule, which is stepped through with an index while
+    each wave is played.
     """
 
     def __init__(self, game_state):
@@ -16,87 +18,90 @@ class WaveManager:
         """
         self.difficulty = "Normal"
         self.wave_number = 0  # Tracks the current wave number
-        self.spawn_interval = GAME_DATA[self.difficulty]["Default_Spawn_Interval"]
-        self.spawn_cooldown = 0  # Countdown timer for enemy spawning
         self.wave_ongoing = False  # Flag indicating whether a wave is currently active
         self.game_state = game_state  # Stores reference to the game instance
 
-        self.accumulated_spawns = {enemy_name: count for enemy_name, count in GAME_DATA[self.difficulty]["Default_Spawn"].items()}
-        self.enemy_spawn_queue = []
+        self.schedule = None  # Spawns of every wave, worked out when first needed (so the game's generator has been seeded)
+        self.wave_tick = 0  # Ticks since the current wave started
+        self.next_spawn = 0  # Index of the current wave's next spawn
+        self.spawn_ticks = ()  # Spawn ticks of the current wave
+        self.spawn_enemy_ids = ()  # Enemy type ids of the current wave
 
-    def create_enemy_spawn_queue(self, spawn_wave):
+    def get_schedule(self):
         """
-        Creates a spawn queue based on the current wave's spawn details.
+        Gets the spawn schedule for the current difficulty, working it out if it hasn't been already.
 
-        Args:
-            spawn_wave: Dictionary specifying how many enemies of each type to spawn.
-        """
-        for enemy_name, count in spawn_wave.items():
-            for _ in range(int(count)):
-                self.enemy_spawn_queue.append(enemy_name)
-        random.shuffle(self.enemy_spawn_queue)
+        The schedule is read-only, so the UI can use it to preview upcoming waves.
 
-    def initialise_next_spawn_wave(self):
+        Returns:
+            WaveSchedule: The schedule.
         """
-        Initializes the next spawn wave by updating accumulated spawns and creating the spawn queue.
-        """
-        if self.wave_number > 1:
-            for enemy_name, increment in GAME_DATA[self.difficulty]["Increment"].items():
-                self.accumulated_spawns[enemy_name] += increment
-
-        spawn_wave = {enemy_name: math.floor(count) for enemy_name, count in self.accumulated_spawns.items()}
-        self.create_enemy_spawn_queue(spawn_wave)
+        if self.schedule is None or self.schedule.difficulty != self.difficulty:
+            self.schedule = WaveSchedule(self.difficulty, self.game_state.rng)
+        return self.schedule
 
     def spawn_enemies(self):
         """
-        Spawns enemies at regular intervals if there are enemies left in the spawn queue.
+        Spawns the enemies scheduled for the current tick of the wave.
         """
-        if self.spawn_cooldown == 0 and self.enemy_spawn_queue:
-            enemy_name = self.enemy_spawn_queue.pop(0)  # Spawn the first enemy in the queue
+        if self.spawn_ticks[self.next_spawn] == self.wave_tick:
+            enemy_name = self.schedule.enemy_names[self.spawn_enemy_ids[self.next_spawn]]
             self.game_state.enemy_manager.create_enemy(enemy_name)  # Create a new enemy at the designated start position
-            self.spawn_cooldown = self.spawn_interval  # Reset cooldown timer
-        else:
-            self.spawn_cooldown -= 1  # Reduce cooldown timer
+            self.next_spawn += 1
+        self.wave_tick += 1
 
     def start_wave(self):
         """
-        Starts a new wave by initializing the next spawn wave and marking the wave as active.
+        Starts a new wave by loading its spawns from the schedule and marking the wave as active.
         """
-        self.initialise_next_spawn_wave()
+        self.spawn_ticks, self.spawn_enemy_ids = self.get_schedule().get_wave(self.wave_number)
+        self.wave_tick = 0
+        self.next_spawn = 0
         self.wave_ongoing = True  # Mark the wave as active
 
     def next_wave(self):
         """
         Starts the next wave if the current one has ended.
         """
+        self.game_state.record_action("next_wave")
         if not self.wave_ongoing:
             self.wave_number += 1  # Increment wave number
-            if self.spawn_interval > 5:
-                self.spawn_interval -= 1  # Decrease spawn interval to increase wave difficulty
             self.start_wave()  # Start the next wave
         else:
-            print(f"Cannot start next wave yet! Current wave is still ongoing.")
+            logger.spawn("Cannot start next wave yet! Current wave is still ongoing.")
 
     def update(self):
         """
         Updates the wave state, and spawns enemies if a wave is ongoing.
         """
         if self.wave_ongoing:
-            if self.enemy_spawn_queue:
-                self.spawn_enemies()  # Spawn enemies if there are any in the queue
+            if self.next_spawn < len(self.spawn_ticks):
+                self.spawn_enemies()  # Spawn enemies if there are any left to spawn
             else:
                 if len(self.game_state.enemy_manager.enemies) == 0:
-                    print("All enemies are dead! Wave over.")
+                    logger.spawn("All enemies are dead! Wave over.")
                     self.wave_ongoing = False  # Mark the wave as over
 
+    def skip_to_wave(self, wave_number):
+        """
+        Fast-forwards so that the next wave started is the given wave, as if every earlier wave had been played
+        (without spawning any enemies).
+
+        Args:
+            wave_number (int): The wave the next call to next_wave should start.
+        """
+        self.reset_waves()
+        self.wave_number = wave_number - 1
+
     def reset_waves(self):
         """
         Resets all wave-related parameters, typically used when restarting the game.
         """
         self.wave_number = 0
-        self.spawn_cooldown = 0
-        self.spawn_interval = GAME_DATA[self.difficulty]["Default_Spawn_Interval"]
         self.wave_ongoing = False
-        self.accumulated_spawns = {enemy_name: count for enemy_name, count in GAME_DATA[self.difficulty]["Default_Spawn"].items()}
-        self.enemy_spawn_queue = []  # Clear Spawn Queue
-        print(f"Game reset. Difficulty: {self.difficulty}, Starting wave: {self.wave_number}")
+        self.schedule = None  # Worked out again, from the generator's new seed
+        self.wave_tick = 0
+        self.next_spawn = 0
+        self.spawn_ticks = ()  # Clear the spawns left
+        self.spawn_enemy_ids = ()
+        logger.game("Game reset. Difficulty: %s, Starting wave: %s", self.difficulty, self.wave_number)
@@ -0,0 +1,38 @@
+from collections import namedtuple
+from Constants import config
+
+class GridCoord(namedtuple("GridCoord", ("x", "y"))):
+    """
+    A cell of the map grid, as (column, row). Indexes the grid as grid[y][x].
+    """
+    __slots__ = ()
+
+    def to_pixel(self, top=config.SCREEN_TOPBAR_HEIGHT):
+        """
+        Gets the screen position of the cell's top left corner.
+
+        Args:
+            top (int): Y-coordinate of the top of the grid on the screen (below the topbar by default).
+
+        Returns:
+            PixelCoord: The cell's screen position.
+        """
+        return PixelCoord(self.x * config.GRID_CELL_SIZE, self.y * config.GRID_CELL_SIZE + top)
+
+class PixelCoord(namedtuple("PixelCoord", ("x", "y"))):
+    """
+    A position on the screen, in pixels.
+    """
+    __slots__ = ()
+
+    def to_grid(self, top=config.SCREEN_TOPBAR_HEIGHT):
+        """
+        Gets the map grid cell containing the position.
+
+        Args:
+            top (int): Y-coordinate of the top of the grid on the screen (below the topbar by default).
+
+        Returns:
+            GridCoord: The cell (which may be outside the grid).
+        """
+        return GridCoord(int(self.x // config.GRID_CELL_SIZE), int((self.y - top) // config.GRID_CELL_SIZE))
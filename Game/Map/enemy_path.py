@@ -0,0 +1,105 @@
+from Constants import config
+from bisect import bisect_right
+import math
+
+class EnemyPath:
+    """
+    An immutable, arc-length parameterised enemy path shared by every enemy on a map.
+
+    Enemies only store how far along the path they have travelled (their distance); their position,
+    grid cell and progress towards the exit are looked up from the path's precomputed distance table.
+    """
+
+    def __init__(self, waypoints):
+        """
+        Initializes the EnemyPath, precomputing the distance along the path to each waypoint.
+
+        Args:
+            waypoints (list): The (x, y) screen positions the path passes through, in order.
+        """
+        self.waypoints = tuple(tuple(waypoint) for waypoint in waypoints)
+
+        # Cumulative distance from the start of the path to each waypoint
+        distances = [0]
+        for (x1, y1), (x2, y2) in zip(self.waypoints, self.waypoints[1:]):
+            distances.append(distances[-1] + math.hypot(x2 - x1, y2 - y1))
+        self.distances = tuple(distances)
+        self.length = self.distances[-1] if self.waypoints else 0  # Total length of the path in pixels
+
+        # Grid paths are made of equal length segments, so the segment at a distance can be found by division
+        segment_lengths = {distances[i + 1] - distances[i] for i in range(len(distances) - 1)}
+        self.segment_length = segment_lengths.pop() if len(segment_lengths) == 1 else None
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of waypoints on the path.
+        """
+        return len(self.waypoints)
+
+    def get_segment(self, distance):
+        """
+        Finds the index of the path segment (between waypoint i and i + 1) a distance along the path falls on.
+
+        Args:
+            distance (float): Distance along the path in pixels.
+
+        Returns:
+            int: The index of the segment's first waypoint.
+        """
+        if self.segment_length:
+            segment = int(distance // self.segment_length)  # Constant time for equal length segments
+        else:
+            segment = bisect_right(self.distances, distance) - 1
+        return max(0, min(segment, len(self.waypoints) - 2))
+
+    def get_position(self, distance):
+        """
+        Gets the screen position a distance along the path.
+
+        Args:
+            distance (float): Distance along the path in pixels (clamped to the path's start and end).
+
+        Returns:
+            tuple: The (x, y) screen position, rounded to whole pixels.
+        """
+        if not self.waypoints:
+            return (0, 0)
+        if len(self.waypoints) == 1:
+            return self.waypoints[0]
+
+        segment = self.get_segment(distance)
+        (x1, y1), (x2, y2) = self.waypoints[segment], self.waypoints[segment + 1]
+        start, end = self.distances[segment], self.distances[segment + 1]
+
+        # Interpolate between the segment's waypoints
+        fraction = min(max((distance - start) / (end - start), 0), 1) if end > start else 0
+        return (round(x1 + (x2 - x1) * fraction), round(y1 + (y2 - y1) * fraction))
+
+    def get_grid_position(self, distance):
+        """
+        Gets the map grid cell containing the centre of an enemy a distance along the path.
+
+        Args:
+            distance (float): Distance along the path in pixels.
+
+        Returns:
+            tuple: The (x, y) grid position.
+        """
+        x, y = self.get_position(distance)
+        return ((x + config.GRID_CELL_SIZE // 2) // config.GRID_CELL_SIZE,
+                ((y + config.GRID_CELL_SIZE // 2) - config.SCREEN_TOPBAR_HEIGHT) // config.GRID_CELL_SIZE)
+
+    def get_progress(self, distance):
+        """
+        Gets how far along the path a distance is, as a fraction of the path's length.
+
+        Args:
+            distance (float): Distance along the path in pixels.
+
+        Returns:
+            float: 0 at the start of the path, up to 1 at the exit.
+        """
+        if self.length == 0:
+            return 1
+        return min(distance / self.length, 1)
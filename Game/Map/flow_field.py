@@ -0,0 +1,348 @@
+from collections import deque
+from heapq import heapify, heappop, heappush
+from Game.Core import logger
+from Game.Map.coordinates import GridCoord
+from Game.Map.grid_path import GridPath
+
+PATH_TILE = 1  # Tiles enemies walk along
+SPAWN_TILE = 3  # Where enemies enter the map
+EXIT_TILE = 4  # Where enemies leave the map
+WALKABLE_TILES = (PATH_TILE, SPAWN_TILE)
+LAYOUT_TILES = (PATH_TILE, SPAWN_TILE, EXIT_TILE)  # The only tiles routes depend on (towers don't change them)
+
+# Order neighbours are listed in (up, down, left, right) - the first is taken at a fork when no choice is made
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+MAX_CACHED_FIELDS = 64  # Layouts kept in the cache before the oldest is dropped
+
+# Maps each layout (see get_layout_key) to its spawns and distance map, so reloading a map doesn't search it again
+flow_field_cache = {}
+
+def get_layout_key(grid, weights):
+    """
+    Gets a key identifying a grid's route layout - only its path, spawn and exit tiles, so placing towers doesn't
+    change it - and the weights of its forks.
+
+    Args:
+        grid (list): The map grid, as rows of tile values.
+        weights (dict): The weight of each weighted tile.
+
+    Returns:
+        tuple: The grid's width, its layout as bytes, and its weights.
+    """
+    return (len(grid[0]) if grid else 0,
+            bytes(tile if tile in LAYOUT_TILES else 0 for row in grid for tile in row),
+            tuple(sorted(weights.items())))
+
+def find_tiles(grid, tile):
+    """
+    Finds every tile of a type, scanning rows from the top.
+
+    Args:
+        grid (list): The map grid, as rows of tile values.
+        tile (int): The tile type to find.
+
+    Returns:
+        tuple: The GridCoord of each tile found.
+    """
+    return tuple(GridCoord(x, y) for y, row in enumerate(grid) for x, value in enumerate(row) if value == tile)
+
+def get_neighbours(grid, cell):
+    """
+    Gets the cells next to a cell, inside the grid.
+
+    Args:
+        grid (list): The map grid, as rows of tile values.
+        cell (GridCoord): The cell.
+
+    Returns:
+        list: The neighbouring cells, in DIRECTIONS order.
+    """
+    x, y = cell
+    return [GridCoord(x + dx, y + dy) for dx, dy in DIRECTIONS
+            if 0 <= y + dy < len(grid) and 0 <= x + dx < len(grid[0])]
+
+def find_distances(grid, blocked=()):
+    """
+    Works out how many steps each tile enemies can walk on is from the nearest exit (a breadth-first search from every
+    exit at once), without using the cache.
+
+    Args:
+        grid (list): The map grid, as rows of tile values.
+        blocked (set, optional): Tiles to treat as unwalkable (e.g. the tiles a route has already walked through).
+
+    Returns:
+        dict: Maps each cell that can reach an exit (and each exit, at 0) to its distance in steps.
+    """
+    distances = {}
+    queue = deque()
+    for exit_cell in find_tiles(grid, EXIT_TILE):
+        distances[exit_cell] = 0
+        queue.append(exit_cell)
+
+    while queue:
+        cell = queue.popleft()
+        for neighbour in get_neighbours(grid, cell):
+            if neighbour not in distances and neighbour not in blocked and grid[neighbour.y][neighbour.x] in WALKABLE_TILES:
+                distances[neighbour] = distances[cell] + 1
+                queue.append(neighbour)
+    return distances
+
+class FlowField:
+    """
+    The distance from every walkable tile of a map to its nearest exit, shared by every enemy on the map.
+
+    An enemy's next step from any tile is a neighbour one step closer to an exit, so it is looked up in constant time
+    however many enemies there are. Where several neighbours are equally close (a fork between branches of the same
+    length, or exits the same distance away), one is chosen at random, in proportion to the weights of the branches'
+    first tiles. A longer branch is only taken if its first tile has a weight (see get_route) - unweighted routes are
+    always shortest ones.
+
+    Distance maps are looked up in a cache keyed by the grid's layout, so reloading a map doesn't search it again. When a
+    tile changes, only the distances that depended on it are worked out again.
+    """
+
+    def __init__(self, grid, weights=None):
+        """
+        Initializes the FlowField, searching the grid if its layout isn't cached.
+
+        Args:
+            grid (list): The map grid, as rows of tile values. Shared with the Grid, so changes must be passed to
+                update_tile.
+            weights (dict, optional): Maps (x, y) tiles to the relative chance of taking them at a fork (1 if not given).
+        """
+        self.grid = grid
+        self.weights = {GridCoord(*cell): weight for cell, weight in (weights or {}).items()}
+        self.route_choices = None  # Whether enemies can take more than one route (worked out when first needed)
+
+        key = get_layout_key(grid, self.weights)
+        cached = flow_field_cache.get(key)
+        if cached is None:
+            cached = (find_tiles(grid, SPAWN_TILE), find_distances(grid))
+            if len(flow_field_cache) >= MAX_CACHED_FIELDS:
+                del flow_field_cache[next(iter(flow_field_cache))]  # Drop the oldest layout
+            flow_field_cache[key] = cached
+        self.spawns = cached[0]  # Every spawn point, from the top of the grid
+        self.distances = dict(cached[1])  # Copied, as update_tile changes it
+
+    def is_walkable(self, cell):
+        """
+        Checks whether enemies can walk on a tile (a path tile or spawn point).
+
+        Args:
+            cell (GridCoord): The tile.
+
+        Returns:
+            bool: True if the tile is walkable.
+        """
+        return self.grid[cell.y][cell.x] in WALKABLE_TILES
+
+    def get_distance(self, cell):
+        """
+        Gets how many steps a tile is from the nearest exit.
+
+        Args:
+            cell (GridCoord): The tile.
+
+        Returns:
+            int: The distance in steps, or None if no exit can be reached from the tile.
+        """
+        return self.distances.get(cell)
+
+    def get_next_steps(self, cell):
+        """
+        Gets the tiles an enemy can step to from a tile - its neighbours one step closer to an exit.
+
+        Args:
+            cell (GridCoord): The tile.
+
+        Returns:
+            tuple: The next tiles (more than one at a fork), empty at an exit or where no exit can be reached.
+        """
+        distance = self.distances.get(cell)
+        if not distance:
+            return ()
+        return tuple(neighbour for neighbour in get_neighbours(self.grid, cell) if self.distances.get(neighbour) == distance - 1)
+
+    def choose(self, cells, rng=None):
+        """
+        Chooses between tiles at random, in proportion to their weights.
+
+        Args:
+            cells (tuple): The tiles to choose between.
+            rng (random.Random, optional): The random number generator to choose with (the first tile is taken if not given).
+
+        Returns:
+            GridCoord: The chosen tile, or None if there are none to choose from.
+        """
+        if len(cells) > 1 and rng is not None:
+            return rng.choices(cells, weights=[self.weights.get(cell, 1) for cell in cells])[0]
+        return cells[0] if cells else None
+
+    def choose_spawn(self, rng=None):
+        """
+        Chooses the spawn point an enemy enters from, out of those with a route to an exit.
+
+        Args:
+            rng (random.Random, optional): The random number generator to choose with (the first spawn is taken if not given).
+
+        Returns:
+            GridCoord: The spawn point, or None if the grid has none.
+        """
+        spawns = tuple(spawn for spawn in self.spawns if spawn in self.distances) or self.spawns
+        return self.choose(spawns, rng)
+
+    def get_route(self, spawn=None, rng=None):
+        """
+        Follows the flow field from a spawn point to the tile before an exit, choosing a branch at each fork.
+
+        Args:
+            spawn (GridCoord, optional): The spawn point to start from (chosen with choose_spawn if not given).
+            rng (random.Random, optional): The random number generator to choose with (the first spawn and branches are
+                taken if not given).
+
+        Returns:
+            GridPath: The route.
+        """
+        if spawn is None:
+            spawn = self.choose_spawn(rng)
+        if spawn is None:
+            logger.path("Start position (3) not found in the grid.")
+            return GridPath(())
+        if spawn not in self.distances:
+            logger.path("No route from %s to an exit (4).", spawn)
+            return GridPath((spawn,))
+
+        # Enemies leave the map as they reach the tile next to an exit
+        cells = [spawn]
+        visited = {spawn}
+        distances = self.distances  # Distances to an exit without going back over the route (the same, until a detour)
+        while distances[cells[-1]] > 1:
+            cell = cells[-1]
+            steps = tuple(neighbour for neighbour in get_neighbours(self.grid, cell) if distances.get(neighbour) == distances[cell] - 1)
+
+            # A weighted branch can be taken even if it is longer, as long as an exit can still be reached from it
+            # without going back over the route. The distances are searched again around the route to check, and
+            # followed from then on (weighted tiles are rare, so this is rarely needed)
+            detours = [neighbour for neighbour in get_neighbours(self.grid, cell) if neighbour in self.weights
+                       and neighbour not in steps and neighbour not in visited and self.is_walkable(neighbour)]
+            if detours:
+                distances = find_distances(self.grid, blocked=visited)
+                steps += tuple(neighbour for neighbour in detours if neighbour in distances)
+
+            cells.append(self.choose(steps, rng))
+            visited.add(cells[-1])
+        return GridPath(cells)
+
+    def has_route_choices(self):
+        """
+        Checks whether enemies can take more than one route (there are several spawn points, a fork between branches of
+        the same length, or a weighted tile next to the path that isn't a step towards an exit).
+
+        Returns:
+            bool: True if routes have to be chosen.
+        """
+        if self.route_choices is None:
+            spawns = [spawn for spawn in self.spawns if spawn in self.distances]
+            self.route_choices = (len(spawns) > 1 or any(len(self.get_next_steps(cell)) > 1 for cell in self.distances)
+                                  or any(self.is_detour(cell) for cell in self.weights))
+        return self.route_choices
+
+    def is_detour(self, cell):
+        """
+        Checks whether a tile could be taken as a longer branch - it can reach an exit, and is next to a tile it isn't a
+        step towards an exit from.
+
+        Args:
+            cell (GridCoord): The tile.
+
+        Returns:
+            bool: True if the tile could be a detour.
+        """
+        if cell not in self.distances:
+            return False
+        return any(self.distances.get(neighbour, 0) > 0 and cell not in self.get_next_steps(neighbour)
+                   for neighbour in get_neighbours(self.grid, cell))
+
+    def update_tile(self, grid_x, grid_y, old_tile):
+        """
+        Patches the flow field after a tile has changed, working out only the distances that depended on it.
+
+        Args:
+            grid_x (int): X-coordinate of the changed tile.
+            grid_y (int): Y-coordinate of the changed tile.
+            old_tile (int): The tile's value before the change.
+
+        Returns:
+            bool: Whether any route could have changed.
+        """
+        new_tile = self.grid[grid_y][grid_x]
+        if old_tile == new_tile or (old_tile not in LAYOUT_TILES and new_tile not in LAYOUT_TILES):
+            return False  # Towers don't change the routes
+
+        self.route_choices = None
+        if SPAWN_TILE in (old_tile, new_tile):
+            self.spawns = find_tiles(self.grid, SPAWN_TILE)
+        if (old_tile in WALKABLE_TILES) == (new_tile in WALKABLE_TILES) and EXIT_TILE not in (old_tile, new_tile):
+            return True  # A path tile became a spawn point (or the other way round), which doesn't change any distance
+
+        cell = GridCoord(grid_x, grid_y)
+        self.remove_distance(cell)
+        if new_tile == EXIT_TILE:
+            self.lower_distances([(0, cell)])
+        elif new_tile in WALKABLE_TILES:
+            neighbour_distances = [self.distances[neighbour] for neighbour in get_neighbours(self.grid, cell) if neighbour in self.distances]
+            if neighbour_distances:
+                self.lower_distances([(min(neighbour_distances) + 1, cell)])
+        return True
+
+    def remove_distance(self, cell):
+        """
+        Removes a tile's distance, along with the distances of the tiles whose only shortest routes went through it, and
+        works those out again from the tiles around them.
+
+        Args:
+            cell (GridCoord): The tile, which can no longer be walked through (or is no longer an exit).
+        """
+        if cell not in self.distances:
+            return
+
+        # Tiles are lost if every one of their next steps is lost. Searching outwards from the tile checks them in order
+        # of distance, so all of a tile's next steps have been checked before it is
+        lost = {cell}
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            for neighbour in get_neighbours(self.grid, current):
+                if neighbour not in lost and self.distances.get(neighbour) == self.distances[current] + 1:
+                    if all(step in lost for step in self.get_next_steps(neighbour)):
+                        lost.add(neighbour)
+                        queue.append(neighbour)
+        for lost_cell in lost:
+            del self.distances[lost_cell]
+
+        # Work the lost tiles out again, starting from the tiles next to them that kept their distances
+        seeds = []
+        for lost_cell in lost:
+            if self.is_walkable(lost_cell):
+                neighbour_distances = [self.distances[neighbour] for neighbour in get_neighbours(self.grid, lost_cell) if neighbour in self.distances]
+                if neighbour_distances:
+                    seeds.append((min(neighbour_distances) + 1, lost_cell))
+        self.lower_distances(seeds)
+
+    def lower_distances(self, seeds):
+        """
+        Lowers the distances of tiles, and of every tile that is now closer to an exit through them.
+
+        Args:
+            seeds (list): (distance, cell) of the tiles to lower.
+        """
+        heapify(seeds)
+        while seeds:
+            distance, cell = heappop(seeds)
+            if self.distances.get(cell, distance + 1) <= distance:
+                continue  # Already as close
+            self.distances[cell] = distance
+            for neighbour in get_neighbours(self.grid, cell):
+                if self.is_walkable(neighbour) and self.distances.get(neighbour, distance + 2) > distance + 1:
+                    heappush(seeds, (distance + 1, neighbour))
@@ -1,5 +1,6 @@
 import pygame
 from Constants import config
+from Game.Map.flow_field import FlowField
 
 class Grid:
     """
@@ -7,15 +8,39 @@ class Grid:
     The grid is used to manage tiles, check for types, and draw the grid on the screen.
     """
 
-    def __init__(self, grid):
+    # Colour of each tile type
+    TILE_COLOURS = {
+        0: (0, 100, 0),  # Dark Green for empty/tower tiles
+        2: (0, 100, 0),
+        1: (200, 140, 0),  # Orange for path tiles
+        3: (0, 200, 0),  # Green for starting point tiles
+        4: (200, 0, 0)  # Red for ending point tiles
+    }
+
+    def __init__(self, grid, route_weights=None):
         """
         Initializes the Grid instance.
         
         Args:
             grid: A 2D list representing the grid structure. Each cell in the list
                   corresponds to a tile in the grid.
+            route_weights: Optional dict mapping (x, y) tiles to the relative chance of enemies taking them at a fork.
+        """
+        self.grid = grid
+        self.route_weights = route_weights or {}
+        self.flow_field = None  # Distance from each tile to the nearest exit, found when first needed and patched as tiles change
+        self.path = None  # The default enemy path (from the first spawn, taking the first branch at each fork)
+
+    def reset(self, grid):
+        """
+        Replaces the grid's contents (e.g. to restore a map's original layout).
+
+        Args:
+            grid: A 2D list representing the new grid structure.
         """
         self.grid = grid
+        self.flow_field = None
+        self.path = None
 
     def check_tile(self, grid_coords):
         """
@@ -58,7 +83,10 @@ class Grid:
             raise IndexError("Coordinates are out of bounds.")
 
         # Set the tile type at the specified grid coordinates
+        old_tile = self.grid[grid_y][grid_x]
         self.grid[grid_y][grid_x] = tile
+        if self.flow_field is not None and self.flow_field.update_tile(grid_x, grid_y, old_tile):
+            self.path = None  # Only searched again if the change affects the routes
 
     def draw(self, screen):
         """
@@ -69,36 +97,38 @@ class Grid:
         """
         self.draw_grid(screen)
 
-    def draw_grid(self, screen):
+    def draw_grid(self, screen, top=config.SCREEN_TOPBAR_HEIGHT):
         """
         Draws the grid lines and visualizes tile types (path, tower, empty).
         
         Args:
             screen: pygame display surface where the grid and tiles will be drawn.
+            top: Y-coordinate of the top of the grid on the surface (below the topbar by default).
         """
         for y, row in enumerate(self.grid):
             for x, cell in enumerate(row):
-                rect = self.get_tile_rect(x, y)
+                rect = self.get_tile_rect(x, y, top)
                 self.draw_tile(screen, rect, cell)
 
         # Draw a border around the entire grid
-        border_rect = pygame.Rect(0, config.SCREEN_TOPBAR_HEIGHT, config.GRID_SIZE, config.GRID_SIZE)
+        border_rect = pygame.Rect(0, top, config.GRID_SIZE, config.GRID_SIZE)
         pygame.draw.rect(screen, (0, 0, 255), border_rect, 1)  # Blue border
 
-    def get_tile_rect(self, x, y):
+    def get_tile_rect(self, x, y, top=config.SCREEN_TOPBAR_HEIGHT):
         """
         Get the screen rectangle for a given grid position.
         
         Args:
             x: X-coordinate of the grid.
             y: Y-coordinate of the grid.
+            top: Y-coordinate of the top of the grid on the screen.
         
         Returns:
             A pygame.Rect object for the tile's screen position.
         """
         return pygame.Rect(
             x * config.GRID_CELL_SIZE + config.OFFSET_FROM_GRID,
-            y * config.GRID_CELL_SIZE + config.SCREEN_TOPBAR_HEIGHT + config.OFFSET_FROM_GRID,
+            y * config.GRID_CELL_SIZE + top + config.OFFSET_FROM_GRID,
             config.GRID_CELL_SIZE - config.OFFSET_FROM_GRID * 2,
             config.GRID_CELL_SIZE - config.OFFSET_FROM_GRID * 2
         )
@@ -112,14 +142,7 @@ class Grid:
             rect: Rectangle defining the position and size of the tile.
             cell: Tile type (0, 1, 2, etc.).
         """
-        color_map = {
-            0: (0, 100, 0),  # Dark Green for empty/tower tiles
-            2: (0, 100, 0),
-            1: (200, 140, 0),  # Orange for path tiles
-            3: (0, 200, 0),  # Green for starting point tiles
-            4: (200, 0, 0)  # Red for ending point tiles
-        }
-        color = color_map.get(cell, (0, 0, 0))  # Default to black if no match
+        color = self.TILE_COLOURS.get(cell, (0, 0, 0))  # Default to black if no match
         pygame.draw.rect(screen, color, rect)
 
     def highlight_square(self, screen, grid_x, grid_y, colour=(255, 0, 0)):
@@ -137,75 +160,44 @@ class Grid:
         else:
             raise TypeError("Invalid grid coordinates")
 
+    def get_flow_field(self):
+        """
+        Gets the flow field enemies follow from the start points (3) to the end points (4).
+
+        Returns:
+            FlowField: The grid's flow field.
+        """
+        if self.flow_field is None:
+            self.flow_field = FlowField(self.grid, self.route_weights)
+        return self.flow_field
+
+    def get_path(self):
+        """
+        Gets the default enemy path through the grid - from the first start point (3), taking the first branch at each
+        fork.
+
+        Returns:
+            GridPath: The path, with grid and pixel coordinate views of its cells.
+        """
+        if self.path is None:
+            self.path = self.get_flow_field().get_route()
+        return self.path
+
     def find_path(self):
         """
-        Finds the path from the start point (3) to the end point (4) using a basic pathfinding method.
-        
+        Finds the default path from the start point (3) along the path tiles (1) to the end point (4).
+
         Returns:
-            A list of screen positions representing the enemy's path.
-        """
-        start = None
-        for r in range(len(self.grid)):
-            for c in range(len(self.grid[r])):
-                if self.grid[r][c] == 3:  # Look for the start marker
-                    start = (r, c)
-                    break
-            if start:
-                break
-
-        if not start:
-            print("Start position (3) not found in the grid.")
-            return []  # Return an empty list if start not found
-
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Movement directions
-        path = [start]
-        visited = set([start])
-        current_position = start
-
-        while True:
-            found_next_step = False
-            possible_moves = []
-
-            # Check all possible directions
-            for dr, dc in directions:
-                nr, nc = current_position[0] + dr, current_position[1] + dc
-
-                # Ensure we stay within bounds, check for valid path (1), and avoid revisiting cells
-                if 0 <= nr < len(self.grid) and 0 <= nc < len(self.grid[0]):
-                    if self.grid[nr][nc] == 1 and (nr, nc) not in visited:
-                        possible_moves.append((nr, nc))
-
-            if not possible_moves:
-                print(f"Dead end reached at {current_position}, breaking out.")
-                break  # No valid path found, exit loop
-
-            next_position = possible_moves[0]  # Pick the first valid move
-
-            # Add the next position to the path and mark it as visited
-            visited.add(next_position)
-            path.append(next_position)
-            current_position = next_position
-
-            print(f"Moving from {current_position} to {next_position}")
-
-        # Convert the path coordinates into screen positions
-        path_positions = []
-        for coordinate in path:
-            x, y = coordinate[1] * config.GRID_CELL_SIZE, coordinate[0] * config.GRID_CELL_SIZE + config.SCREEN_TOPBAR_HEIGHT
-            path_positions.append((x, y))
-
-        return path_positions
-        
+            A list of screen positions (PixelCoord) representing the enemy's path.
+        """
+        return list(self.get_path().get_pixel_coords())
+
     def find_enemy_start_pos(self):
         """
         Finds the starting position of the enemy (3).
-        
+
         Returns:
             A tuple of (x, y) coordinates representing the enemy's start position.
         """
-        for row_num, row in enumerate(self.grid):
-            for column_num, space in enumerate(row):
-                if space == 3:
-                    x, y = column_num * config.GRID_CELL_SIZE, row_num * config.GRID_CELL_SIZE + config.SCREEN_TOPBAR_HEIGHT
-                    return (x, y)
-        return (0, 0)
+        cells = self.get_path().get_grid_coords()
+        return cells[0].to_pixel() if cells else (0, 0)
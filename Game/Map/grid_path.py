@@ -0,0 +1,46 @@
+from Constants import config
+
+class GridPath:
+    """
+    A route enemies take through a map grid, as the cells they walk through from a spawn point (see FlowField.get_route).
+
+    Routes are never patched themselves: caching by layout and patching after tile changes are done on the FlowField's
+    distances, which every route is followed from.
+    """
+
+    def __init__(self, cells):
+        """
+        Initializes the GridPath.
+
+        Args:
+            cells (iterable): The GridCoord of each cell on the route, in order.
+        """
+        self.cells = tuple(cells)
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of cells on the path.
+        """
+        return len(self.cells)
+
+    def get_grid_coords(self):
+        """
+        Gets the cells of the path.
+
+        Returns:
+            tuple: The GridCoord of each cell, from the start.
+        """
+        return self.cells
+
+    def get_pixel_coords(self, top=config.SCREEN_TOPBAR_HEIGHT):
+        """
+        Gets the screen positions of the path's cells (their top left corners).
+
+        Args:
+            top (int): Y-coordinate of the top of the grid on the screen (below the topbar by default).
+
+        Returns:
+            tuple: The PixelCoord of each cell, from the start.
+        """
+        return tuple(cell.to_pixel(top) for cell in self.cells)
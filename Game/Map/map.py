@@ -2,7 +2,9 @@ import pygame
 from Constants import config
 from Constants import sprites
 from Game.Map.grid import Grid
+from Game.Map.enemy_path import EnemyPath
 from Game.Map.maps import MAP_DATA
+from Game.Core import logger
 import copy
 
 class Map:
@@ -25,12 +27,17 @@ class Map:
         if name not in MAP_DATA:
             raise ValueError(f"Map {name} not found")
         
-        self.map_grid = Grid(copy.deepcopy(MAP_DATA[name]["grid"]))
-        self.background_image = sprites.MARSH_MALLOWS_SPRITE  # Placeholder background
+        self.map_grid = Grid(copy.deepcopy(MAP_DATA[name]["grid"]), MAP_DATA[name].get("route_weights"))
+        self.background_image = "MARSH_MALLOWS_SPRITE"  # Placeholder background (the sprite is loaded when the map is first drawn)
         self.music = MAP_DATA[name]["music"]
+        self.enemy_paths = {}  # Maps the cells of each route enemies have taken to the EnemyPath shared by enemies on it
         self.enemy_path = self.determine_enemy_path()
         self.enemy_start_pos = self.determine_enemy_start_pos()
 
+        # The background, tiles and border pre-rendered onto one surface, rebuilt only when the grid changes
+        self.static_layer = None
+        self.static_layer_background = None  # The draw_background flag the static layer was rendered with
+
     def draw(self, screen, draw_background=False, **kwargs):
         """
         Renders the map background and grid.
@@ -39,11 +46,34 @@ class Map:
             screen: pygame display surface.
             draw_background: Boolean flag to control background rendering.
         """
+        if self.static_layer is None or self.static_layer_background != draw_background:
+            self.static_layer = self.render_static_layer(draw_background)
+            self.static_layer_background = draw_background
+        screen.blit(self.static_layer, (0, config.SCREEN_TOPBAR_HEIGHT))
+
+    def render_static_layer(self, draw_background=False):
+        """
+        Renders the parts of the map that only change when the grid does (background, tiles and border) onto a surface.
+        
+        Args:
+            draw_background: Boolean flag to control background rendering.
+        
+        Returns:
+            pygame.Surface: The rendered map, the size of the grid.
+        """
+        layer = pygame.Surface((config.GRID_SIZE, config.GRID_SIZE))
         if draw_background:
-            screen.blit(self.background_image, (0, config.SCREEN_TOPBAR_HEIGHT))
+            layer.blit(sprites.get_sprite(self.background_image), (0, 0))
         else:
-            pygame.draw.rect(screen, (200, 200, 200), (0, config.SCREEN_TOPBAR_HEIGHT, config.GRID_SIZE, config.GRID_SIZE)) # Static white colour background
-        self.map_grid.draw(screen)
+            layer.fill((200, 200, 200))  # Static white colour background
+        self.map_grid.draw_grid(layer, top=0)
+        return layer
+
+    def invalidate_static_layer(self):
+        """
+        Discards the pre-rendered map, so it is rendered again the next time the map is drawn.
+        """
+        self.static_layer = None
 
     def preview_tower_placement_square(self, screen, grid_x, grid_y):
         """
@@ -85,10 +115,11 @@ class Map:
         """
         if self.check_tile((x, y)) == "empty space":
             self.map_grid.set_tile(2, x, y)  # Set tower on the grid
-            print(f"Successfully placed tower at ({x}, {y})")
+            self.invalidate_static_layer()
+            logger.placement("Successfully placed tower at (%s, %s)", x, y)
             return True
         else:
-            print(f"Failed to place tower at ({x}, {y}): Invalid tile")
+            logger.placement("Failed to place tower at (%s, %s): Invalid tile", x, y)
             return False
         
     def remove_tower(self, x, y):
@@ -104,10 +135,11 @@ class Map:
         """
         if self.map_grid.check_tile((x, y)) == "tower":
             self.map_grid.set_tile(0, x, y)  # Reset tile to empty
-            print(f"Successfully removed tower at ({x}, {y})")
+            self.invalidate_static_layer()
+            logger.placement("Successfully removed tower at (%s, %s)", x, y)
             return True
         else:
-            print(f"Failed to remove tower at ({x}, {y}): No tower found")
+            logger.placement("Failed to remove tower at (%s, %s): No tower found", x, y)
             return False
 
     def determine_enemy_path(self):
@@ -115,9 +147,39 @@ class Map:
         Determines the enemy path based on the grid layout.
         
         Returns:
-            list: A list representing the path enemies will follow.
+            EnemyPath: The default path enemies will follow, with its distance table precomputed.
+        """
+        return self.get_enemy_path(self.map_grid.get_path())
+
+    def get_enemy_path(self, route):
+        """
+        Gets the EnemyPath for a route through the grid, creating it the first time the route is taken.
+
+        Args:
+            route (GridPath): The route.
+
+        Returns:
+            EnemyPath: The path shared by every enemy on the route.
+        """
+        enemy_path = self.enemy_paths.get(route.cells)
+        if enemy_path is None:
+            enemy_path = self.enemy_paths[route.cells] = EnemyPath(route.get_pixel_coords())
+        return enemy_path
+
+    def choose_enemy_path(self, rng):
+        """
+        Chooses the path a new enemy takes - its spawn point, and its branch at each fork.
+
+        Args:
+            rng (random.Random): The random number generator to choose with (only used if there is a choice to make).
+
+        Returns:
+            EnemyPath: The chosen path.
         """
-        return self.map_grid.find_path()
+        flow_field = self.map_grid.get_flow_field()
+        if not flow_field.has_route_choices():
+            return self.enemy_path  # Every enemy takes the same path
+        return self.get_enemy_path(flow_field.get_route(rng=rng))
 
     def determine_enemy_start_pos(self):
         """
@@ -132,5 +194,6 @@ class Map:
         """
         Resets the map grid to its default state, removing any placed towers.
         """
-        self.map_grid.grid = copy.deepcopy(MAP_DATA[self.name]["grid"])
-        print(f"Map {self.name} reset successfully.")
+        self.map_grid.reset(copy.deepcopy(MAP_DATA[self.name]["grid"]))
+        self.invalidate_static_layer()
+        logger.game("Map %s reset successfully.", self.name)
@@ -32,5 +32,27 @@ MAP_DATA = {
         "music": "forest_theme.mp3"
 
 
+    },
+    "Fondue_Fork": {
+        # Two spawn points join, fork around a block and join again, then split between two exits. Forks are
+        # between branches of equal length (a weighted branch could also be longer)
+        "grid": [
+            [3, 0, 0, 0, 0, 0, 0, 0, 0, 3],
+            [1, 0, 0, 0, 0, 0, 0, 0, 0, 1],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            [0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
+            [0, 0, 1, 1, 1, 1, 1, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 1, 1, 1, 1, 1, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
+            [4, 1, 1, 1, 1, 1, 1, 1, 4, 0],
+        ],
+        # Relative chance of enemies taking each (x, y) tile at a fork (1 if not listed)
+        "route_weights": {
+            (5, 4): 2,  # Two thirds of enemies go right around the block
+        },
+        "background": "motivational_quote.png",
+        "music": "forest_theme.mp3"
     }
 }
\ No newline at end of file
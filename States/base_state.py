@@ -1,5 +1,28 @@
 from abc import ABC, abstractmethod
 import pygame
+from UI.text_cache import render_text
+from Constants import config
+
+def merge_overlapping(rects):
+    """
+    Merges rectangles that overlap into their bounding rectangles, leaving separate ones apart.
+
+    Args:
+        rects (list): The rectangles (pygame.Rect).
+
+    Returns:
+        list: Rectangles covering the same areas, none of which overlap.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # Grow the rectangle over every merged one it touches, until it touches none (growing can reach new ones)
+        overlapping = rect.collidelist(merged)
+        while overlapping != -1:
+            rect.union_ip(merged.pop(overlapping))
+            overlapping = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
 
 class State(ABC):
     """
@@ -19,6 +42,12 @@ class State(ABC):
         self.game = game
         self.debug_font = pygame.font.Font(None, 25)  # Font for displaying debug information (FPS)
 
+        # Dirty rectangle rendering (see draw_dirty)
+        self.redraw_all = True  # Whether the whole screen must be redrawn next frame (e.g. after switching to this state)
+        self.region_keys = {}  # What each region of the screen looked like when last drawn
+        self.moving_rects = []  # Areas covered by moving objects when last drawn
+        self.invalid_rects = []  # Areas drawn over since the last frame (e.g. by the profiler overlay)
+
     @abstractmethod
     def update(self, events):
         """
@@ -31,6 +60,24 @@ class State(ABC):
         """
         pass
 
+    def tick(self):
+        """
+        Advances the state's game logic by a single fixed-size tick.
+
+        Unlike update(), which runs once per frame, this is called at a fixed rate (config.TICK_RATE, 
+        scaled by the game speed). States with no game logic can leave it empty.
+        """
+        pass
+
+    def is_simulating(self):
+        """
+        Checks whether the state is running game logic that can be fast-forwarded (see Game.update_ticks).
+
+        Returns:
+            bool: False by default, for states with nothing to simulate (menus, pause).
+        """
+        return False
+
     @abstractmethod
     def draw(self, screen):
         """
@@ -43,6 +90,106 @@ class State(ABC):
         """
         pass
 
+    def get_regions(self, *args):
+        """
+        Gets the regions of the screen the state draws, with a key describing what each one currently shows.
+
+        A region is redrawn in dirty rectangle mode whenever its key changes. Subclasses extend this with
+        their own regions (buttons, text, etc.).
+
+        Args:
+            *args: The same arguments as display_debug_info (the first is the FPS).
+
+        Returns:
+            dict: Maps each region's name to a (pygame.Rect, key) pair.
+        """
+        fps = args[0] if args else None
+        return {"Debug": (pygame.Rect(0, 0, 100, 20), fps)}
+
+    def get_menu_regions(self, menu):
+        """
+        Gets the regions of the screen a menu covers: the whole menu, which is redrawn when the menu or the settings it
+        shows change (the options and pause menus show the difficulty and practise mode), and each button, which is
+        redrawn when it is hovered or clicked.
+
+        Args:
+            menu: The menu being shown.
+
+        Returns:
+            dict: Maps each region's name to a (pygame.Rect, key) pair.
+        """
+        game_state = self.game.state_manager.states["Game_State"]
+        regions = {"Menu": (pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT),
+                            (id(menu), game_state.difficulty, game_state.practise))}
+        regions.update(menu.get_button_regions())
+        return regions
+
+    def get_moving_rects(self):
+        """
+        Gets the areas of the screen covered by moving objects, which are redrawn every frame in dirty rectangle mode.
+
+        Returns:
+            list: A pygame.Rect for each moving object (none by default).
+        """
+        return []
+
+    def draw_dirty(self, screen, *args):
+        """
+        Redraws only the parts of the screen that changed since the last frame.
+
+        The changed parts are the regions whose key changed (see get_regions), and the areas moving objects
+        covered last frame and cover now. Overlapping parts are merged, and the state is drawn once per frame, clipped
+        to the area around them (drawing can change the state, e.g. count down how long a message is shown). Only the
+        separate parts are updated on the display. When there are too many parts, or they cover too much of the
+        screen, the whole screen is redrawn instead, as tracking them would cost more than it saves.
+
+        Args:
+            screen: pygame display surface where the state will be drawn.
+            *args: Additional arguments passed on to display_debug_info (the first should be FPS).
+
+        Returns:
+            list: The rectangles of the screen that changed (to pass to pygame.display.update).
+        """
+        regions = self.get_regions(*args)
+        moving_rects = self.get_moving_rects()
+
+        if self.redraw_all:
+            dirty_rects = [screen.get_rect()]
+        else:
+            dirty_rects = [rect for name, (rect, key) in regions.items()
+                           if name not in self.region_keys or self.region_keys[name] != key]
+            dirty_rects.extend(self.moving_rects)  # Clear where moving objects were
+            dirty_rects.extend(moving_rects)  # Draw where they are now
+            dirty_rects.extend(self.invalid_rects)
+            dirty_rects = merge_overlapping(dirty_rects)
+
+            screen_area = screen.get_width() * screen.get_height()
+            if (len(dirty_rects) > config.DIRTY_RECT_MAX_RECTS
+                    or sum(rect.width * rect.height for rect in dirty_rects) > config.DIRTY_RECT_MAX_AREA * screen_area):
+                dirty_rects = [screen.get_rect()]
+
+        self.redraw_all = False
+        self.invalid_rects = []
+        self.region_keys = {name: key for name, (_, key) in regions.items()}
+        self.moving_rects = moving_rects
+
+        if dirty_rects:
+            screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))  # Skip drawing anything outside the changed area
+            screen.fill((0, 0, 0))
+            self.draw(screen)
+            self.display_debug_info(screen, *args)
+            screen.set_clip(None)
+        return dirty_rects
+
+    def invalidate(self, rect):
+        """
+        Marks an area of the screen to be redrawn next frame in dirty rectangle mode (e.g. after something else was drawn over it).
+
+        Args:
+            rect (pygame.Rect): The area to redraw.
+        """
+        self.invalid_rects.append(rect)
+
     @abstractmethod
     def handle_events(self, events):
         """
@@ -91,5 +238,5 @@ class State(ABC):
         """
         fps = args[0]
         if fps:
-            fps_text = self.debug_font.render(f"fps: {fps}", True, (255, 255, 255))
+            fps_text = render_text(self.debug_font, f"fps: {fps}", (255, 255, 255))
             screen.blit(fps_text, (0, 0))  # Draw FPS at the top-left corner of the screen
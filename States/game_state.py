@@ -1,30 +1,61 @@
 # Import Parent Class
 from States.base_state import State 
 
-# Import Game Data
-from Game.Core.game_data import GAME_DATA
-
-# Import Map
-from Game.Map.map import Map 
+# Import Simulation and Renderer
+from Game.Core.simulation import Simulation
+from Game.Core.renderer import SimulationRenderer
 
 # Import Managers
 from Game.Managers.mouse import Mouse
-from Game.Managers.wave_manager import WaveManager
-from Game.Managers.bullet_manager import BulletManager
-from Game.Managers.enemy_manager import EnemyManager
-from Game.Managers.tower_manager import TowerManager
 from Game.Managers.ui_manager import UIManager
 from Game.Managers.game_manager import GameManager
 
+from Game.Core import logger
+from Game.Core.profiler import profiler
+from Constants import config
 import pygame
+import os
+import time
+
+# Debug keys that switch each log category on and off while playing
+LOG_TOGGLE_KEYS = {
+    pygame.K_F5: "combat",
+    pygame.K_F6: "spawn",
+    pygame.K_F7: "placement",
+    pygame.K_F8: "path",
+    pygame.K_F9: "game",
+}
+
+def simulation_attribute(name):
+    """
+    Creates a property that reads and writes an attribute of the game state's simulation.
+
+    Args:
+        name (str): The name of the simulation attribute.
+    """
+    return property(lambda self: getattr(self.simulation, name),
+                    lambda self, value: setattr(self.simulation, name, value))
 
 class Game_State(State):
     """Main game engine - Manages the in-game logic, events, and rendering.
     
-    This class handles all the game mechanics such as updating enemies, towers, bullets, and checking win/loss conditions.
-    It also processes user input and manages the game state transition.
+    This class wraps a headless Simulation (map, enemies, towers, bullets, waves) with everything needed to play it:
+    player input, UI, rendering and win/loss state transitions.
     """
 
+    # Simulation data, exposed directly so menus and managers can read it from the game state
+    map = simulation_attribute("map")
+    tower_manager = simulation_attribute("tower_manager")
+    bullet_manager = simulation_attribute("bullet_manager")
+    enemy_manager = simulation_attribute("enemy_manager")
+    wave_manager = simulation_attribute("wave_manager")
+    difficulty = simulation_attribute("difficulty")
+    practise = simulation_attribute("practise")
+    starting_money = simulation_attribute("starting_money")
+    starting_health = simulation_attribute("starting_health")
+    money = simulation_attribute("money")
+    health = simulation_attribute("health")
+
     def __init__(self, game):
         """
         Initializes the Game_State.
@@ -32,30 +63,19 @@ class Game_State(State):
         Args:
             game: Reference to the main game object, allowing access to shared resources.
         
-        Initializes the game map, managers, game stats (money, health, difficulty), and sets up the game.
+        Initializes the simulation (map, game managers and stats), its renderer, and the UI managers.
         """
         super().__init__(game)  # Call the parent State class constructor
 
-        # Initialize game map
-        self.map = Map("Demonstration_Map")  # Stub/demonstration map
-        
-        # Initialize all game managers responsible for specific components
-        self.tower_manager = TowerManager(self)
-        self.bullet_manager = BulletManager(self)
-        self.enemy_manager = EnemyManager(self)
-        self.wave_manager = WaveManager(self)
+        # Initialize the headless simulation and the renderer that draws it
+        self.simulation = Simulation("Demonstration_Map")  # Stub/demonstration map
+        self.renderer = SimulationRenderer(self.simulation)
+
+        # Initialize the managers responsible for player input and UI
         self.ui_manager = UIManager(self)
         self.game_manager = GameManager(self)
         self.mouse = Mouse()
 
-        # Set default game settings based on difficulty
-        self.difficulty = "Normal"
-        self.practise = False
-        self.starting_money = GAME_DATA[self.difficulty]["Game_Stats"]["Starting Money"]
-        self.money = self.starting_money
-        self.starting_health = GAME_DATA[self.difficulty]["Game_Stats"]["Starting Health"]
-        self.health = self.starting_health
-
     def enter(self, *args):
         """
         Enters the Game_state, setting the level that will be played, and calling the load level function to load such level.
@@ -67,11 +87,8 @@ class Game_State(State):
         """
         if args:
             level_name = args[0]
-            self.map = Map(level_name)  # Load the map based on the provided level name
-            self.wave_manager.reset_waves() # Reset wave manager when entering a new level
-            print(f"Entering level {level_name}")
-            self.health = self.starting_health  # Reset health
-            self.money = self.starting_money  # Reset money
+            self.simulation.load_level(level_name)  # Load the map and reset waves, health and money
+            logger.game("Entering level %s", level_name)
 
     def exit(self, **kwargs):
         """
@@ -82,35 +99,65 @@ class Game_State(State):
         """
         exiting_game = kwargs.get("exiting_game", True)
         if exiting_game:
+            if config.SAVE_REPLAYS or os.environ.get("TD_SAVE_REPLAYS") == "1":
+                self.save_replay()  # Only when asked for, so playing doesn't leave files in the working directory
+
             # Reset game elements to their initial states
-            self.map.reset_map()  # Reset map
-            self.enemy_manager.enemies = []  # Clear enemies
-            self.tower_manager.towers = {}  # Clear towers
-            self.bullet_manager.bullets = []  # Clear bullets
+            self.simulation.clear()  # Reset map, and clear enemies, towers and bullets
             self.mouse.change_current_action(None, None)  # Reset mouse actions
-            print("Game successfully exited")
+            logger.game("Game successfully exited")
+
+    def save_replay(self):
+        """
+        Saves the recording of the current game to the replay directory (only if the player did anything).
+        """
+        replay = self.simulation.replay
+        if not replay.actions:
+            return
+        replay.finish(self.simulation)
+
+        os.makedirs(config.REPLAY_DIRECTORY, exist_ok=True)
+        path = os.path.join(config.REPLAY_DIRECTORY, f"{time.strftime('%Y%m%d_%H%M%S')}_{replay.map_name}.json")
+        try:
+            replay.save(path)
+            logger.game("Replay saved to %s", path)
+        except OSError as error:
+            print(f"Warning: Could not save replay to {path}: {error}")
 
     def update(self, events):
         """
-        Updates the game based on player input and game logic.
+        Updates the game based on player input, once per frame.
         
         Args:
             events: A list of input events (e.g., keyboard/mouse actions).
         
-        Updates the enemies, towers, bullets, waves, and checks for game over or win conditions.
+        Updates the mouse and button hover state, and processes player input.
         """
         for button in self.ui_manager.tower_selection_menu.buttons:
             if button.is_hovered():
                 self.mouse.currently_hovering = button.text  # Display tower type on hover
             
         self.mouse.update_mouse_pos()  # Update mouse position
-        self.enemy_manager.update_enemies()  # Update enemy positions and check for removals
-        self.tower_manager.update_towers()   # Update tower behavior (attacking, targeting, etc.)
-        self.bullet_manager.check_bullet_collisions()  # Check and handle bullet collisions with enemies
-        self.wave_manager.update()  # Update wave logic (spawning, progress)
+        self.handle_events(events)  # Process player input and other events
+
+    def tick(self):
+        """
+        Advances the game logic by a single fixed-size tick.
+
+        Updates the enemies, towers, bullets, waves, and checks for game over or win conditions.
+        """
+        self.simulation.update()  # Update enemies, towers, bullets and waves
         self.game_manager.check_game_over()  # Check for game over conditions
         self.game_manager.check_win()  # Check for win conditions
-        self.handle_events(events)  # Process player input and other events
+
+    def is_simulating(self):
+        """
+        Checks whether the game is running (pausing switches to Pause_State, so it always is while this state is active).
+
+        Returns:
+            bool: True.
+        """
+        return True
 
     def handle_events(self, events):
         """
@@ -127,7 +174,7 @@ class Game_State(State):
                     button_clicked = False
 
                     if self.mouse.current_action == "Placing Tower":
-                        self.tower_manager.place_tower()  # Place tower if the action is placing a tower
+                        self.ui_manager.place_selected_tower()  # Place tower if the action is placing a tower
                         button_clicked = True
 
                     # Check if any UI button is clicked
@@ -148,6 +195,15 @@ class Game_State(State):
                 if event.button == 3:  # Right mouse button click
                     self.mouse.change_current_action(None, None)  # Cancel current mouse action
 
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_f:  # Pressing F cycles the fast-forward speed
+                    self.game.cycle_game_speed()
+                if event.key == pygame.K_t:  # Pressing T cycles the selected tower's targeting policy
+                    self.ui_manager.cycle_selected_tower_targeting()
+                if event.key in LOG_TOGGLE_KEYS:  # Pressing F5 to F9 switches a log category on or off
+                    category = LOG_TOGGLE_KEYS[event.key]
+                    print(f"Logging for {category} turned {'on' if logger.toggle(category) else 'off'}")
+
     def draw(self, screen):
         """
         Handles rendering the game to the screen.
@@ -157,8 +213,54 @@ class Game_State(State):
         
         Draws the game map, towers, bullets, enemies, and UI elements on the screen.
         """
-        self.map.draw(screen)  # Draw the game map
-        self.tower_manager.draw(screen)  # Draw towers
-        self.bullet_manager.draw(screen)  # Draw bullets
-        self.enemy_manager.draw(screen)  # Draw enemies
-        self.ui_manager.draw(screen)  # Draw UI elements
+        self.renderer.draw(screen, self.game.render_alpha)  # Draw the map, towers, bullets and enemies
+        with profiler.section("Draw UI"):
+            self.ui_manager.draw(screen)  # Draw UI elements
+
+    def get_regions(self, *args):
+        """
+        Gets the regions of the screen the game draws, with a key describing what each one currently shows.
+
+        The map is redrawn when towers or the mouse's selection change, the topbar when the game stats
+        change, and the sidebar when its buttons or the selected tower's info change.
+
+        Args:
+            *args: The same arguments as display_debug_info (the first is the FPS).
+
+        Returns:
+            dict: Maps each region's name to a (pygame.Rect, key) pair.
+        """
+        regions = super().get_regions(*args)
+        mouse = self.mouse
+        selection = mouse.current_selection
+        towers = tuple((position, id(tower), tower.upgrade_level) for position, tower in self.tower_manager.towers.items())
+        placing_position = (mouse.map_grid_x, mouse.map_grid_y) if mouse.current_action == "Placing Tower" else None
+
+        map_key = (id(self.map), towers, mouse.current_action, id(selection), placing_position)
+        regions["Map"] = (pygame.Rect(0, config.SCREEN_TOPBAR_HEIGHT, config.GRID_SIZE, config.GRID_SIZE), map_key)
+
+        # The error message counts down each time it is drawn, so its region stays dirty while it is shown
+        error_key = (self.ui_manager.error_message, self.ui_manager.error_message_display_time)
+        topbar_key = (self.health, self.money, self.wave_manager.wave_number, self.wave_manager.wave_ongoing,
+                      self.difficulty, self.game.game_speed, error_key)
+        regions["Topbar"] = (pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_TOPBAR_HEIGHT), topbar_key)
+
+        selected_tower_key = None
+        if mouse.current_action == "Selected Tower":
+            selected_tower_key = (selection.upgrade_level, selection.value, selection.targeting)
+        sidebar_key = (mouse.current_action, id(selection), selected_tower_key)
+        regions["Sidebar"] = (pygame.Rect(config.GRID_SIZE, config.SCREEN_TOPBAR_HEIGHT, config.SCREEN_SIDEBAR_WIDTH,
+                                          config.SCREEN_HEIGHT - config.SCREEN_TOPBAR_HEIGHT), sidebar_key)
+
+        regions.update(self.ui_manager.game_buttons.get_button_regions())
+        regions.update(self.ui_manager.tower_selection_menu.get_button_regions())
+        return regions
+
+    def get_moving_rects(self):
+        """
+        Gets the areas of the screen covered by enemies and bullets.
+
+        Returns:
+            list: A pygame.Rect for each drawn enemy and bullet.
+        """
+        return self.renderer.get_moving_rects(self.game.render_alpha)
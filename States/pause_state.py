@@ -42,6 +42,20 @@ class Pause_State(State):
         """
         self.menu.draw(screen)  # Render the PauseMenu (buttons, background, etc.)
 
+    def get_regions(self, *args):
+        """
+        Gets the regions of the screen the state draws, including the menu and its buttons (see get_menu_regions).
+
+        Args:
+            *args: The same arguments as display_debug_info (the first is the FPS).
+
+        Returns:
+            dict: Maps each region's name to a (pygame.Rect, key) pair.
+        """
+        regions = super().get_regions(*args)
+        regions.update(self.get_menu_regions(self.menu))
+        return regions
+
     def handle_events(self, events):
         """
         Handles user input and other event-driven behavior.
@@ -49,6 +49,7 @@ class StateManager:
                 self.current_state.exit(*args, **kwargs)  # Exit the current state before switching
 
             self.current_state = self.states[new_state]  # Switch to the new state
+            self.current_state.redraw_all = True  # The screen still shows the previous state
             self.current_state.enter(*args, **kwargs)  # Initialize the new state
         else:
             print(f"Warning: Attempted to change to unknown state '{new_state}'")  # Log a warning if the state is not found
@@ -65,6 +66,24 @@ class StateManager:
         if self.current_state:
             self.current_state.update(events)  # Update the current state with the events
 
+    def tick(self):
+        """
+        Advances the current game state by a single fixed-size tick.
+
+        Calls the `tick()` method of the current state.
+        """
+        if self.current_state:
+            self.current_state.tick()  # Advance the current state's game logic
+
+    def is_simulating(self):
+        """
+        Checks whether the current game state is running game logic (so uncapped game speed applies).
+
+        Returns:
+            bool: True if the current state is simulating.
+        """
+        return self.current_state is not None and self.current_state.is_simulating()
+
     def draw(self, screen, *args):
         """
         Draws the current game state to the screen.
@@ -78,6 +97,27 @@ class StateManager:
             self.current_state.draw(screen)  # Render the current state's visuals
             self.current_state.display_debug_info(screen, *args)  # Optionally display debug info
 
+    def draw_dirty(self, screen, *args):
+        """
+        Redraws the parts of the screen that changed in the current game state.
+
+        Args:
+            screen (pygame.Surface): The surface (screen) where the game is rendered.
+
+        Returns:
+            list: The rectangles of the screen that were redrawn.
+        """
+        if self.current_state:
+            return self.current_state.draw_dirty(screen, *args)
+        return []
+
+    def redraw_all(self):
+        """
+        Makes the current game state redraw the whole screen next frame (e.g. after the window was covered).
+        """
+        if self.current_state:
+            self.current_state.redraw_all = True
+
     def get_current_state(self):
         """
         Returns the name of the current active state.
@@ -96,3 +136,4 @@ class StateManager:
         if self.current_state:
             self.current_state.exit(*args, **kwargs)  # Exit the current state
             self.current_state.enter(*args, **kwargs)  # Reinitialize the current state
+            self.current_state.redraw_all = True
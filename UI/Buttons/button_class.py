@@ -39,6 +39,15 @@ class Button(ABC):
         """
         return self.rect.collidepoint(pygame.mouse.get_pos())  # Checks if mouse position is within button bounds
 
+    def get_appearance(self):
+        """
+        Gets everything that decides how the button currently looks.
+
+        Returns:
+            tuple: The button's hovered, selected and clicked states and text. The button only needs redrawing when this changes.
+        """
+        return (self.is_hovered(), self.is_selected, self.is_clicked, self.text)
+
     def click(self):
         """
         Executes the action associated with the button when clicked.
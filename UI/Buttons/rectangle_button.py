@@ -1,5 +1,6 @@
 from UI.Buttons.button_class import Button
 import pygame
+from UI.text_cache import render_text
 
 class RectangleButton(Button):
     """
@@ -50,7 +51,7 @@ class RectangleButton(Button):
         # Render the text and center it within the button if text is defined
         if self.text:
             # Create a text surface with the defined font and white color for text
-            text_surface = self.font.render(self.text, True, (255, 255, 255))  
+            text_surface = render_text(self.font, self.text, (255, 255, 255))  
             text_rect = text_surface.get_rect()
             text_rect.center = self.rect.center  # Position the text at the center of the button
             screen.blit(text_surface, text_rect)  # Draw the text on the screen
@@ -3,6 +3,7 @@ from UI.Buttons.rectangle_button import RectangleButton
 from UI.Buttons.sprite_button import SpriteButton
 from Constants import config
 import pygame
+from UI.text_cache import render_text
 
 class Menu(ABC):
     """
@@ -38,11 +39,20 @@ class Menu(ABC):
 
         # Render and display the title if it is defined
         if self.title:
-            title_surface = self.title_font.render(self.title, True, (255, 255, 255))  # White color for title text
+            title_surface = render_text(self.title_font, self.title, (255, 255, 255))  # White color for title text
             text_rect = title_surface.get_rect()  # Get the rectangle for the title text to position it
             text_rect.center = (config.SCREEN_WIDTH // 2, 150)  # Center the title horizontally, place it near the top
             screen.blit(title_surface, text_rect)  # Blit the title to the screen
 
+    def get_button_regions(self):
+        """
+        Gets the screen area and current appearance of each button, so only buttons that changed are redrawn.
+
+        Returns:
+            dict: Maps a name for each button to its (rect, appearance) pair.
+        """
+        return {f"{type(self).__name__} button {index}": (button.rect, button.get_appearance()) for index, button in enumerate(self.buttons)}
+
     def add_button(self, button):
         """
         Add a new button to the menu.
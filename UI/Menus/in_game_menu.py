@@ -2,6 +2,7 @@ import pygame
 from Constants import config
 from UI.Menus.base_menu import Menu
 from Game.Core.game_data import GAME_DATA
+from UI.text_cache import render_text
 
 class GameButtons(Menu):
     """
@@ -62,11 +63,11 @@ class GameButtons(Menu):
             game_state = self.game.state_manager.states["Game_State"]
 
             # Render and display game stats: health, money, wave info
-            health_surface = self.body_font.render(f"Health: {game_state.health}", True, (255, 255, 255))
-            money_surface = self.body_font.render(f"Money: {game_state.money}", True, (255, 255, 255))
-            wave_surface = self.body_font.render(
-                f"Wave: {game_state.wave_manager.wave_number}/{GAME_DATA[game_state.difficulty]['Last Wave']}", 
-                True, 
+            health_surface = render_text(self.body_font, f"Health: {game_state.health}", (255, 255, 255))
+            money_surface = render_text(self.body_font, f"Money: {game_state.money}", (255, 255, 255))
+            wave_surface = render_text(
+                self.body_font,
+                f"Wave: {game_state.wave_manager.wave_number}/{GAME_DATA[game_state.difficulty]['Last Wave']}",
                 (255, 255, 255)
             )
 
@@ -79,8 +80,13 @@ class GameButtons(Menu):
             
             # Display wave status: ongoing or ready
             wave_status = "Ongoing..." if game_state.wave_manager.wave_ongoing else "Ready"
+            # Show the fast-forward speed when the game isn't running at normal speed
+            if self.game.game_speed is None:
+                wave_status += " (max)"
+            elif self.game.game_speed != 1:
+                wave_status += f" x{self.game.game_speed}"
             wave_color = (255, 0, 0) if game_state.wave_manager.wave_ongoing else (0, 255, 0)
-            wave_ongoing_surface = self.body_font.render(wave_status, True, wave_color)
+            wave_ongoing_surface = render_text(self.body_font, wave_status, wave_color)
             
             # Position and draw wave status on screen
             text_rect = wave_ongoing_surface.get_rect()
@@ -1,6 +1,7 @@
 from UI.Menus.base_menu import Menu
 from Constants import config
 import pygame
+from UI.text_cache import render_text
 
 class OptionsMenu(Menu):
     """
@@ -58,8 +59,8 @@ class OptionsMenu(Menu):
             practise_text = f"Practise is: {game_state.practise}"
 
             # Render them as text surfaces
-            difficulty_surface = self.body_font.render(difficulty_text, True, (255, 255, 255))
-            practise_surface = self.body_font.render(practise_text, True, (255, 255, 255))
+            difficulty_surface = render_text(self.body_font, difficulty_text, (255, 255, 255))
+            practise_surface = render_text(self.body_font, practise_text, (255, 255, 255))
 
             # Blit the text near the bottom of the screen
             surface_list = [difficulty_surface, practise_surface]
@@ -1,5 +1,6 @@
 from UI.Menus.base_menu import Menu
 from Constants import config
+from UI.text_cache import render_text
 
 class PauseMenu(Menu):
     """
@@ -53,8 +54,8 @@ class PauseMenu(Menu):
             practise_text = f"Practise is: {game_state.practise}"
 
             # Render the difficulty and practice mode info as text surfaces
-            difficulty_surface = self.body_font.render(difficulty_text, True, (255, 255, 255))
-            practise_surface = self.body_font.render(practise_text, True, (255, 255, 255))
+            difficulty_surface = render_text(self.body_font, difficulty_text, (255, 255, 255))
+            practise_surface = render_text(self.body_font, practise_text, (255, 255, 255))
 
             # Display them near the bottom of the screen
             surface_list = [difficulty_surface, practise_surface]
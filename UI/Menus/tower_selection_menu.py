@@ -2,6 +2,7 @@ import pygame
 from Constants import config
 from Entities.Towers.base_tower import Tower
 from UI.Menus.base_menu import Menu
+from UI.text_cache import render_text
 
 class TowerSelectionMenu(Menu):
     """
@@ -67,7 +68,7 @@ class TowerSelectionMenu(Menu):
                 button.draw(screen)
 
             # Render and display the menu title
-            title_surface = self.title_font.render(self.title, True, (255, 255, 255))
+            title_surface = render_text(self.title_font, self.title, (255, 255, 255))
             screen.blit(title_surface, (config.SCREEN_WIDTH - config.SCREEN_SIDEBAR_WIDTH, config.SCREEN_TOPBAR_HEIGHT // 2))
 
             mouse = self.game.state_manager.states["Game_State"].mouse
@@ -112,6 +113,7 @@ class TowerSelectionMenu(Menu):
                 if next_upgrade_level < len(tower.tower_data) - 1:
                     tower_stats["Upgrade Cost"] = tower.tower_data[f"UPGRADE {next_upgrade_level}"]["Cost"]
                 tower_stats["Value"] = tower.value
+                tower_stats["Targeting (T)"] = tower.targeting
             else:
                 tower_stats["Cost"] = tower.cost
 
@@ -138,7 +140,7 @@ class TowerSelectionMenu(Menu):
             # Display tower stats
             for index, (stat, value) in enumerate(tower_stats.items()):
                 display_text = f"{stat}: {value}"
-                body_surface = self.stat_font.render(display_text, True, (255, 255, 255))
+                body_surface = render_text(self.stat_font, display_text, (255, 255, 255))
                 screen.blit(body_surface, (
                     self.TOWER_BUTTON_X_POSITION + self.TOWER_BUTTON_WIDTH + 20,
                     config.SCREEN_TOPBAR_HEIGHT + index * 20
@@ -164,7 +166,7 @@ class TowerSelectionMenu(Menu):
         """
         try:
             if self.game.state_manager.states["Game_State"].mouse.current_action == "Selected Tower":
-                self.game.state_manager.states["Game_State"].tower_manager.remove_tower()
+                self.game.state_manager.states["Game_State"].ui_manager.sell_selected_tower()
         except Exception as e:
             print(f"[ERROR] Failed to remove tower: {e}")
 
@@ -174,6 +176,6 @@ class TowerSelectionMenu(Menu):
         """
         try:
             if self.game.state_manager.states["Game_State"].mouse.current_action == "Selected Tower":
-                self.game.state_manager.states["Game_State"].tower_manager.upgrade_tower()
+                self.game.state_manager.states["Game_State"].ui_manager.upgrade_selected_tower()
         except Exception as e:
             print(f"[ERROR] Failed to upgrade tower: {e}")
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    """
+    A least-recently-used cache of rendered text surfaces.
+
+    Rendering text rasterises every glyph, so UI text drawn each frame is rendered once and the surface reused
+    until the text changes. The cache holds at most max_entries surfaces and max_bytes of pixel data; the least
+    recently used surfaces are dropped first when either limit is reached.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=4 * 1024 * 1024):
+        """
+        Initializes an empty TextCache.
+
+        Args:
+            max_entries (int): Maximum number of surfaces to keep.
+            max_bytes (int): Maximum total size of the kept surfaces' pixel data, in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()  # Maps (font, text, colour, antialias) to its surface, least recently used first
+        self.total_bytes = 0  # Total size of the cached surfaces' pixel data
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, colour, antialias=True):
+        """
+        Renders text, reusing the surface from an earlier call with the same arguments if there is one.
+
+        The returned surface is shared, so it must not be drawn on.
+
+        Args:
+            font (pygame.font.Font): The font to render with.
+            text (str): The text to render.
+            colour (tuple): The text colour.
+            antialias (bool): Whether to smooth the text's edges.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (font, text, tuple(colour), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)  # Mark as most recently used
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, colour)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Match the display's pixel format, so the text blits quickly
+        self.surfaces[key] = surface
+        self.total_bytes += self.get_size(surface)
+
+        # Drop the least recently used surfaces until the cache is within its limits (always keeping the new one)
+        while len(self.surfaces) > 1 and (len(self.surfaces) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, old_surface = self.surfaces.popitem(last=False)
+            self.total_bytes -= self.get_size(old_surface)
+        return surface
+
+    def get_size(self, surface):
+        """
+        Gets the size of a surface's pixel data.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def clear(self):
+        """
+        Removes every cached surface.
+        """
+        self.surfaces.clear()
+        self.total_bytes = 0
+
+# The cache shared by all UI code
+text_cache = TextCache()
+
+def render_text(font, text, colour, antialias=True):
+    """
+    Renders text using the shared text cache (see TextCache.render).
+
+    Args:
+        font (pygame.font.Font): The font to render with.
+        text (str): The text to render.
+        colour (tuple): The text colour.
+        antialias (bool): Whether to smooth the text's edges.
+
+    Returns:
+        pygame.Surface: The rendered text. Shared between callers, so it must not be drawn on.
+    """
+    return text_cache.render(font, text, colour, antialias)
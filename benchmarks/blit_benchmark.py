@@ -0,0 +1,84 @@
+"""
+Blit benchmark for the game's sprites, with and without conversion to the display's pixel format.
+
+Loads every asset registered in Constants/sprites.py twice - as loaded from its file, and converted with convert() or
+convert_alpha() - and times blitting each version to the screen, to show what converting the assets saves every frame.
+
+Usage (from the repository root):
+    python -m benchmarks.blit_benchmark                 # Headless (SDL's dummy video driver)
+    python -m benchmarks.blit_benchmark --window        # Blit to a real window, in the display's actual pixel format
+    python -m benchmarks.blit_benchmark --blits 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+import pygame
+from Constants import config, sprites
+
+DEFAULT_BLITS = 5000  # Blits timed for each version of each asset
+
+def time_blits(screen, surface, count):
+    """
+    Times blitting a surface to the screen.
+
+    Args:
+        screen (pygame.Surface): The surface to blit to.
+        surface (pygame.Surface): The surface to blit.
+        count (int): The number of blits.
+
+    Returns:
+        float: The average time per blit, in microseconds.
+    """
+    # Spread the blits over the screen, like the game's entities
+    width = max(1, config.SCREEN_WIDTH - surface.get_width())
+    height = max(1, config.SCREEN_HEIGHT - surface.get_height())
+    sequence = [(surface, ((i * 37) % width, (i * 53) % height)) for i in range(count)]
+
+    start = time.perf_counter()
+    screen.blits(sequence, doreturn=False)
+    return (time.perf_counter() - start) / count * 1e6
+
+def main(argv=None):
+    """
+    Runs the blit benchmark from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Time blitting sprites with and without pixel format conversion.")
+    parser.add_argument("--blits", type=int, default=DEFAULT_BLITS, help="Blits timed for each version of each asset")
+    parser.add_argument("--window", action="store_true", help="Open a real window instead of using the dummy video driver")
+    args = parser.parse_args(argv)
+
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    print(f"Display: {pygame.display.get_driver()}, {screen.get_bitsize()}-bit, {args.blits} blits per asset\n")
+
+    print(f"{'asset':<32} {'size':>9} {'loaded us':>10} {'converted us':>13} {'speedup':>8}")
+    total_loaded = total_converted = 0
+    for name, (path, size, alpha) in sprites.assets.assets.items():
+        loaded = pygame.image.load(path)
+        if size is not None:
+            loaded = pygame.transform.scale(loaded, size)
+        converted = loaded.convert_alpha() if alpha else loaded.convert()
+
+        loaded_time = time_blits(screen, loaded, args.blits)
+        converted_time = time_blits(screen, converted, args.blits)
+        total_loaded += loaded_time
+        total_converted += converted_time
+        size_text = "x".join(str(length) for length in loaded.get_size())
+        print(f"{name:<32} {size_text:>9} {loaded_time:>10.2f} {converted_time:>13.2f} {loaded_time / converted_time:>7.1f}x")
+
+    print(f"\n{'total':<32} {'':>9} {total_loaded:>10.2f} {total_converted:>13.2f} {total_loaded / total_converted:>7.1f}x")
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
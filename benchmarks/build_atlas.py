@@ -0,0 +1,124 @@
+"""
+Builds the sprite atlas - every tower, enemy and projectile sprite packed into one sheet, with a JSON index.
+
+Each sprite is scaled from its source file to the size the game registers it at (see Constants/sprites.py), plus the
+other sizes it is drawn at (sprites.ATLAS_VARIANTS), so the game reads and decodes one file instead of one per sprite
+and never scales sprites at runtime. Rebuild the atlas after changing, adding or resizing a sprite.
+
+Usage (from the repository root):
+    python -m benchmarks.build_atlas                            # Writes Assets/Sprites/atlas.json and atlas.png
+    python -m benchmarks.build_atlas --output other/atlas.json --width 256
+"""
+import argparse
+import json
+import os
+import sys
+
+import pygame
+from Constants import config, sprites
+
+SPRITE_DIRECTORY = "Assets/Sprites/"  # Assets under this directory are packed into the atlas
+SHEET_WIDTH = 512  # Width of the atlas sheet, in pixels
+PADDING = 1  # Transparent pixels between sprites in the sheet
+
+def get_atlas_sprites():
+    """
+    Gets every sprite to pack into the atlas, at each size it is drawn at.
+
+    Returns:
+        list: (name, path, (width, height)) of each sprite and size.
+    """
+    atlas_sprites = []
+    for name, (path, size, alpha) in sprites.assets.assets.items():
+        if path.startswith(SPRITE_DIRECTORY) and size is not None:
+            for sprite_size in (size, *sprites.ATLAS_VARIANTS.get(name, ())):
+                atlas_sprites.append((name, path, tuple(sprite_size)))
+    return atlas_sprites
+
+def pack(sizes, sheet_width=SHEET_WIDTH, padding=PADDING):
+    """
+    Packs rectangles into a sheet of a fixed width, in rows ("shelves") from tallest to shortest.
+
+    Args:
+        sizes (list): The (width, height) of each rectangle.
+        sheet_width (int): The sheet's width.
+        padding (int): Space left between rectangles.
+
+    Returns:
+        tuple: The (x, y) of each rectangle (in the order given), and the height of the sheet.
+
+    Raises:
+        ValueError: If a rectangle is wider than the sheet.
+    """
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i)):
+        width, height = sizes[i]
+        if width > sheet_width:
+            raise ValueError(f"A {width}x{height} sprite doesn't fit in a {sheet_width} pixel wide sheet")
+        if x + width > sheet_width:
+            # Start a new shelf under the current one
+            x, y = 0, y + shelf_height + padding
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return positions, y + shelf_height
+
+def build_atlas(index_path, sheet_width=SHEET_WIDTH):
+    """
+    Builds the atlas sheet and its index.
+
+    Args:
+        index_path (str): Where to write the JSON index. The sheet is written next to it, as a PNG with the same name.
+        sheet_width (int): The sheet's width.
+
+    Returns:
+        dict: The index written.
+    """
+    atlas_sprites = get_atlas_sprites()
+    positions, sheet_height = pack([size for _, _, size in atlas_sprites], sheet_width)
+
+    sheet = pygame.Surface((sheet_width, sheet_height), pygame.SRCALPHA)  # Starts fully transparent
+    sources = {}  # Each source file is loaded once, however many sizes it is packed at
+    frames = []
+    for (name, path, size), (x, y) in zip(atlas_sprites, positions):
+        if path not in sources:
+            sources[path] = pygame.image.load(path)
+        sheet.blit(pygame.transform.scale(sources[path], size), (x, y))
+        frames.append({"name": name, "x": x, "y": y, "width": size[0], "height": size[1]})
+
+    image_name = os.path.splitext(os.path.basename(index_path))[0] + ".png"
+    index = {"image": image_name, "frames": frames}
+    pygame.image.save(sheet, os.path.join(os.path.dirname(index_path), image_name))
+    with open(index_path, "w") as file:
+        json.dump(index, file, indent=1)
+    return index
+
+def main(argv=None):
+    """
+    Builds the atlas from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Pack the game's sprites into one sheet.")
+    parser.add_argument("--output", default=config.SPRITE_ATLAS or "Assets/Sprites/atlas.json", help="Path of the JSON index to write")
+    parser.add_argument("--width", type=int, default=SHEET_WIDTH, help="Width of the sheet, in pixels")
+    args = parser.parse_args(argv)
+
+    index = build_atlas(args.output, args.width)
+    source_paths = {path for _, path, _ in get_atlas_sprites()}
+    source_bytes = sum(os.path.getsize(path) for path in source_paths)
+    sheet_path = os.path.join(os.path.dirname(args.output), index["image"])
+    sheet = pygame.image.load(sheet_path)
+
+    print(f"Packed {len(index['frames'])} sprites from {len(source_paths)} files ({source_bytes / 1024:.0f} KB) "
+          f"into {sheet_path}: {sheet.get_width()}x{sheet.get_height()} ({os.path.getsize(sheet_path) / 1024:.0f} KB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
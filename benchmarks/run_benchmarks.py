@@ -0,0 +1,223 @@
+"""
+Headless benchmark harness for the game simulation.
+
+Runs each scenario in benchmarks/scenarios.py without a display and reports simulation throughput (ticks per second),
+the time split between the simulation's systems, peak entity counts and allocations. Results can be saved as a JSON
+baseline, and later runs are compared against it to flag throughput regressions.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks                       # Run every scenario and compare against the baseline (benchmarks/baseline.json)
+    python -m benchmarks.run_benchmarks normal_midgame        # Run only the given scenarios
+    python -m benchmarks.run_benchmarks --save-baseline       # Run and store the results as the new baseline
+    python -m benchmarks.run_benchmarks --trace-memory        # Also report peak Python memory use (much slower)
+    python -m benchmarks.run_benchmarks --profile trace.json  # Also export every system update as a Chrome trace (or .csv)
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from Game.Core.simulation import Simulation
+from Game.Core.profiler import profiler
+from Entities.Towers.base_tower import Tower
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.15  # Fractional drop in ticks per second that counts as a regression
+MAX_TICKS_PER_WAVE = 100000  # Safety limit, in case a wave never ends
+
+TOWER_CLASSES = {tower_class.__name__: tower_class for tower_class in Tower.__subclasses__()}
+
+def build_simulation(scenario):
+    """
+    Creates a simulation for a scenario, with its towers placed and upgraded and its waves skipped ahead.
+
+    Args:
+        scenario (dict): The scenario definition (see benchmarks/scenarios.py).
+
+    Returns:
+        Simulation: The simulation, ready for the scenario's first wave.
+    """
+    simulation = Simulation(scenario["Map"], difficulty=scenario["Difficulty"], practise=True)
+    simulation.load_level(scenario["Map"], seed=scenario["Seed"])  # Seeded so wave spawn order is repeatable
+
+    for tower_name, grid_x, grid_y, upgrade_level in scenario["Towers"]:
+        success, result = simulation.tower_manager.place_tower(TOWER_CLASSES[tower_name], grid_x, grid_y)
+        if not success:
+            raise ValueError(f"Could not place {tower_name} at ({grid_x}, {grid_y}): {result}")
+        for _ in range(upgrade_level):
+            simulation.tower_manager.upgrade_tower(grid_x, grid_y)
+
+    first_wave, _ = scenario["Waves"]
+    simulation.wave_manager.skip_to_wave(first_wave)
+    return simulation
+
+def run_scenario(scenario, trace_memory=False):
+    """
+    Simulates a scenario's waves and measures the run.
+
+    Args:
+        scenario (dict): The scenario definition (see benchmarks/scenarios.py).
+        trace_memory (bool): Whether to also measure peak Python memory use with tracemalloc.
+
+    Returns:
+        dict: The scenario's results.
+    """
+    # The game prints a lot while it runs - discard the output so it doesn't swamp the timings
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        simulation = build_simulation(scenario)
+        first_wave, last_wave = scenario["Waves"]
+
+        timings = {name: 0 for name, _ in simulation.systems}
+        peak_enemies = peak_bullets = 0
+
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        for _ in range(first_wave, last_wave + 1):
+            simulation.wave_manager.next_wave()
+            wave_ticks = 0
+            while simulation.wave_manager.wave_ongoing and wave_ticks < MAX_TICKS_PER_WAVE:
+                simulation.update(timings)
+                peak_enemies = max(peak_enemies, len(simulation.enemy_manager.enemies))
+                peak_bullets = max(peak_bullets, len(simulation.bullet_manager.bullets))
+                wave_ticks += 1
+        elapsed = time.perf_counter() - start
+
+        peak_memory = None
+        if trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    system_time = sum(timings.values()) or 1
+    return {
+        "ticks": simulation.tick,
+        "seconds": elapsed,
+        "ticks_per_second": simulation.tick / elapsed if elapsed > 0 else 0,
+        "system_seconds": timings,
+        "system_split": {name: seconds / system_time for name, seconds in timings.items()},
+        "peak_enemies": peak_enemies,
+        "peak_bullets": peak_bullets,
+        "towers": len(simulation.tower_manager.towers),
+        "enemies_spawned": simulation.enemy_manager.spawned_count,
+        "projectiles_allocated": simulation.bullet_manager.allocated_count,
+        "projectiles_reused": simulation.bullet_manager.reused_count,
+        "peak_memory_bytes": peak_memory,
+        "final_wave": simulation.wave_manager.wave_number,
+    }
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Finds scenarios whose throughput dropped by more than the threshold compared to the baseline.
+
+    Args:
+        results (dict): This run's results, keyed by scenario name.
+        baseline (dict): The baseline results, keyed by scenario name.
+        threshold (float): The fractional drop in ticks per second that counts as a regression.
+
+    Returns:
+        list: (scenario name, baseline ticks per second, current ticks per second) for each regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        baseline_tps = baseline[name]["ticks_per_second"]
+        if result["ticks_per_second"] < baseline_tps * (1 - threshold):
+            regressions.append((name, baseline_tps, result["ticks_per_second"]))
+    return regressions
+
+def print_result(name, result):
+    """
+    Prints a scenario's results in a readable form.
+
+    Args:
+        name (str): The scenario's name.
+        result (dict): The scenario's results.
+    """
+    print(f"{name}: {result['ticks']} ticks in {result['seconds']:.2f}s ({result['ticks_per_second']:.0f} ticks/s)")
+    split = ", ".join(f"{system} {fraction:.0%}" for system, fraction in result["system_split"].items())
+    print(f"    time split: {split}")
+    print(f"    peak enemies: {result['peak_enemies']}, peak bullets: {result['peak_bullets']}, towers: {result['towers']}")
+    print(f"    enemies spawned: {result['enemies_spawned']}, projectiles allocated: {result['projectiles_allocated']}, "
+          f"projectiles reused: {result['projectiles_reused']}")
+    if result["peak_memory_bytes"] is not None:
+        print(f"    peak memory: {result['peak_memory_bytes'] / 1024:.0f} KiB")
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        int: The exit code - 1 if any scenario regressed against the baseline or there is no baseline to compare
+        against, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Run headless simulation benchmarks.")
+    parser.add_argument("scenarios", nargs="*", help="Scenarios to run (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Path of the JSON baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save this run's results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Fractional ticks/s drop that counts as a regression")
+    parser.add_argument("--output", help="Also write this run's results to the given JSON file")
+    parser.add_argument("--trace-memory", action="store_true", help="Measure peak Python memory use (slows the run down)")
+    parser.add_argument("--profile", help="Export every system update to this file, as a Chrome trace (or CSV if it ends in .csv)")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    for name in names:
+        if name not in SCENARIOS:
+            parser.error(f"Unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+
+    if args.profile:
+        profiler.enabled = True
+        profiler.clear()
+
+    results = {}
+    for name in names:
+        results[name] = run_scenario(SCENARIOS[name], trace_memory=args.trace_memory)
+        print_result(name, results[name])
+
+    if args.profile:
+        profiler.enabled = False
+        if args.profile.endswith(".csv"):
+            profiler.export_csv(args.profile)
+        else:
+            profiler.export_chrome_trace(args.profile)
+        print(f"Exported {len(profiler.events)} profiler measurements to {args.profile}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        baseline.update(results)  # Keep the baselines of scenarios that weren't run
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=4)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Error: No baseline found at {args.baseline} (run with --save-baseline to create one)")
+        return 1  # Nothing was checked, so don't report success
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    for name, baseline_tps, current_tps in regressions:
+        print(f"REGRESSION: {name} dropped from {baseline_tps:.0f} to {current_tps:.0f} ticks/s")
+    if not regressions:
+        print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Replays a recorded game headlessly, as fast as possible.
+
+When recording is turned on (config.SAVE_REPLAYS, or TD_SAVE_REPLAYS=1), replays are saved to the replays directory
+whenever a game is exited. Running one re-simulates the whole game from its seed and recorded actions, reports
+simulation throughput, and checks the final state matches the recording - so a replay of a real game doubles as a
+benchmark and as a determinism test.
+
+Usage (from the repository root):
+    python -m benchmarks.run_replay replays/20260101_120000_Demonstration_Map.json
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+from Game.Core.replay import Replay
+from Game.Core.replay_runner import run_replay
+
+def main(argv=None):
+    """
+    Runs a replay from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        int: The exit code - 1 if the replay's final state doesn't match the recording, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded game headlessly.")
+    parser.add_argument("replay", help="Path of the replay file")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    timings = {}
+
+    # The game prints a lot while it runs - discard the output so it doesn't swamp the timings
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        simulation = run_replay(replay, timings)
+        elapsed = time.perf_counter() - start
+
+    print(f"{replay.map_name} ({replay.difficulty}, seed {replay.seed}): {len(replay.actions)} actions")
+    print(f"  {simulation.tick} ticks in {elapsed:.2f}s ({simulation.tick / elapsed:.0f} ticks/s)")
+    total = sum(timings.values()) or 1
+    for name, duration in timings.items():
+        print(f"  {name:<10} {duration:7.3f}s ({duration / total:5.1%})")
+
+    if simulation.get_summary() != replay.result:
+        print("MISMATCH: the replay's final state differs from the recording")
+        return 1
+    print("MATCH: the replay's final state matches the recording")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
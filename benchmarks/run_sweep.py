@@ -0,0 +1,271 @@
+"""
+Parallel balance sweeps over GAME_DATA and tower stats.
+
+Expands a sweep in benchmarks/sweeps.py into every combination of its parameter values, and plays a whole headless game
+for each combination and seed in a pool of worker processes (one per CPU core by default). Each game's result is written
+to a CSV file as soon as it finishes - one row per game, one column per parameter and result - and a summary of each
+combination (win rate, waves survived, final money, sim time) is printed at the end.
+
+Usage (from the repository root):
+    python -m benchmarks.run_sweep normal_spawn_rate                      # Run a sweep, writing sweep_results.csv
+    python -m benchmarks.run_sweep turret_stats --output turret.csv      # Write the results somewhere else
+    python -m benchmarks.run_sweep normal_spawn_rate --workers 4 --seeds 20
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import itertools
+import os
+import sys
+import time
+
+from Game.Core.simulation import Simulation
+from Game.Core.game_data import GAME_DATA
+from Game.Core import logger
+from Entities.Towers.base_tower import Tower
+from benchmarks.sweeps import SWEEPS
+
+DEFAULT_OUTPUT_PATH = "sweep_results.csv"
+MAX_TICKS_PER_WAVE = 100000  # Safety limit, in case a wave never ends
+
+TOWER_CLASSES = {tower_class.__name__: tower_class for tower_class in Tower.__subclasses__()}
+
+def expand_grid(parameters):
+    """
+    Expands a sweep's parameters into every combination of their values.
+
+    Args:
+        parameters (dict): Maps each parameter's path to the values to try.
+
+    Returns:
+        list: A dict mapping each parameter's path to one of its values, for every combination.
+    """
+    paths = list(parameters)
+    return [dict(zip(paths, values)) for values in itertools.product(*(parameters[path] for path in paths))]
+
+def get_parameter_container(path):
+    """
+    Finds the dict holding a parameter, so it can be read or changed.
+
+    Args:
+        path (tuple): The parameter's path (see benchmarks/sweeps.py).
+
+    Returns:
+        tuple: (container, key) - the dict holding the parameter, and the parameter's key in it.
+
+    Raises:
+        ValueError: If the path doesn't lead to an existing value.
+    """
+    root, *keys = path
+    if root == "GAME_DATA":
+        container = GAME_DATA
+    elif root in TOWER_CLASSES:
+        container = TOWER_CLASSES[root].tower_data
+    else:
+        raise ValueError(f"Unknown parameter root '{root}' (use GAME_DATA or a tower class name)")
+
+    try:
+        for key in keys[:-1]:
+            container = container[key]
+        container[keys[-1]]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"Unknown parameter {path}") from None
+    return container, keys[-1]
+
+@contextlib.contextmanager
+def overridden(parameters):
+    """
+    Sets parameters to new values inside the with block, restoring their original values afterwards.
+
+    Worker processes play many games one after another, so every game must leave the data as it found it.
+
+    Args:
+        parameters (dict): Maps each parameter's path to its value.
+    """
+    originals = []
+    try:
+        for path, value in parameters.items():
+            container, key = get_parameter_container(path)
+            originals.append((container, key, container[key]))
+            container[key] = value
+        yield
+    finally:
+        for container, key, value in reversed(originals):
+            container[key] = value
+
+def buy_next_steps(simulation, build, next_step):
+    """
+    Buys steps of a build order, in order, for as long as the player can afford the next one.
+
+    Args:
+        simulation (Simulation): The game being played.
+        build (list): The build order - (tower class name, grid x, grid y, upgrade level) steps.
+        next_step (int): Index of the first step not bought yet.
+
+    Returns:
+        int: Index of the first step still not bought.
+
+    Raises:
+        ValueError: If a step places a tower somewhere it can't go.
+    """
+    towers = simulation.tower_manager.towers
+    while next_step < len(build):
+        tower_name, grid_x, grid_y, upgrade_level = build[next_step]
+        tower = towers.get((grid_x, grid_y))
+        if tower is None:
+            success, result = simulation.tower_manager.place_tower(TOWER_CLASSES[tower_name], grid_x, grid_y)
+            if result == "Invalid Tower Placement":
+                raise ValueError(f"Could not place {tower_name} at ({grid_x}, {grid_y}): {result}")
+        elif tower.upgrade_level < upgrade_level:
+            success, _ = simulation.tower_manager.upgrade_tower(grid_x, grid_y)
+        else:
+            next_step += 1  # Step complete
+            continue
+        if not success:
+            break  # Not enough money yet - try again before the next wave
+    return next_step
+
+def play_game(sweep, config_index, parameters, seed):
+    """
+    Plays a whole headless game with the given parameters, following the sweep's build order.
+
+    Runs in a worker process, so it takes and returns only plain, picklable data.
+
+    Args:
+        sweep (dict): The sweep definition (see benchmarks/sweeps.py).
+        config_index (int): Index of the parameter combination being played (passed back in the result).
+        parameters (dict): Maps each parameter's path to its value for this game.
+        seed (int): Seed for the game's random number generator.
+
+    Returns:
+        dict: The game's result - whether it was won (see Simulation.is_won), waves survived, final health,
+        money after each wave, ticks simulated and the time the simulation took.
+    """
+    with overridden(parameters):
+        start = time.perf_counter()
+        simulation = Simulation(sweep["Map"], difficulty=sweep["Difficulty"], seed=seed)
+        last_wave = GAME_DATA[sweep["Difficulty"]]["Last Wave"]
+        if sweep.get("Max Waves") is not None:
+            last_wave = min(last_wave, sweep["Max Waves"])
+
+        next_step = 0
+        money_curve = []  # Money at the end of each wave
+        waves_survived = 0
+        while waves_survived < last_wave and not simulation.is_game_over():
+            next_step = buy_next_steps(simulation, sweep["Build"], next_step)
+            simulation.run_wave(MAX_TICKS_PER_WAVE)
+            if simulation.is_game_over():
+                break
+            waves_survived += 1
+            money_curve.append(simulation.money)
+
+        return {
+            "config": config_index,
+            "seed": seed,
+            "won": simulation.is_won(),  # Beat the difficulty's last wave, as in the game (never when Max Waves stops it early)
+            "waves_survived": waves_survived,
+            "health": max(simulation.health, 0),
+            "ticks": simulation.tick,
+            "sim_seconds": time.perf_counter() - start,
+            "money_curve": money_curve,
+        }
+
+def init_worker():
+    """
+    Sets up a worker process - games are played silently, so logging is switched off.
+    """
+    logger.configure(())
+
+def get_parameter_name(path):
+    """
+    Gets the CSV column name of a parameter.
+
+    Args:
+        path (tuple): The parameter's path.
+
+    Returns:
+        str: The path's keys joined by slashes (e.g. "GAME_DATA/Normal/Default_Spawn_Interval").
+    """
+    return "/".join(str(key) for key in path)
+
+def summarise(results, configs):
+    """
+    Prints the win rate, mean waves survived, mean final money and mean sim time of each parameter combination.
+
+    Args:
+        results (list): The result of every game played.
+        configs (list): The parameter combinations, indexed by their config number.
+    """
+    games = {}
+    for result in results:
+        games.setdefault(result["config"], []).append(result)
+
+    print(f"\n{'config':>6} {'win rate':>9} {'waves':>7} {'money':>7} {'sim s':>7}  parameters")
+    for config_index in sorted(games):
+        config_games = games[config_index]
+        win_rate = sum(game["won"] for game in config_games) / len(config_games)
+        waves = sum(game["waves_survived"] for game in config_games) / len(config_games)
+        money = sum(game["money_curve"][-1] if game["money_curve"] else 0 for game in config_games) / len(config_games)
+        sim_seconds = sum(game["sim_seconds"] for game in config_games) / len(config_games)
+        values = ", ".join(f"{get_parameter_name(path)}={value}" for path, value in configs[config_index].items())
+        print(f"{config_index:>6} {win_rate:>9.0%} {waves:>7.1f} {money:>7.0f} {sim_seconds:>7.2f}  {values}")
+
+def main(argv=None):
+    """
+    Runs a balance sweep from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Run a parallel balance sweep of headless games.")
+    parser.add_argument("sweep", choices=list(SWEEPS), help="The sweep to run")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="Path of the CSV file to write results to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes (default: one per core)")
+    parser.add_argument("--seeds", type=int, help="Number of games per parameter combination (overrides the sweep's)")
+    args = parser.parse_args(argv)
+
+    sweep = SWEEPS[args.sweep]
+    configs = expand_grid(sweep["Parameters"])
+    seeds = range(args.seeds or sweep["Seeds"])
+    for parameters in configs:
+        for path in parameters:
+            get_parameter_container(path)  # Fail now on a bad path, rather than in every worker
+
+    total = len(configs) * len(seeds)
+    print(f"Sweep {args.sweep}: {len(configs)} combinations x {len(seeds)} seeds = {total} games on {args.workers} workers")
+
+    columns = ["config", "seed"] + [get_parameter_name(path) for path in sweep["Parameters"]]
+    columns += ["won", "waves_survived", "health", "ticks", "sim_seconds", "money_curve"]
+
+    results = []
+    start = time.perf_counter()
+    with open(args.output, "w", newline="") as file, \
+            concurrent.futures.ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as executor:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+
+        futures = [executor.submit(play_game, sweep, config_index, parameters, seed)
+                   for config_index, parameters in enumerate(configs) for seed in seeds]
+        for finished, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+
+            # Write each game as soon as it finishes, so partial results survive an interrupted sweep
+            parameters = configs[result["config"]]
+            writer.writerow([result["config"], result["seed"]] + [parameters[path] for path in sweep["Parameters"]]
+                            + [result["won"], result["waves_survived"], result["health"], result["ticks"],
+                               f"{result['sim_seconds']:.4f}", ";".join(str(money) for money in result["money_curve"])])
+            file.flush()
+            if finished % 100 == 0 or finished == total:
+                print(f"  {finished}/{total} games ({time.perf_counter() - start:.1f}s)")
+
+    summarise(results, configs)
+    print(f"\nWrote {len(results)} games to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
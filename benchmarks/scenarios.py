@@ -0,0 +1,69 @@
+# Benchmark scenarios - each one is a map, difficulty, tower layout and range of waves (from GAME_DATA) to simulate headlessly.
+#
+# "Towers" lists (tower class name, grid x, grid y, upgrade level) for every tower placed before the first wave.
+# "Waves" is the (first, last) wave to simulate, inclusive. Earlier waves are skipped rather than played.
+# Scenarios run in practise mode, so tower costs and lost health never cut a run short.
+
+SCENARIOS = {
+    "easy_opening": {
+        "Map": "Demonstration_Map",
+        "Difficulty": "Easy",
+        "Towers": [
+            ("TurretTower", 3, 2, 0),
+            ("TurretTower", 5, 5, 0),
+        ],
+        "Waves": (1, 5),
+        "Seed": 1,
+    },
+    "normal_midgame": {
+        "Map": "Marsh_Mallows",
+        "Difficulty": "Normal",
+        "Towers": [
+            ("TurretTower", 2, 1, 2),
+            ("LaserTower", 4, 4, 2),
+            ("BombTower", 2, 4, 1),
+            ("SawTower", 5, 6, 1),
+            ("BirdFlamethrowerTower", 7, 7, 1),
+        ],
+        "Waves": (10, 13),
+        "Seed": 2,
+    },
+    "hard_late_waves": {
+        "Map": "Demonstration_Map",
+        "Difficulty": "Hard",
+        "Towers": [
+            ("LaserTower", 3, 1, 3),
+            ("LaserTower", 5, 1, 3),
+            ("BirdFlamethrowerTower", 3, 3, 3),
+            ("BirdFlamethrowerTower", 5, 3, 3),
+            ("BombTower", 3, 5, 3),
+            ("BombTower", 5, 5, 3),
+            ("SawTower", 3, 7, 3),
+            ("SawTower", 5, 7, 3),
+            ("TurretTower", 3, 8, 3),
+            ("TurretTower", 5, 8, 3),
+        ],
+        "Waves": (30, 32),
+        "Seed": 3,
+    },
+    "undefended_swarm": {
+        "Map": "Marsh_Mallows",
+        "Difficulty": "Hard",
+        "Towers": [],
+        "Waves": (20, 21),
+        "Seed": 4,
+    },
+    "branching_routes": {
+        "Map": "Fondue_Fork",
+        "Difficulty": "Normal",
+        "Towers": [
+            ("TurretTower", 4, 1, 2),
+            ("LaserTower", 4, 5, 2),
+            ("BombTower", 4, 6, 2),
+            ("BirdFlamethrowerTower", 3, 8, 1),
+            ("SawTower", 5, 8, 1),
+        ],
+        "Waves": (10, 13),
+        "Seed": 5,
+    },
+}
@@ -0,0 +1,60 @@
+# Balance sweeps - each one plays whole headless games for every combination of parameter values, to see how the values affect balance.
+#
+# "Build" is the build order the simulated player follows: (tower class name, grid x, grid y, upgrade level) steps, bought in order
+# before each wave for as long as the player can afford the next one. A repeated tower position upgrades the tower placed there.
+# "Parameters" maps each tuned value to the values to try. A value is addressed by a path of keys - starting with "GAME_DATA" for
+# GAME_DATA (e.g. ("GAME_DATA", "Normal", "Default_Spawn_Interval")), or with a tower class name for its tower_data
+# (e.g. ("TurretTower", "UPGRADE 0", "Range")).
+# "Seeds" is the number of games played for each combination, each with a different seed.
+# "Max Waves" optionally stops each game after that many waves, instead of playing to the difficulty's last wave. A game is only
+# won by beating the last wave (as in the game), so games stopped early are never won - compare their waves survived instead.
+
+DEMONSTRATION_BUILD = [
+    ("TurretTower", 3, 2, 0),
+    ("TurretTower", 5, 5, 0),
+    ("TurretTower", 3, 2, 1),
+    ("BombTower", 3, 5, 0),
+    ("TurretTower", 5, 5, 1),
+    ("LaserTower", 5, 1, 0),
+    ("BombTower", 3, 5, 2),
+    ("SawTower", 3, 7, 1),
+    ("BirdFlamethrowerTower", 5, 3, 1),
+    ("TurretTower", 3, 2, 3),
+    ("LaserTower", 5, 1, 3),
+    ("BombTower", 3, 5, 3),
+    ("SawTower", 3, 7, 3),
+    ("BirdFlamethrowerTower", 5, 3, 3),
+]
+
+SWEEPS = {
+    "normal_spawn_rate": {
+        "Map": "Demonstration_Map",
+        "Difficulty": "Normal",
+        "Build": DEMONSTRATION_BUILD,
+        "Parameters": {
+            ("GAME_DATA", "Normal", "Default_Spawn_Interval"): [40, 50, 60],
+            ("GAME_DATA", "Normal", "Increment", "marshmallow enemy"): [3, 4, 5],
+            ("GAME_DATA", "Normal", "Increment", "cracker enemy"): [1.5, 2, 2.5],
+        },
+        "Seeds": 5,
+    },
+    "turret_stats": {
+        "Map": "Demonstration_Map",
+        "Difficulty": "Easy",
+        "Build": [
+            ("TurretTower", 3, 2, 0),
+            ("TurretTower", 5, 5, 0),
+            ("TurretTower", 3, 5, 0),
+            ("TurretTower", 3, 2, 3),
+            ("TurretTower", 5, 5, 3),
+            ("TurretTower", 3, 5, 3),
+        ],
+        "Parameters": {
+            ("TurretTower", "UPGRADE 0", "Cost"): [20, 25, 30],
+            ("TurretTower", "UPGRADE 0", "Bullet Damage"): [5, 6, 7],
+            ("TurretTower", "UPGRADE 1", "Cost"): [75, 100],
+        },
+        "Seeds": 5,
+        "Max Waves": 10,
+    },
+}
@@ -0,0 +1,49 @@
+import os
+import pygame
+from Constants import config, sprites
+from benchmarks.build_atlas import build_atlas, pack
+
+def test_pack_has_no_overlaps():
+    """Test that packed rectangles fit in the sheet without overlapping"""
+    sizes = [(64, 64), (21, 21), (64, 64), (30, 10), (100, 5)] * 4
+    positions, height = pack(sizes, sheet_width=200, padding=1)
+    rects = [pygame.Rect(position, size) for position, size in zip(positions, sizes)]
+    sheet = pygame.Rect(0, 0, 200, height)
+    for i, rect in enumerate(rects):
+        assert sheet.contains(rect)
+        assert rect.collidelist(rects[:i] + rects[i + 1:]) == -1
+
+def test_committed_atlas_is_up_to_date(tmp_path):
+    """Test that the atlas in the repository matches one built from the current sprites"""
+    built = build_atlas(str(tmp_path / "atlas.json"))
+    registry = sprites.AssetRegistry()
+    registry.use_atlas(config.SPRITE_ATLAS)
+    assert {frame["name"] for frame in built["frames"]} == {name for name, _, _ in registry.atlas_frames}
+    committed = pygame.image.load(registry.atlas_image)
+    rebuilt = pygame.image.load(str(tmp_path / "atlas.png"))
+    assert pygame.image.tobytes(committed, "RGBA") == pygame.image.tobytes(rebuilt, "RGBA")
+
+def test_sprites_share_the_atlas_sheet():
+    """Test that atlas sprites (and their pre-scaled sizes) are cut from one sheet, even after converting it"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without opening a window
+    pygame.display.quit()
+    registry = sprites.AssetRegistry()
+    registry.assets = dict(sprites.assets.assets)
+    registry.use_atlas(config.SPRITE_ATLAS)
+
+    fireball = registry.get("FIREBALL_SPRITE")
+    assert fireball.get_parent() is registry.atlas_sheet
+    assert registry.get("SMORE_SPRITE").get_parent() is registry.atlas_sheet
+    assert registry.get_scaled(fireball, 64, 64).get_parent() is registry.atlas_sheet
+    assert list(registry.load_times) == [registry.atlas_image]  # No sprite was loaded from its own file
+
+    pygame.display.init()
+    pygame.display.set_mode((16, 16))
+    try:
+        registry.convert_all()
+        fireball = registry.get("FIREBALL_SPRITE")
+        assert fireball.get_parent() is registry.atlas_sheet
+        assert registry.get("SMORE_SPRITE").get_parent() is registry.atlas_sheet
+        assert registry.get_scaled(fireball, 64, 64).get_parent() is registry.atlas_sheet
+    finally:
+        pygame.display.quit()
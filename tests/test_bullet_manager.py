@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import MagicMock
+from Game.Managers.bullet_manager import BulletManager
+from Game.Core.spatial_hash import SpatialHash
+from Entities.Projectiles.base_projectile import Projectile
+from Entities.Projectiles.saw import Saw
+from Entities.Projectiles.bomb import Bomb
+import pygame
+
+@pytest.fixture
+def bullet_manager():
+    """Fixture to create a BulletManager with no enemies"""
+    game_state = MagicMock()
+    game_state.enemy_manager.enemy_grid = SpatialHash()
+    return BulletManager(game_state)
+
+@pytest.fixture
+def target():
+    """Fixture to create a stationary target for bullets to aim at"""
+    target = MagicMock()
+    target.centre_position = target.prev_centre_position = (300, 300)
+    return target
+
+def test_inactive_bullets_are_recycled(bullet_manager, target):
+    """Test that inactive bullets are removed in place and reused for the next shot"""
+    bullets = bullet_manager.bullets
+    first = bullet_manager.spawn(Projectile, 100, 100, target, 5, 1)
+    second = bullet_manager.spawn(Projectile, 100, 100, target, 5, 1)
+    first.active = False
+    bullet_manager.check_bullet_collisions()
+
+    assert bullet_manager.bullets is bullets
+    assert bullet_manager.bullets == [second]
+    assert first.target is None  # References to enemies are dropped when recycled
+
+    third = bullet_manager.spawn(Projectile, 200, 150, target, 5, 1)
+    assert third is first
+    assert third.active and (third.x_pos, third.y_pos) == (200, 150)
+    assert bullet_manager.allocated_count == 2
+    assert bullet_manager.reused_count == 1
+
+def test_pools_are_per_class(bullet_manager, target):
+    """Test that a recycled projectile is only reused for its own class, with its state reset"""
+    saw = bullet_manager.spawn(Saw, 100, 100, target, 5, 1, 3)
+    saw.enemy_hit_list.append(target)
+    saw.active = False
+    bullet_manager.check_bullet_collisions()
+
+    assert bullet_manager.spawn(Projectile, 100, 100, target, 5, 1) is not saw
+    reused_saw = bullet_manager.spawn(Saw, 100, 100, target, 5, 1, 2)
+    assert reused_saw is saw
+    assert reused_saw.enemy_hit_list == []
+    assert reused_saw.pierce_number == 2
+
+def test_bullets_off_the_map_are_removed(bullet_manager, target):
+    """Test that bullets which leave the map are deactivated and recycled"""
+    bullet = bullet_manager.spawn(Projectile, 100, 100, target, 5, 1)
+    bullet.x_pos = -50
+    bullet_manager.check_bullet_collisions()
+    assert bullet_manager.bullets == []
+    assert bullet_manager.pools[Projectile] == [bullet]
+
+def test_bomb_splash_reaches_enemies_in_line_on_either_axis(target):
+    """Test that bomb splash hits enemies within the radius on x or on y, however far away they are on the other axis"""
+    def make_enemy(x, y):
+        enemy = MagicMock()
+        enemy.position = (x, y)
+        enemy.hitbox = pygame.Rect(x, y, 64, 64)
+        return enemy
+
+    direct, same_column, same_row, diagonal = make_enemy(290, 290), make_enemy(330, 700), make_enemy(1000, 250), make_enemy(600, 600)
+    enemy_grid = SpatialHash()
+    enemy_grid.rebuild([direct, same_column, same_row, diagonal])
+
+    bomb = Bomb(300, 300, target, 5, 10, tile_splash_radius=1)
+    bomb.check_collisions(enemy_grid)
+
+    direct.take_damage.assert_called_once_with(10, damage_type="Bomb")
+    same_column.take_damage.assert_called_once_with(5, damage_type="Bomb")
+    same_row.take_damage.assert_called_once_with(5, damage_type="Bomb")
+    diagonal.take_damage.assert_not_called()
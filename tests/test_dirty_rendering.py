@@ -0,0 +1,65 @@
+import os
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without opening a window
+
+import pygame
+from Game.Core.game import Game
+from Entities.Towers.Turret_Tower import TurretTower
+
+@pytest.fixture
+def game():
+    """Fixture to create the game with a (hidden) window"""
+    return Game()
+
+def draw_frame(game, full_screen):
+    """Runs a frame, drawing it in dirty rectangle mode onto the game's screen and in full onto full_screen"""
+    game.state_manager.update([])
+    game.update_ticks(1 / 60)
+    dirty_rects = game.state_manager.draw_dirty(game.screen, 60)
+    full_screen.fill((0, 0, 0))
+    game.state_manager.draw(full_screen, 60)
+    return dirty_rects
+
+def test_idle_menu_redraws_nothing(game):
+    """Test that the menu is drawn in full once, then not redrawn while nothing changes"""
+    full_screen = game.screen.copy()
+    assert draw_frame(game, full_screen) == [game.screen.get_rect()]
+    assert draw_frame(game, full_screen) == []
+
+def test_dirty_rendering_matches_full_redraw(game):
+    """Test that redrawing only the changed regions while a wave is played looks the same as redrawing everything"""
+    full_screen = game.screen.copy()
+    game.state_manager.change_state("Game_State", "Marsh_Mallows")
+    game_state = game.state_manager.current_state
+    game_state.tower_manager.place_tower(TurretTower, 2, 3)
+    game_state.wave_manager.next_wave()
+
+    for _ in range(300):
+        dirty_rects = draw_frame(game, full_screen)
+        assert pygame.image.tobytes(game.screen, "RGB") == pygame.image.tobytes(full_screen, "RGB")
+    assert sum(rect.width * rect.height for rect in dirty_rects) < game.screen.get_width() * game.screen.get_height()
+
+def test_dirty_frame_draws_state_once(game, monkeypatch):
+    """Test that a dirty frame draws the state once, so an error message counts down as fast as with full redraws"""
+    game.state_manager.change_state("Game_State", "Marsh_Mallows")
+    game_state = game.state_manager.current_state
+    game_state.tower_manager.place_tower(TurretTower, 2, 3)
+    game_state.wave_manager.next_wave()
+    for _ in range(120):  # Let enemies spread out so the frame has several separate changed parts
+        game.state_manager.update([])
+        game.update_ticks(1 / 60)
+        game.state_manager.draw_dirty(game.screen, 60)
+
+    draw_calls = []
+    draw = game_state.draw
+    monkeypatch.setattr(game_state, "draw", lambda screen: draw_calls.append(screen) or draw(screen))
+    game_state.ui_manager.change_error_message("test")
+    display_time = game_state.ui_manager.error_message_display_time
+
+    game.state_manager.update([])
+    game.update_ticks(1 / 60)
+    dirty_rects = game.state_manager.draw_dirty(game.screen, 60)
+    assert len(dirty_rects) > 1
+    assert len(draw_calls) == 1
+    assert game_state.ui_manager.error_message_display_time == display_time - 1
@@ -0,0 +1,38 @@
+import pytest
+from Game.Map.enemy_path import EnemyPath
+from Constants import config
+
+@pytest.fixture
+def enemy_path():
+    """Fixture to create an L-shaped path made of 64px segments"""
+    return EnemyPath([(0, 80), (64, 80), (128, 80), (128, 144)])
+
+def test_length(enemy_path):
+    """Test that the path's length is the sum of its segments"""
+    assert enemy_path.length == 192
+    assert enemy_path.segment_length == 64
+
+def test_get_position(enemy_path):
+    """Test that positions are interpolated along the path and clamped to its ends"""
+    assert enemy_path.get_position(0) == (0, 80)
+    assert enemy_path.get_position(70) == (70, 80)
+    assert enemy_path.get_position(140) == (128, 92)
+    assert enemy_path.get_position(500) == (128, 144)
+
+def test_get_position_uneven_segments():
+    """Test that paths with uneven segments are looked up correctly"""
+    enemy_path = EnemyPath([(0, 0), (10, 0), (10, 100)])
+    assert enemy_path.segment_length is None
+    assert enemy_path.get_position(5) == (5, 0)
+    assert enemy_path.get_position(60) == (10, 50)
+
+def test_get_grid_position(enemy_path):
+    """Test that the grid position is the cell containing the enemy's centre"""
+    assert enemy_path.get_grid_position(0) == (0, 0)
+    assert enemy_path.get_grid_position(192) == (2, 1)
+
+def test_get_progress(enemy_path):
+    """Test that progress goes from 0 at the start to 1 at the exit"""
+    assert enemy_path.get_progress(0) == 0
+    assert enemy_path.get_progress(96) == 0.5
+    assert enemy_path.get_progress(1000) == 1
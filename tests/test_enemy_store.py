@@ -0,0 +1,87 @@
+import pytest
+from Game.Core.simulation import Simulation
+from Game.Core.enemy_store import EnemyStore
+from Game.Map.enemy_path import EnemyPath
+from Entities.Towers.Turret_Tower import TurretTower
+from Constants import config
+
+np = pytest.importorskip("numpy")
+
+def spawn_enemies(vectorized):
+    """Creates a simulation with one of each moving enemy type, with or without the enemy store"""
+    simulation = Simulation("Demonstration_Map", practise=True)
+    simulation.enemy_manager.enemy_store = EnemyStore() if vectorized else None
+    for enemy_name in ("marshmallow enemy", "white_chocolate enemy", "cracker enemy", "dark_chocolate enemy"):
+        simulation.enemy_manager.create_enemy(enemy_name)
+    return simulation
+
+def test_store_matches_unvectorized_movement():
+    """Test that batched movement follows the path exactly like moving enemies one at a time"""
+    scalar, vectorized = spawn_enemies(False), spawn_enemies(True)
+    assert vectorized.enemy_manager.enemy_store.count == 4
+
+    for _ in range(100):
+        scalar.enemy_manager.update_enemies()
+        vectorized.enemy_manager.update_enemies()
+        for scalar_enemy, vector_enemy in zip(scalar.enemy_manager.enemies, vectorized.enemy_manager.enemies):
+            assert vector_enemy.position == scalar_enemy.position
+            assert vector_enemy.grid_position == scalar_enemy.grid_position
+            assert vector_enemy.distance == scalar_enemy.distance
+
+def test_speed_changes_reach_the_store():
+    """Test that enemy speed changes (e.g. melting) are written to the store's arrays"""
+    simulation = spawn_enemies(True)
+    dark_chocolate = simulation.enemy_manager.enemies[3]
+    dark_chocolate.take_damage(10, damage_type="Fire")
+
+    store = simulation.enemy_manager.enemy_store
+    assert store.speeds[dark_chocolate.slot] == 2
+
+def test_removed_enemy_keeps_its_state():
+    """Test that an enemy removed from the store keeps its last position and stats"""
+    simulation = spawn_enemies(True)
+    for _ in range(10):
+        simulation.enemy_manager.update_enemies()
+
+    enemy = simulation.enemy_manager.enemies[0]
+    position, health = enemy.position, enemy.health
+    enemy.remove_self(simulation)
+
+    assert enemy.store is None
+    assert enemy.position == position
+    assert enemy.health == health
+    assert simulation.enemy_manager.enemy_store.count == 3
+    # The remaining enemies still read their own rows after the store was compacted
+    store = simulation.enemy_manager.enemy_store
+    assert all(store.enemies[other.slot] is other for other in simulation.enemy_manager.enemies)
+
+def test_positions_on_several_paths():
+    """Test that looking up positions for enemies on different paths in one batch matches each path's own lookup"""
+    store = EnemyStore()
+    paths = [
+        EnemyPath([(0, 80), (64, 80), (64, 144)]),
+        EnemyPath([(0, 0), (10, 0), (10, 100)]),  # Uneven segments
+        EnemyPath([(300, 300)]),  # A single waypoint
+        EnemyPath([]),
+    ]
+    path_ids = [store.register_path(path) for path in paths]
+    assert store.register_path(paths[0]) == path_ids[0]
+
+    lookups = [(path_id, distance) for path_id, path in zip(path_ids, paths) for distance in (0, 5, 63.5, 64, 70, path.length, 1000)]
+    positions = store.get_positions(np.array([path_id for path_id, _ in lookups]), np.array([distance for _, distance in lookups], dtype=float))
+    for (path_id, distance), position in zip(lookups, positions):
+        assert tuple(position) == paths[path_id].get_position(distance)
+
+def test_both_backends_play_the_same_game(monkeypatch):
+    """Test that a seeded game plays out identically with and without the enemy store"""
+    summaries = []
+    for vectorized in (True, False):
+        monkeypatch.setattr(config, "VECTORIZED_ENEMIES", vectorized)
+        simulation = Simulation("Marsh_Mallows", difficulty="Normal", practise=True)
+        simulation.load_level("Marsh_Mallows", seed=11)
+        assert (simulation.enemy_manager.enemy_store is not None) == vectorized
+        simulation.tower_manager.place_tower(TurretTower, 2, 1)
+        for _ in range(4):
+            simulation.run_wave(max_ticks=3000)
+        summaries.append(simulation.get_summary())
+    assert summaries[0] == summaries[1]
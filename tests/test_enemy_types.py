@@ -0,0 +1,43 @@
+import pytest
+from Game.Core.simulation import Simulation
+from Game.Core.game_data import ENEMY_CLASS_MAP
+from Entities.Enemies.enemy_types import ENEMY_TYPES
+from Entities.Enemies.cracker_enemy import Cracker
+from Constants import sprites
+
+@pytest.fixture
+def path():
+    """Fixture for the demonstration map's enemy path"""
+    return Simulation("Demonstration_Map").map.enemy_path
+
+def test_every_enemy_has_a_type():
+    """Test that every enemy class uses the type table entry with its name"""
+    for enemy_name, enemy_class in ENEMY_CLASS_MAP.items():
+        assert enemy_class.enemy_type is ENEMY_TYPES[enemy_name]
+
+def test_enemies_only_store_their_own_state(path):
+    """Test that enemies have no instance dict, and start with their type's stats"""
+    for enemy_name, enemy_class in ENEMY_CLASS_MAP.items():
+        enemy = enemy_class(path)
+        assert not hasattr(enemy, "__dict__")
+        assert enemy.health == enemy.max_health == ENEMY_TYPES[enemy_name].max_health
+        assert enemy.reward == ENEMY_TYPES[enemy_name].reward
+        assert enemy.sprite is sprites.get_sprite(ENEMY_TYPES[enemy_name].sprite_name)
+
+def test_enemy_type_table_is_read_only():
+    """Test that the shared enemy types can't be changed"""
+    with pytest.raises(TypeError):
+        ENEMY_TYPES["cracker enemy"] = None
+    with pytest.raises(AttributeError):
+        ENEMY_TYPES["cracker enemy"].reward = 100
+
+def test_broken_cracker(path):
+    """Test that a broken cracker changes only its own state"""
+    cracker, other_cracker = Cracker(path), Cracker(path)
+    cracker.take_damage(5, damage_type="Bomb")
+    assert cracker.broken is True
+    assert cracker.sprite is sprites.get_sprite(ENEMY_TYPES["cracker enemy"].damaged_sprite_name)
+    assert cracker.speed == ENEMY_TYPES["cracker enemy"].damaged_speed
+    assert cracker.armour == 0
+    assert other_cracker.sprite is sprites.get_sprite(ENEMY_TYPES["cracker enemy"].sprite_name)
+    assert other_cracker.armour == ENEMY_TYPES["cracker enemy"].armour
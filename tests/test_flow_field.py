@@ -0,0 +1,105 @@
+import copy
+import random
+from collections import Counter
+from Game.Core.simulation import Simulation
+from Game.Map.map import Map
+from Game.Map.grid import Grid
+from Game.Map.coordinates import GridCoord
+from Game.Map.flow_field import FlowField, find_distances, find_tiles, flow_field_cache, SPAWN_TILE
+from Game.Map.maps import MAP_DATA
+
+def test_distances_to_nearest_exit():
+    """Test that each walkable tile's distance is the number of steps to the closest exit"""
+    flow_field = Grid(copy.deepcopy(MAP_DATA["Fondue_Fork"]["grid"])).get_flow_field()
+    assert flow_field.get_distance(GridCoord(0, 9)) == 0  # Exit
+    assert flow_field.get_distance(GridCoord(4, 9)) == 4  # Halfway between the exits
+    assert flow_field.get_distance(GridCoord(0, 0)) == 21
+    assert flow_field.get_distance(GridCoord(9, 0)) == 22
+    assert flow_field.get_distance(GridCoord(0, 3)) is None  # Not walkable
+    assert flow_field.get_next_steps(GridCoord(4, 4)) == (GridCoord(3, 4), GridCoord(5, 4))  # Fork
+    assert flow_field.get_next_steps(GridCoord(4, 3)) == (GridCoord(4, 4),)
+
+def test_routes_end_next_to_an_exit():
+    """Test that routes run from a spawn point to the tile before an exit, one step at a time"""
+    flow_field = Grid(copy.deepcopy(MAP_DATA["Fondue_Fork"]["grid"])).get_flow_field()
+    rng = random.Random(3)
+    for _ in range(20):
+        cells = flow_field.get_route(rng=rng).get_grid_coords()
+        assert cells[0] in flow_field.spawns
+        assert flow_field.get_distance(cells[-1]) == 1
+        for cell, next_cell in zip(cells, cells[1:]):
+            assert abs(cell.x - next_cell.x) + abs(cell.y - next_cell.y) == 1
+
+def test_forks_follow_weights():
+    """Test that enemies pick between spawn points and branches in proportion to their weights"""
+    game_map = Map("Fondue_Fork")
+    rng = random.Random(5)
+    routes = [game_map.choose_enemy_path(rng) for _ in range(3000)]
+    assert len(set(routes)) == 8  # 2 spawn points x 2 branches x 2 exits
+    went_right = Counter(GridCoord(5, 4).to_pixel() in path.waypoints for path in routes)
+    assert 1.7 < went_right[True] / went_right[False] < 2.3
+
+def test_weighted_longer_branches_are_taken():
+    """Test that a weighted branch is taken even if it is longer, while unweighted longer branches never are"""
+    layout = [
+        [3, 1, 1, 1, 4],
+        [0, 1, 0, 1, 0],  # The branch down at (1, 1) loops round to (3, 0), four steps longer
+        [0, 1, 1, 1, 0],
+    ]
+    short_route = (GridCoord(0, 0), GridCoord(1, 0), GridCoord(2, 0), GridCoord(3, 0))
+    rng = random.Random(1)
+    assert all(FlowField(layout).get_route(rng=rng).get_grid_coords() == short_route for _ in range(50))
+
+    flow_field = FlowField(layout, {(1, 1): 3})
+    assert flow_field.has_route_choices()
+    rng = random.Random(2)
+    routes = Counter(flow_field.get_route(rng=rng).get_grid_coords() for _ in range(2000))
+    long_route = (GridCoord(0, 0), GridCoord(1, 0), GridCoord(1, 1), GridCoord(1, 2), GridCoord(2, 2), GridCoord(3, 2),
+                  GridCoord(3, 1), GridCoord(3, 0))
+    assert set(routes) == {short_route, long_route}  # Never turns back, and still ends next to the exit
+    assert 2.5 < routes[long_route] / routes[short_route] < 3.5
+
+def test_single_route_maps_make_no_choices():
+    """Test that maps with one route always give the same path, without using the random number generator"""
+    for map_name in ("Marsh_Mallows", "Demonstration_Map"):
+        game_map = Map(map_name)
+        rng = random.Random(1)
+        state = rng.getstate()
+        assert game_map.choose_enemy_path(rng) is game_map.enemy_path
+        assert rng.getstate() == state
+
+def test_flow_field_cache_ignores_towers():
+    """Test that grids with the same layout share a cached search, whatever towers are placed"""
+    grid = copy.deepcopy(MAP_DATA["Fondue_Fork"]["grid"])
+    first = FlowField(grid)
+    grid[3][0] = 2  # Tower
+    second = FlowField(grid)
+    assert second.distances == first.distances
+    assert second.distances is not first.distances  # Each flow field can be patched separately
+    assert len(flow_field_cache) > 0
+
+def test_incremental_updates_match_full_search():
+    """Test that patching the flow field after random tile changes gives the same distances as searching again"""
+    rng = random.Random(7)
+    for _ in range(20):
+        layout = [[1 if rng.random() < 0.6 else 0 for _ in range(8)] for _ in range(8)]
+        layout[rng.randrange(8)][rng.randrange(8)] = 3
+        layout[rng.randrange(8)][rng.randrange(8)] = 4
+        grid = Grid(layout)
+        flow_field = grid.get_flow_field()
+        for _ in range(50):
+            x, y = rng.randrange(8), rng.randrange(8)
+            grid.set_tile(rng.choice((0, 1, 1, 2, 3, 4)), x, y)
+            assert flow_field.distances == find_distances(grid.grid)
+            assert flow_field.spawns == find_tiles(grid.grid, SPAWN_TILE)
+
+def test_branching_map_games_are_reproducible():
+    """Test that enemies spread over a branching map's routes, the same way for the same seed"""
+    summaries = []
+    for _ in range(2):
+        simulation = Simulation("Fondue_Fork", difficulty="Easy")
+        simulation.load_level("Fondue_Fork", seed=42)
+        simulation.run_wave(max_ticks=600)
+        assert len({enemy.path for enemy in simulation.enemy_manager.enemies}) > 1
+        summaries.append(simulation.get_summary())
+    assert summaries[0] == summaries[1]
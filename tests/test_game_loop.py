@@ -0,0 +1,26 @@
+import os
+import time
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without opening a window
+
+from Game.Core.game import Game
+
+@pytest.fixture
+def game():
+    """Fixture to create the game with a (hidden) window, at uncapped game speed"""
+    game = Game()
+    game.game_speed = None
+    return game
+
+def test_uncapped_speed_only_runs_in_game(game):
+    """Test that uncapped speed doesn't spend whole frames ticking menus, which have nothing to simulate"""
+    start = time.perf_counter()
+    game.update_ticks(1 / 60)
+    assert game.uncapped_frame is False
+    assert time.perf_counter() - start < 0.5 / 60
+
+    game.state_manager.change_state("Game_State", "Demonstration_Map")
+    game.update_ticks(1 / 60)
+    assert game.uncapped_frame is True
+    assert game.state_manager.current_state.simulation.tick > 1
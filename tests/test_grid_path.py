@@ -0,0 +1,27 @@
+import copy
+from Constants import config
+from Game.Map.grid import Grid
+from Game.Map.coordinates import GridCoord, PixelCoord
+from Game.Map.maps import MAP_DATA
+
+def test_path_views():
+    """Test that the path is given as typed grid coordinates and matching pixel coordinates"""
+    grid = Grid(copy.deepcopy(MAP_DATA["Marsh_Mallows"]["grid"]))
+    cells = grid.get_path().get_grid_coords()
+    assert cells[:4] == (GridCoord(1, 0), GridCoord(1, 1), GridCoord(1, 2), GridCoord(2, 2))
+    assert cells[-1] == GridCoord(8, 8)
+    pixels = grid.get_path().get_pixel_coords()
+    assert pixels[0] == PixelCoord(config.GRID_CELL_SIZE, config.SCREEN_TOPBAR_HEIGHT)
+    assert [pixel.to_grid() for pixel in pixels] == list(cells)
+    assert grid.find_path() == list(pixels)
+    assert grid.find_enemy_start_pos() == pixels[0]
+
+def test_towers_do_not_change_the_path():
+    """Test that placing and removing towers leaves the path alone"""
+    grid = Grid(copy.deepcopy(MAP_DATA["Marsh_Mallows"]["grid"]))
+    path = grid.get_path()
+    distances = dict(grid.get_flow_field().distances)
+    grid.set_tile(2, 0, 0)
+    grid.set_tile(0, 0, 0)
+    assert grid.get_path() is path
+    assert grid.get_flow_field().distances == distances
@@ -0,0 +1,30 @@
+import pytest
+from Game.Core import logger
+
+@pytest.fixture(autouse=True)
+def restore_categories():
+    """Fixture to restore which log categories are enabled after each test"""
+    enabled = [name for name, category in logger.CATEGORIES.items() if category.enabled]
+    yield
+    logger.configure(enabled)
+
+def test_disabled_category_prints_nothing(capsys):
+    """Test that a disabled category neither prints nor formats its message"""
+    logger.set_enabled("combat", False)
+    logger.combat("Enemy taken %s damage", 5)
+    logger.combat("%s %s", "formatting would fail here")  # Too few arguments, but never formatted
+    assert capsys.readouterr().out == ""
+
+def test_toggle_category_at_runtime(capsys):
+    """Test that categories can be switched on and off individually"""
+    logger.configure(["none"])
+    assert logger.toggle("path") is True
+    logger.path("Moving from %s to %s", (0, 1), (0, 2))
+    logger.spawn("Created enemy %s", "marshmallow enemy")
+    assert capsys.readouterr().out == "[path] Moving from (0, 1) to (0, 2)\n"
+    assert logger.toggle("path") is False
+
+def test_unknown_category_raises():
+    """Test that switching an unknown category raises an error"""
+    with pytest.raises(ValueError):
+        logger.set_enabled("graphics", True)
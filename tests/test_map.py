@@ -3,6 +3,8 @@ from Game.Map.map import Map
 from Game.Map.maps import MAP_DATA
 from Game.Map.grid import Grid
 import copy
+import pygame
+from Constants import config
 
 @pytest.fixture
 def test_map():
@@ -84,3 +86,33 @@ def test_reset_map(test_map):
     # Call reset_map and verify the grid is restored to its original state
     test_map.reset_map()
     assert test_map.map_grid.grid == original_grid  # Grid should be reset to original
+
+def test_static_layer_matches_direct_drawing(test_map):
+    """Test that the cached map layer looks the same as drawing the grid straight onto the screen"""
+    cached_screen = pygame.Surface((config.GRID_SIZE, config.GRID_SIZE + config.SCREEN_TOPBAR_HEIGHT))
+    direct_screen = cached_screen.copy()
+
+    test_map.draw(cached_screen)
+    direct_screen.fill((200, 200, 200), (0, config.SCREEN_TOPBAR_HEIGHT, config.GRID_SIZE, config.GRID_SIZE))
+    test_map.map_grid.draw_grid(direct_screen)
+
+    assert pygame.image.tobytes(cached_screen, "RGB") == pygame.image.tobytes(direct_screen, "RGB")
+
+def test_static_layer_invalidated_by_grid_changes(test_map):
+    """Test that the cached map layer is only re-rendered after the grid changes"""
+    screen = pygame.Surface((config.GRID_SIZE, config.GRID_SIZE + config.SCREEN_TOPBAR_HEIGHT))
+    test_map.draw(screen)
+    layer = test_map.static_layer
+
+    test_map.draw(screen)
+    assert test_map.static_layer is layer  # Reused while nothing changes
+
+    x, y = next((x, y) for y, row in enumerate(test_map.map_grid.grid) for x, cell in enumerate(row) if cell == 0)
+    test_map.place_tower(x, y)
+    assert test_map.static_layer is None
+    test_map.draw(screen)
+    test_map.remove_tower(x, y)
+    assert test_map.static_layer is None
+    test_map.draw(screen)
+    test_map.reset_map()
+    assert test_map.static_layer is None
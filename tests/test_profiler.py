@@ -0,0 +1,46 @@
+import csv
+import json
+import pytest
+from Game.Core.profiler import Profiler
+
+@pytest.fixture
+def profiler():
+    """Fixture to create an enabled profiler"""
+    profiler = Profiler(window=100)
+    profiler.enabled = True
+    return profiler
+
+def test_disabled_profiler_records_nothing():
+    """Test that nothing is measured while the profiler is off"""
+    profiler = Profiler()
+    with profiler.section("Draw Map"):
+        pass
+    profiler.record("Enemies", 0, 1000)
+    assert profiler.samples == {}
+    assert len(profiler.events) == 0
+
+def test_percentiles_use_recent_samples(profiler):
+    """Test that p50/p99 come from the rolling window of each section's durations"""
+    for duration in range(1, 201):  # Only the last 100 (101 to 200 microseconds) are kept
+        profiler.record("Enemies", 0, duration * 1000)
+    p50, p99 = profiler.get_percentiles("Enemies")
+    assert p50 == pytest.approx(0.151)
+    assert p99 == pytest.approx(0.2)
+    assert profiler.get_summary() == [("Enemies", p50, p99)]
+
+def test_exports(profiler, tmp_path):
+    """Test that measurements are exported as CSV rows and Chrome trace events"""
+    profiler.record("Towers", 5000, 7000)
+    with profiler.section("Draw UI"):
+        pass
+
+    profiler.export_csv(tmp_path / "profile.csv")
+    with open(tmp_path / "profile.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["section"] for row in rows] == ["Towers", "Draw UI"]
+    assert float(rows[0]["duration_us"]) == 2
+
+    profiler.export_chrome_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as file:
+        events = json.load(file)["traceEvents"]
+    assert events[0] == {"name": "Towers", "ph": "X", "ts": 5, "dur": 2, "pid": 0, "tid": 0}
@@ -0,0 +1,78 @@
+import pytest
+from Game.Core.simulation import Simulation
+from Game.Core.replay import Replay
+from Game.Core.replay_runner import run_replay
+from Entities.Towers.Turret_Tower import TurretTower
+from Constants import config
+
+def record_game(wave_ticks=300):
+    """Plays a short seeded game with a few player actions, running each wave for up to wave_ticks ticks"""
+    simulation = Simulation("Demonstration_Map", difficulty="Easy")
+    simulation.load_level("Demonstration_Map", seed=1234)
+    simulation.tower_manager.place_tower(TurretTower, 3, 3)
+    simulation.run_wave(max_ticks=wave_ticks)
+    simulation.tower_manager.upgrade_tower(3, 3)
+    simulation.tower_manager.place_tower(TurretTower, 5, 5)
+    simulation.run_wave(max_ticks=wave_ticks)
+    simulation.replay.finish(simulation)
+    return simulation
+
+@pytest.fixture
+def recorded_simulation():
+    """Fixture to play a short seeded game with a few player actions"""
+    return record_game()
+
+def test_actions_are_recorded_with_their_tick(recorded_simulation):
+    """Test that every player action is recorded, in order, with the tick it happened on"""
+    actions = [(action, args) for _, action, args in recorded_simulation.replay.actions]
+    assert actions == [
+        ("place_tower", ("TurretTower", 3, 3)),
+        ("next_wave", ()),
+        ("upgrade_tower", (3, 3)),
+        ("place_tower", ("TurretTower", 5, 5)),
+        ("next_wave", ()),
+    ]
+    assert recorded_simulation.replay.actions[0][0] == 0
+    assert recorded_simulation.replay.actions[2][0] > 0
+
+def test_replay_save_and_load(recorded_simulation, tmp_path):
+    """Test that a replay is unchanged by saving and loading it"""
+    path = tmp_path / "replay.json"
+    recorded_simulation.replay.save(path)
+    loaded = Replay.load(path)
+    assert loaded.seed == 1234
+    assert loaded.map_name == "Demonstration_Map"
+    assert loaded.ticks == recorded_simulation.tick
+    assert loaded.actions == recorded_simulation.replay.actions
+    assert loaded.result == recorded_simulation.get_summary()
+
+def test_replay_reproduces_game(recorded_simulation, tmp_path):
+    """Test that running a saved replay reproduces the recorded game's final state exactly"""
+    path = tmp_path / "replay.json"
+    recorded_simulation.replay.save(path)
+    replayed = run_replay(Replay.load(path))
+    assert replayed.get_summary() == recorded_simulation.get_summary()
+
+@pytest.mark.parametrize("recorded_vectorized", [True, False])
+def test_replay_reproduces_game_with_either_enemy_backend(recorded_vectorized, monkeypatch, tmp_path):
+    """Test that a replay recorded with or without the NumPy enemy store plays back identically with the other"""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(config, "VECTORIZED_ENEMIES", recorded_vectorized)
+    recorded = record_game(wave_ticks=3000)  # Whole waves, so enemies die and reach the exit
+    assert (recorded.enemy_manager.enemy_store is not None) == recorded_vectorized
+
+    path = tmp_path / "replay.json"
+    recorded.replay.save(path)
+    monkeypatch.setattr(config, "VECTORIZED_ENEMIES", not recorded_vectorized)
+    replayed = run_replay(Replay.load(path))
+    assert (replayed.enemy_manager.enemy_store is not None) != recorded_vectorized
+    assert replayed.get_summary() == recorded.get_summary()
+
+def test_same_seed_gives_same_spawn_order():
+    """Test that wave spawn order depends only on the seed"""
+    orders = []
+    for _ in range(2):
+        simulation = Simulation("Demonstration_Map", difficulty="Easy")
+        simulation.load_level("Demonstration_Map", seed=99)
+        orders.append(simulation.wave_manager.get_schedule().get_spawns(1))
+    assert orders[0] == orders[1]
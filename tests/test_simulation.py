@@ -0,0 +1,65 @@
+import pytest
+from Game.Core.simulation import Simulation
+from Game.Core.game_data import GAME_DATA
+from Entities.Towers.Turret_Tower import TurretTower
+
+@pytest.fixture
+def simulation():
+    """Fixture to create a headless simulation on the demonstration map"""
+    return Simulation("Demonstration_Map", difficulty="Easy")
+
+def test_simulation_initialization(simulation):
+    """Test that the simulation starts with the difficulty's starting stats"""
+    assert simulation.money == GAME_DATA["Easy"]["Game_Stats"]["Starting Money"]
+    assert simulation.health == GAME_DATA["Easy"]["Game_Stats"]["Starting Health"]
+    assert simulation.wave_manager.difficulty == "Easy"
+    assert simulation.tick == 0
+
+def test_toggle_practise(simulation):
+    """Test that practise mode gives unlimited starting stats"""
+    simulation.toggle_practise()
+    assert simulation.starting_money == 9999
+    assert simulation.starting_health == 9999
+    simulation.toggle_practise()
+    assert simulation.starting_money == GAME_DATA["Easy"]["Game_Stats"]["Starting Money"]
+
+def test_place_tower(simulation):
+    """Test that placing a tower deducts its cost and marks the grid"""
+    success, cost = simulation.tower_manager.place_tower(TurretTower, 3, 3)
+    assert success is True
+    assert simulation.money == GAME_DATA["Easy"]["Game_Stats"]["Starting Money"] - cost
+    assert simulation.map.check_tile((3, 3)) == "tower"
+    assert isinstance(simulation.tower_manager.towers[(3, 3)], TurretTower)
+
+def test_place_tower_on_path_fails(simulation):
+    """Test that towers cannot be placed on the enemy path"""
+    success, message = simulation.tower_manager.place_tower(TurretTower, 4, 3)
+    assert success is False
+    assert message == "Invalid Tower Placement"
+    assert simulation.tower_manager.towers == {}
+
+def test_remove_tower_refunds_half(simulation):
+    """Test that selling a tower refunds half its value"""
+    simulation.tower_manager.place_tower(TurretTower, 3, 3)
+    money = simulation.money
+    simulation.tower_manager.remove_tower(3, 3)
+    assert simulation.money == money + TurretTower(0, 0).value // 2
+    assert simulation.map.check_tile((3, 3)) == "empty space"
+
+def test_run_wave(simulation):
+    """Test that a defended wave runs to completion without a display"""
+    simulation.tower_manager.place_tower(TurretTower, 3, 3)
+    simulation.tower_manager.place_tower(TurretTower, 5, 6)
+    ticks = simulation.run_wave(max_ticks=10000)
+
+    assert ticks > 0
+    assert simulation.tick == ticks
+    assert simulation.wave_manager.wave_number == 1
+    assert simulation.wave_manager.wave_ongoing is False
+    assert simulation.enemy_manager.enemies == []
+    assert not simulation.is_game_over()
+
+def test_undefended_wave_damages_player(simulation):
+    """Test that enemies reaching the end of the path damage the player"""
+    simulation.run_wave(max_ticks=10000)
+    assert simulation.health < GAME_DATA["Easy"]["Game_Stats"]["Starting Health"]
@@ -0,0 +1,40 @@
+import pytest
+import pygame
+from Game.Core.spatial_hash import SpatialHash
+
+class Box:
+    """Minimal object with a hitbox, standing in for an enemy"""
+    def __init__(self, x, y, size=64):
+        self.hitbox = pygame.Rect(x, y, size, size)
+
+@pytest.fixture
+def spatial_hash():
+    """Fixture to create an empty spatial hash with 64px cells"""
+    return SpatialHash(64)
+
+def test_query_finds_only_nearby_objects(spatial_hash):
+    """Test that a query only returns objects in the cells the area overlaps"""
+    near, far = Box(10, 10), Box(640, 640)
+    spatial_hash.rebuild([near, far])
+    assert spatial_hash.query(pygame.Rect(0, 0, 20, 20)) == [near]
+    assert spatial_hash.query(pygame.Rect(650, 650, 5, 5)) == [far]
+
+def test_query_returns_each_object_once_in_insertion_order(spatial_hash):
+    """Test that objects spanning several cells are only returned once, in the order they were added"""
+    boxes = [Box(100, 100), Box(30, 30), Box(60, 60)]
+    spatial_hash.rebuild(boxes)
+    assert spatial_hash.query(pygame.Rect(0, 0, 200, 200)) == boxes
+
+def test_rebuild_clears_previous_objects(spatial_hash):
+    """Test that rebuilding the hash forgets objects from the previous build"""
+    box = Box(0, 0)
+    spatial_hash.rebuild([box])
+    spatial_hash.rebuild([])
+    assert spatial_hash.query(pygame.Rect(0, 0, 64, 64)) == []
+
+def test_query_several_areas(spatial_hash):
+    """Test that querying overlapping areas returns each object once, in insertion order"""
+    boxes = [Box(300, 10), Box(10, 300), Box(300, 300), Box(600, 600)]
+    spatial_hash.rebuild(boxes)
+    column, row = pygame.Rect(280, 0, 100, 720), pygame.Rect(0, 280, 1080, 100)
+    assert spatial_hash.query(column, row) == boxes[:3]
@@ -0,0 +1,55 @@
+import os
+import pytest
+import pygame
+from Constants import sprites
+
+def test_get_scaled_sprite_is_cached():
+    """Test that scaling the same sprite to the same size returns the same surface"""
+    first = sprites.get_scaled_sprite(sprites.FIREBALL_SPRITE, 64, 64)
+    second = sprites.get_scaled_sprite(sprites.FIREBALL_SPRITE, 64, 64)
+    assert first is second
+    assert first.get_size() == (64, 64)
+
+def test_get_scaled_sprite_same_size():
+    """Test that a sprite that is already the right size is used as is"""
+    sprite = pygame.Surface((10, 10))
+    assert sprites.get_scaled_sprite(sprite, 10, 10) is sprite
+    assert sprites.get_scaled_sprite(sprite, 5, 5).get_size() == (5, 5)
+
+def test_assets_load_on_first_use():
+    """Test that a registered asset is only loaded when it is first asked for, then reused"""
+    registry = sprites.AssetRegistry()
+    registry.register("TEST_SPRITE", "Assets/Sprites/Projectiles/bullet.png", (7, 7))
+    assert registry.surfaces == {}
+
+    sprite = registry.get("TEST_SPRITE")
+    assert sprite.get_size() == (7, 7)
+    assert registry.get("TEST_SPRITE") is sprite
+    assert list(registry.load_times) == ["TEST_SPRITE"]
+
+def test_sprites_are_module_attributes():
+    """Test that registered sprites can still be used as attributes of the sprites module"""
+    assert sprites.BOMB_SPRITE is sprites.get_sprite("BOMB_SPRITE")
+    with pytest.raises(AttributeError):
+        sprites.NOT_A_SPRITE
+
+def test_convert_all_matches_display_format():
+    """Test that assets loaded before the display exists are converted to its pixel format"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without opening a window
+    pygame.display.quit()
+    registry = sprites.AssetRegistry()
+    registry.register("TEST_SPRITE", "Assets/Sprites/Projectiles/bullet.png", (7, 7))
+    registry.register("TEST_BACKGROUND", "Assets/Maps/placeholder_map.jpeg", (8, 8), alpha=False)
+    registry.get("TEST_SPRITE")
+    registry.get("TEST_BACKGROUND")
+    assert registry.converted == set()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((16, 16))
+    try:
+        assert registry.convert_all() == 2
+        assert registry.convert_all() == 0
+        assert registry.get("TEST_BACKGROUND").get_bitsize() == screen.get_bitsize()
+        assert registry.get("TEST_SPRITE").get_flags() & pygame.SRCALPHA
+    finally:
+        pygame.display.quit()
@@ -0,0 +1,49 @@
+import pytest
+from benchmarks.run_sweep import expand_grid, overridden, play_game
+from Game.Core.game_data import GAME_DATA
+from Entities.Towers.Turret_Tower import TurretTower
+
+SPAWN_INTERVAL = ("GAME_DATA", "Easy", "Default_Spawn_Interval")
+TURRET_DAMAGE = ("TurretTower", "UPGRADE 0", "Bullet Damage")
+
+@pytest.fixture
+def sweep():
+    """Fixture for a short sweep definition"""
+    return {
+        "Map": "Demonstration_Map",
+        "Difficulty": "Easy",
+        "Build": [("TurretTower", 3, 2, 0), ("TurretTower", 5, 5, 0)],
+        "Parameters": {SPAWN_INTERVAL: [40, 60], TURRET_DAMAGE: [5, 6, 7]},
+        "Seeds": 1,
+        "Max Waves": 2,
+    }
+
+def test_expand_grid(sweep):
+    """Test that every combination of parameter values is generated"""
+    configs = expand_grid(sweep["Parameters"])
+    assert len(configs) == 6
+    assert {SPAWN_INTERVAL: 60, TURRET_DAMAGE: 7} in configs
+
+def test_overridden_restores_values():
+    """Test that overridden parameters are restored after the with block"""
+    original_interval = GAME_DATA["Easy"]["Default_Spawn_Interval"]
+    original_damage = TurretTower.tower_data["UPGRADE 0"]["Bullet Damage"]
+    with overridden({SPAWN_INTERVAL: 5, TURRET_DAMAGE: 99}):
+        assert GAME_DATA["Easy"]["Default_Spawn_Interval"] == 5
+        assert TurretTower(0, 0).bullet_damage == 99
+    assert GAME_DATA["Easy"]["Default_Spawn_Interval"] == original_interval
+    assert TurretTower.tower_data["UPGRADE 0"]["Bullet Damage"] == original_damage
+
+def test_overridden_rejects_unknown_parameter():
+    """Test that a parameter path that doesn't exist is an error"""
+    with pytest.raises(ValueError):
+        with overridden({("GAME_DATA", "Easy", "No Such Value"): 1}):
+            pass
+
+def test_play_game(sweep):
+    """Test that a game is played to the sweep's wave limit, with the same result for the same seed"""
+    result = play_game(sweep, 0, {TURRET_DAMAGE: 6}, seed=3)
+    assert result["won"] is False  # Stopped before the difficulty's last wave, so not won (as in the game)
+    assert result["waves_survived"] == 2
+    assert len(result["money_curve"]) == 2
+    assert play_game(sweep, 0, {TURRET_DAMAGE: 6}, seed=3)["ticks"] == result["ticks"]
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import MagicMock
+from Game.Core.simulation import Simulation
+from Entities.Towers.Turret_Tower import TurretTower
+
+@pytest.fixture
+def simulation():
+    """Fixture to create a simulation with a turret next to the path and three enemies in its range"""
+    simulation = Simulation("Demonstration_Map", practise=True)
+    simulation.enemy_manager.enemy_store = None
+    simulation.tower_manager.place_tower(TurretTower, 3, 3)
+
+    path = simulation.map.enemy_path
+    for distance in (64, 192, 128):
+        simulation.enemy_manager.create_enemy("marshmallow enemy", Path=path, Distance=distance)
+    simulation.enemy_manager.create_enemy("marshmallow enemy", Path=path, Distance=path.length)  # Out of range, at the exit
+
+    enemies = simulation.enemy_manager.enemies
+    enemies[0].health, enemies[1].health, enemies[2].health = 5, 10, 15
+    simulation.enemy_manager.progress_index.rebuild(enemies)
+    return simulation
+
+def get_target(simulation, targeting):
+    """Gets the turret's target using the given targeting policy"""
+    tower = simulation.tower_manager.towers[(3, 3)]
+    tower.targeting = targeting
+    return tower.get_target(simulation.enemy_manager.progress_index)
+
+def test_range_intervals(simulation):
+    """Test that the turret's range covers the stretch of path next to it"""
+    tower = simulation.tower_manager.towers[(3, 3)]
+    intervals = tower.get_range_intervals(simulation.map.enemy_path)
+    assert len(intervals) == 1
+    start, end = intervals[0]
+    assert start == 0 and 192 < end < simulation.map.enemy_path.length
+
+def test_first_and_last(simulation):
+    """Test that First/Last pick the enemies furthest and least far along the path"""
+    enemies = simulation.enemy_manager.enemies
+    assert get_target(simulation, "First") is enemies[1]
+    assert get_target(simulation, "Last") is enemies[0]
+
+def test_strongest_and_weakest(simulation):
+    """Test that Strongest/Weakest pick by remaining health"""
+    enemies = simulation.enemy_manager.enemies
+    assert get_target(simulation, "Strongest") is enemies[2]
+    assert get_target(simulation, "Weakest") is enemies[0]
+
+def test_closest(simulation):
+    """Test that Closest picks the enemy nearest to the tower"""
+    tower = simulation.tower_manager.towers[(3, 3)]
+    closest = min(simulation.enemy_manager.enemies[:3], key=lambda enemy: abs(enemy.grid_position[1] - tower.y_grid_pos))
+    assert get_target(simulation, "Closest") is closest
+
+def test_cycle_targeting(simulation):
+    """Test that cycling the targeting policy wraps around"""
+    tower = simulation.tower_manager.towers[(3, 3)]
+    for _ in TurretTower.TARGETING_POLICIES:
+        tower.cycle_targeting()
+    assert tower.targeting == "First"
+
+def test_progress_index_follows_overtaking_and_removal(simulation):
+    """Test that updating the progress index re-orders enemies that overtook others and drops removed ones"""
+    enemy_manager = simulation.enemy_manager
+    enemies = enemy_manager.enemies
+    distances, indexed = enemy_manager.progress_index.paths[simulation.map.enemy_path]
+    assert indexed == [enemies[0], enemies[2], enemies[1], enemies[3]]
+
+    enemies[0].distance = 160  # Overtakes the enemy at 128
+    enemies[3].remove_self(simulation)
+    enemy_manager.progress_index.update()
+    distances, indexed = enemy_manager.progress_index.paths[simulation.map.enemy_path]
+    assert indexed == [enemies[2], enemies[0], enemies[1]]
+    assert distances == [128, 160, 192]
+
+def test_target_is_kept_until_it_leaves_range(simulation):
+    """Test that a tower keeps shooting its target while it is in range, even when the policy would pick another"""
+    tower = simulation.tower_manager.towers[(3, 3)]
+    enemies = simulation.enemy_manager.enemies
+    tower.targeting = "Weakest"
+    tower.update(simulation.enemy_manager.progress_index, MagicMock())
+    assert tower.target is enemies[0]
+
+    enemies[1].health = 1  # Now the weakest, but the tower sticks with its target
+    tower.update(simulation.enemy_manager.progress_index, MagicMock())
+    assert tower.target is enemies[0]
+
+    enemies[0].grid_position = (9, 9)  # Leaves the range
+    tower.update(simulation.enemy_manager.progress_index, MagicMock())
+    assert tower.target is enemies[1]
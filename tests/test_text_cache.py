@@ -0,0 +1,37 @@
+import pytest
+import pygame
+from UI.text_cache import TextCache
+
+@pytest.fixture
+def font():
+    """Fixture to create a font"""
+    pygame.font.init()
+    return pygame.font.Font(None, 30)
+
+def test_repeated_text_is_rendered_once(font):
+    """Test that rendering the same text again reuses the cached surface"""
+    cache = TextCache()
+    surface = cache.render(font, "Money: 100", (255, 255, 255))
+    assert cache.render(font, "Money: 100", (255, 255, 255)) is surface
+    assert cache.render(font, "Money: 100", (255, 0, 0)) is not surface  # Different colour, different surface
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_least_recently_used_text_is_dropped(font):
+    """Test that the cache drops the least recently used surface when it is full"""
+    cache = TextCache(max_entries=2)
+    first = cache.render(font, "first", (255, 255, 255))
+    cache.render(font, "second", (255, 255, 255))
+    cache.render(font, "first", (255, 255, 255))  # Use "first" again, so "second" is now the oldest
+    cache.render(font, "third", (255, 255, 255))
+
+    assert len(cache.surfaces) == 2
+    assert cache.render(font, "first", (255, 255, 255)) is first
+    assert (font, "second", (255, 255, 255), True) not in cache.surfaces
+
+def test_cache_memory_is_bounded(font):
+    """Test that the cached surfaces never take up more than the byte limit"""
+    cache = TextCache(max_bytes=20000)
+    for number in range(100):
+        cache.render(font, f"Health: {number}", (255, 255, 255))
+        assert cache.total_bytes <= 20000
+    assert cache.total_bytes == sum(cache.get_size(surface) for surface in cache.surfaces.values())
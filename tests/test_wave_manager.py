@@ -1,7 +1,9 @@
 import pytest
+import random
 from unittest.mock import MagicMock, patch
 from Game.Managers.wave_manager import WaveManager
 from Game.Core.game_data import GAME_DATA
+from Game.Core.wave_schedule import WaveSchedule
 
 
 
@@ -27,51 +29,88 @@ def test_wave_manager_initialization(wave_manager):
     """Test initialization of the WaveManager."""
     assert wave_manager.difficulty == "Normal"
     assert wave_manager.wave_number == 0
-    assert wave_manager.spawn_interval == GAME_DATA["Normal"]["Default_Spawn_Interval"]
-    assert wave_manager.spawn_cooldown == 0
     assert wave_manager.wave_ongoing is False
-    assert wave_manager.enemy_spawn_queue == []
+    assert wave_manager.next_spawn == 0
+    assert len(wave_manager.spawn_ticks) == 0
 
 
-def test_create_enemy_spawn_queue(wave_manager):
-    """Test the creation of the enemy spawn queue."""
-    spawn_wave = {
-        "marshmallow enemy": 3,
-        "dark_chocolate enemy": 2
-    }
-    wave_manager.create_enemy_spawn_queue(spawn_wave)
+def test_schedule_enemy_counts(wave_manager):
+    """Test that the schedule spawns the accumulated number of each enemy in each wave."""
+    schedule = wave_manager.get_schedule()
+    for enemy_name, count in GAME_DATA["Normal"]["Default_Spawn"].items():
+        increment = GAME_DATA["Normal"]["Increment"][enemy_name]
+        assert schedule.get_enemy_counts(1)[enemy_name] == count
+        assert schedule.get_enemy_counts(3)[enemy_name] == int(count + 2 * increment)
 
-    assert len(wave_manager.enemy_spawn_queue) == 5
-    assert wave_manager.enemy_spawn_queue.count("marshmallow enemy") == 3
-    assert wave_manager.enemy_spawn_queue.count("dark_chocolate enemy") == 2
 
+def test_schedule_covers_every_wave(wave_manager):
+    """Test that every wave of the difficulty is scheduled up front, and later waves on demand."""
+    schedule = wave_manager.get_schedule()
+    assert len(schedule.ticks) == GAME_DATA["Normal"]["Last Wave"]
+    schedule.get_spawns(GAME_DATA["Normal"]["Last Wave"] + 2)
+    assert len(schedule.ticks) == GAME_DATA["Normal"]["Last Wave"] + 2
 
-def test_initialise_next_spawn_wave(wave_manager):
-    """Test the initialization of the next spawn wave."""
-    wave_manager.wave_number = 2  # Simulate wave 2
-    wave_manager.initialise_next_spawn_wave()
 
-    assert wave_manager.accumulated_spawns["marshmallow enemy"] == GAME_DATA["Normal"]["Default_Spawn"]["marshmallow enemy"] + GAME_DATA["Normal"]["Increment"]["marshmallow enemy"]
-    assert wave_manager.accumulated_spawns["dark_chocolate enemy"] == GAME_DATA["Normal"]["Default_Spawn"]["dark_chocolate enemy"] + GAME_DATA["Normal"]["Increment"]["dark_chocolate enemy"]
+def test_schedule_spawn_ticks(wave_manager):
+    """Test that enemies are scheduled one spawn interval apart, after the previous wave's interval."""
+    schedule = wave_manager.get_schedule()
+    interval = GAME_DATA["Normal"]["Default_Spawn_Interval"] - 1
+    assert schedule.get_spawn_interval(1) == interval
+    assert [tick for tick, _ in schedule.get_spawns(1)][:3] == [0, interval + 1, 2 * (interval + 1)]
+    assert schedule.get_spawns(2)[0][0] == interval
+
+
+def test_schedule_is_read_only(wave_manager):
+    """Test that a wave's spawns can't be changed through the schedule."""
+    ticks, enemy_ids = wave_manager.get_schedule().get_wave(1)
+    with pytest.raises(TypeError):
+        ticks[0] = 5
+    with pytest.raises(TypeError):
+        enemy_ids[0] = 1
+
+
+def test_schedule_is_reproducible():
+    """Test that schedules shuffled by generators with the same seed are the same."""
+    first = WaveSchedule("Hard", random.Random(4))
+    second = WaveSchedule("Hard", random.Random(4))
+    assert all(first.get_spawns(wave) == second.get_spawns(wave) for wave in range(1, 36))
 
 
 def test_start_wave(wave_manager):
     """Test the start wave functionality."""
+    wave_manager.wave_number = 1
     wave_manager.start_wave()
 
     assert wave_manager.wave_ongoing is True
-    assert wave_manager.enemy_spawn_queue != []
+    assert len(wave_manager.spawn_ticks) > 0
 
 
 def test_spawn_enemies(wave_manager, mock_game_state):
     """Test spawning of enemies during a wave."""
-    wave_manager.create_enemy_spawn_queue({"marshmallow enemy": 2})
+    wave_manager.next_wave()
+    first_enemy = wave_manager.get_schedule().get_spawns(1)[0][1]
+    interval = wave_manager.get_schedule().get_spawn_interval(1)
 
-    wave_manager.spawn_enemies()
+    wave_manager.update()
+    mock_game_state.enemy_manager.create_enemy.assert_called_once_with(first_enemy)
 
-    mock_game_state.enemy_manager.create_enemy.assert_called_once_with("marshmallow enemy")
+    for _ in range(interval):
+        wave_manager.update()
+    assert mock_game_state.enemy_manager.create_enemy.call_count == 1
+    wave_manager.update()
+    assert mock_game_state.enemy_manager.create_enemy.call_count == 2
 
-    assert wave_manager.spawn_cooldown == wave_manager.spawn_interval
+
+def test_wave_ends_after_last_spawn(wave_manager, mock_game_state):
+    """Test that a wave ends once every enemy has spawned and been killed."""
+    wave_manager.next_wave()
+    for _ in range(wave_manager.spawn_ticks[-1] + 1):
+        wave_manager.update()
+    assert mock_game_state.enemy_manager.create_enemy.call_count == len(wave_manager.spawn_ticks)
+    assert wave_manager.wave_ongoing is True
+
+    wave_manager.update()  # No enemies are left alive (the enemy manager is mocked)
+    assert wave_manager.wave_ongoing is False
 
 
 def test_next_wave(wave_manager):
@@ -80,21 +119,40 @@ def test_next_wave(wave_manager):
     wave_manager.next_wave()
 
     assert wave_manager.wave_number == 1
-    assert wave_manager.spawn_interval == GAME_DATA["Normal"]["Default_Spawn_Interval"] - 1
     assert wave_manager.wave_ongoing is True
 
 def test_reset_waves(wave_manager):
     """Test the reset wave functionality."""
-    wave_manager.wave_number = 3
-    wave_manager.spawn_cooldown = 5
-    wave_manager.spawn_interval = 10
-    wave_manager.accumulated_spawns = {"marshmallow enemy": 5}
-    wave_manager.enemy_spawn_queue = ["marshmallow enemy", "marshmallow enemy"]
+    wave_manager.next_wave()
+    wave_manager.update()
 
     wave_manager.reset_waves()
 
     assert wave_manager.wave_number == 0
-    assert wave_manager.spawn_cooldown == 0
-    assert wave_manager.spawn_interval == GAME_DATA["Normal"]["Default_Spawn_Interval"]
-    assert wave_manager.enemy_spawn_queue == []
-    assert wave_manager.accumulated_spawns == GAME_DATA["Normal"]["Default_Spawn"]
+    assert wave_manager.wave_ongoing is False
+    assert wave_manager.schedule is None
+    assert wave_manager.next_spawn == 0
+    assert len(wave_manager.spawn_ticks) == 0
+
+
+def test_changing_difficulty_reschedules(wave_manager):
+    """Test that the schedule is worked out again when the difficulty changes."""
+    wave_manager.get_schedule()
+    wave_manager.difficulty = "Hard"
+    assert wave_manager.get_schedule().difficulty == "Hard"
+    assert len(wave_manager.get_schedule().ticks) == GAME_DATA["Hard"]["Last Wave"]
+
+
+def test_skip_to_wave_matches_playing_waves(wave_manager, mock_game_state):
+    """Test that skipping to a wave starts the same wave as starting every earlier wave."""
+    played = WaveManager(mock_game_state)
+    for _ in range(11):
+        played.next_wave()
+        played.wave_ongoing = False  # End the wave straight away
+
+    wave_manager.skip_to_wave(12)
+    wave_manager.next_wave()
+    played.next_wave()
+
+    assert wave_manager.wave_number == played.wave_number == 12
+    assert sorted(wave_manager.spawn_enemy_ids) == sorted(played.spawn_enemy_ids)